@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+# --- arama_dizini.py ---
+# Öğrenci listesinde anlık arama/filtre için önceden kurulan dizinler.
+#   - Öğrenci No -> satırlar (hash): tam numara tek sözlük erişimiyle bulunur.
+#   - Sıralı numara metinleri: yazılmakta olan numaranın önekine uyanlar ikili aramayla bulunur.
+#   - Ad Soyad'ın Türkçe küçük harfli hâli üzerinde:
+#       * kelime önekleri -> satırlar (1-2 harflik sorgular kelime başıyla eşleşir)
+#       * trigram -> satırlar (3+ harflik sorgular ad içinde herhangi bir yerde geçebilir;
+#         trigram kesişiminden çıkan adaylar alt dize kontrolüyle doğrulanır)
+# Her tuş vuruşunda tablo taranmaz. Veri değişince de dizin yeniden kurulmaz:
+# sadece değişen satır çıkarılıp yeniden eklenir (guncelle).
+
+from bisect import bisect_left, insort
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+
+import pandas as pd
+
+from modules import turkce, veri_semasi
+
+AD_SUTUNU = "Ad Soyad"
+DIZINLI_SUTUNLAR = (veri_semasi.NUMARA_SUTUNU, AD_SUTUNU) # Bu sütunlar değişince dizin güncellenmeli
+KISA_ONEK = 2 # Bu uzunluğa kadar olan sorgu kelimeleri kelime öneki dizininden aranır
+
+_BOS: FrozenSet[int] = frozenset()
+
+
+def _numara(deger: Any) -> Optional[int]:
+    if deger is None or pd.isna(deger):
+        return None
+    try:
+        return int(deger)
+    except (TypeError, ValueError):
+        return None
+
+
+def _ad(deger: Any) -> str:
+    if deger is None or pd.isna(deger):
+        return ""
+    return turkce.kucuk_harf(deger)
+
+
+def _trigramlar(metin: str) -> Set[str]:
+    return {metin[i:i + 3] for i in range(len(metin) - 2)}
+
+
+def _onekler(metin: str) -> Set[str]:
+    return {kelime[:n] for kelime in metin.split() for n in range(1, KISA_ONEK + 1)}
+
+
+class AramaDizini:
+    """
+    Bir sınıfın Öğrenci No ve Ad Soyad arama dizini. Satırlar df index'iyle tutulur.
+
+    Sorgu boşlukla ayrılmış kelimelerden oluşur; bir satırın eşleşmesi için her kelimenin
+    eşleşmesi gerekir. Sadece rakamdan oluşan kelimeler numaranın başıyla, diğerleri adla eşleşir.
+    """
+
+    def __init__(self) -> None:
+        self._satirlar: Dict[int, Tuple[Optional[int], str]] = {} # index -> (numara, küçük harfli ad)
+        self._numaralar: Dict[int, Set[int]] = {}                 # numara -> index'ler
+        self._numara_metinleri: List[Tuple[str, int]] = []        # sıralı (numara metni, index)
+        self._onek_dizini: Dict[str, Set[int]] = {}
+        self._trigram_dizini: Dict[str, Set[int]] = {}
+
+    @classmethod
+    def olustur(cls, df: pd.DataFrame) -> "AramaDizini":
+        """DataFrame'in tüm satırları için dizini kurar (sınıf yüklenirken bir kez)."""
+        dizin = cls()
+        numaralar = df[veri_semasi.NUMARA_SUTUNU].tolist() if veri_semasi.NUMARA_SUTUNU in df.columns else [None] * len(df)
+        adlar = df[AD_SUTUNU].tolist() if AD_SUTUNU in df.columns else [None] * len(df)
+        for index, numara, ad in zip(df.index.tolist(), numaralar, adlar):
+            dizin._ekle(index, _numara(numara), _ad(ad), sirali=False)
+        dizin._numara_metinleri.sort()
+        return dizin
+
+    def __len__(self) -> int:
+        return len(self._satirlar)
+
+    # --- Güncelleme ---
+    def guncelle(self, index: int, numara: Any, ad: Any) -> None:
+        """Bir satırın numarası/adı değiştiğinde sadece o satırı yeniden dizinler (yeni satırı ekler)."""
+        yeni = (_numara(numara), _ad(ad))
+        if self._satirlar.get(index) == yeni:
+            return
+        self.kaldir(index)
+        self._ekle(index, *yeni)
+
+    def kaldir(self, index: int) -> None:
+        """Satırı dizinden çıkarır (yoksa bir şey yapmaz)."""
+        eski = self._satirlar.pop(index, None)
+        if eski is None:
+            return
+        numara, ad = eski
+        if numara is not None:
+            self._cikar(self._numaralar, numara, index)
+            konum = bisect_left(self._numara_metinleri, (str(numara), index))
+            if konum < len(self._numara_metinleri) and self._numara_metinleri[konum] == (str(numara), index):
+                del self._numara_metinleri[konum]
+        for onek in _onekler(ad):
+            self._cikar(self._onek_dizini, onek, index)
+        for trigram in _trigramlar(ad):
+            self._cikar(self._trigram_dizini, trigram, index)
+
+    def _ekle(self, index: int, numara: Optional[int], ad: str, sirali: bool = True) -> None:
+        self._satirlar[index] = (numara, ad)
+        if numara is not None:
+            self._numaralar.setdefault(numara, set()).add(index)
+            if sirali:
+                insort(self._numara_metinleri, (str(numara), index))
+            else: # Toplu kurulumda sonda bir kez sıralanır
+                self._numara_metinleri.append((str(numara), index))
+        for onek in _onekler(ad):
+            self._onek_dizini.setdefault(onek, set()).add(index)
+        for trigram in _trigramlar(ad):
+            self._trigram_dizini.setdefault(trigram, set()).add(index)
+
+    @staticmethod
+    def _cikar(dizin: Dict[Any, Set[int]], anahtar: Any, index: int) -> None:
+        kume = dizin.get(anahtar)
+        if kume is not None:
+            kume.discard(index)
+            if not kume:
+                del dizin[anahtar]
+
+    # --- Arama ---
+    def numara_ile(self, numara: Any) -> Set[int]:
+        """Öğrenci No'su tam olarak verilen değer olan satırlar (birleşik tablolarda birden fazla olabilir)."""
+        numara = _numara(numara)
+        return set(self._numaralar.get(numara, _BOS)) if numara is not None else set()
+
+    def ara(self, sorgu: str) -> Optional[Set[int]]:
+        """
+        Sorguya uyan satırları döndürür.
+
+        Returns:
+            Optional[Set[int]]: Eşleşen df index'leri; sorgu boşsa None (filtre yok).
+        """
+        kelimeler = turkce.kucuk_harf(sorgu).split()
+        if not kelimeler:
+            return None
+        sonuc: Optional[Set[int]] = None
+        for kelime in sorted(set(kelimeler), key=len, reverse=True): # Uzun (seçici) kelimeler önce
+            eslesen = self._kelime_ara(kelime)
+            sonuc = set(eslesen) if sonuc is None else sonuc & eslesen
+            if not sonuc:
+                return set()
+        return sonuc
+
+    def _kelime_ara(self, kelime: str) -> Set[int]:
+        if kelime.isdigit():
+            return self._numara_onekiyle(kelime)
+        if len(kelime) <= KISA_ONEK:
+            return self._onek_dizini.get(kelime, _BOS)
+        kumeler = sorted((self._trigram_dizini.get(trigram, _BOS) for trigram in _trigramlar(kelime)), key=len)
+        adaylar = kumeler[0].intersection(*kumeler[1:])
+        if len(kelime) == 3:
+            return adaylar
+        # Trigramların hepsinin geçmesi kelimenin bitişik geçtiğini garanti etmez; doğrula
+        return {index for index in adaylar if kelime in self._satirlar[index][1]}
+
+    def _numara_onekiyle(self, onek: str) -> Set[int]:
+        """Numarası verilen rakamlarla başlayan satırlar (sıralı listede ikili arama)."""
+        sonuc: Set[int] = set()
+        metinler = self._numara_metinleri
+        konum = bisect_left(metinler, (onek,))
+        while konum < len(metinler) and metinler[konum][0].startswith(onek):
+            sonuc.add(metinler[konum][1])
+            konum += 1
+        return sonuc
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+# --- arkaplan.py ---
+# Uzun süren işlemleri (dosya yükleme vb.) Tk ana döngüsünü kilitlemeden
+# ayrı bir thread'de çalıştırmak için yardımcı sınıf.
+
+import queue
+import threading
+import traceback
+from typing import Any, Callable, Optional
+
+# Hedef fonksiyonun imzası: hedef(ilerleme_bildir, iptal_olayi) -> sonuc
+# ilerleme_bildir(oran: 0.0-1.0, mesaj: str) worker thread'inden güvenle çağrılabilir.
+IlerlemeFonksiyonu = Callable[[float, str], None]
+
+
+class ArkaplanGorevi:
+    """
+    Bir fonksiyonu worker thread'de çalıştırır ve sonucu Tk'ya `root.after` yoklamasıyla aktarır.
+
+    Tk widget'larına sadece ana thread'den dokunulur: worker sadece kuyruğa yazar,
+    geri çağrılar (ilerleme/bitti/hata/iptal) her zaman ana thread'de çalışır.
+    İptal işbirlikçidir: hedef fonksiyon `iptal_olayi`nı kontrol ederek erken çıkabilir;
+    çıkamazsa sonucu yok sayılır.
+    """
+
+    def __init__(self, root, hedef: Callable[[IlerlemeFonksiyonu, threading.Event], Any],
+                 bitti: Optional[Callable[[Any], None]] = None,
+                 hata: Optional[Callable[[BaseException], None]] = None,
+                 ilerleme: Optional[Callable[[float, str], None]] = None,
+                 iptal_edildi: Optional[Callable[[], None]] = None,
+                 yoklama_araligi_ms: int = 100) -> None:
+        self.root = root
+        self.hedef = hedef
+        self.bitti_cb = bitti
+        self.hata_cb = hata
+        self.ilerleme_cb = ilerleme
+        self.iptal_cb = iptal_edildi
+        self.yoklama_araligi_ms = yoklama_araligi_ms
+
+        self.iptal_olayi = threading.Event()
+        self._kuyruk: "queue.Queue[tuple]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self.calisiyor = False
+
+    def baslat(self) -> "ArkaplanGorevi":
+        """Worker thread'i başlatır ve kuyruğu yoklamaya başlar."""
+        self.calisiyor = True
+        self._thread = threading.Thread(target=self._calistir, daemon=True)
+        self._thread.start()
+        self.root.after(self.yoklama_araligi_ms, self._yokla)
+        return self
+
+    def iptal_et(self) -> None:
+        """Görevin iptal edilmesini ister (sonuç artık kullanılmaz)."""
+        self.iptal_olayi.set()
+
+    def _ilerleme_bildir(self, oran: float, mesaj: str = "") -> None:
+        self._kuyruk.put(("ilerleme", (oran, mesaj)))
+
+    def _calistir(self) -> None:
+        try:
+            sonuc = self.hedef(self._ilerleme_bildir, self.iptal_olayi)
+            self._kuyruk.put(("bitti", sonuc))
+        except BaseException as e: # Worker'daki hiçbir hata sessizce kaybolmasın
+            if not self.iptal_olayi.is_set():
+                traceback.print_exc()
+            self._kuyruk.put(("hata", e))
+
+    def _yokla(self) -> None:
+        son_ilerleme = None
+        try:
+            while True:
+                tur, veri = self._kuyruk.get_nowait()
+                if tur == "ilerleme":
+                    son_ilerleme = veri # Sadece en günceli gösterilir
+                    continue
+                self.calisiyor = False
+                if self.iptal_olayi.is_set():
+                    if self.iptal_cb: self.iptal_cb()
+                elif tur == "bitti":
+                    if self.bitti_cb: self.bitti_cb(veri)
+                elif self.hata_cb:
+                    self.hata_cb(veri)
+                return
+        except queue.Empty:
+            pass
+
+        if son_ilerleme is not None and self.ilerleme_cb and not self.iptal_olayi.is_set():
+            self.ilerleme_cb(*son_ilerleme)
+        self.root.after(self.yoklama_araligi_ms, self._yokla)
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+# --- artimli_hesaplama.py ---
+# Tüm sınıfı yeniden hesaplamak yerine yalnızca değişen satırları hesaplayan yardımcılar.
+
+import pandas as pd
+from typing import Dict, Any, Iterable, Optional, Set
+
+from modules import hesaplamalar, olcum, veri_semasi
+
+# hesaplamalar.tum_veriyi_hesapla'nın ürettiği ve satır bazında güncellenecek sütunlar
+HESAPLAMA_SUTUNLARI = ["Hesaplanan Performans", "Ortalama", "SONUÇ"]
+
+
+@olcum.olculen("hesapla")
+def satirlari_hesapla(df: pd.DataFrame, ayarlar: Dict[str, Any], ders_adi: str,
+                      indeksler: Optional[Iterable[int]] = None) -> Set[int]:
+    """
+    Sadece verilen satırlar için hesaplamaları yapar ve sonuçları DataFrame'e yerinde yazar.
+
+    Args:
+        df (pd.DataFrame): Öğrenci verileri (yerinde güncellenir).
+        ayarlar (dict): Uygulama ayarları.
+        ders_adi (str): Hesaplaması yapılacak ders.
+        indeksler (Iterable[int], optional): Yeniden hesaplanacak satırların df index'leri.
+                                             None verilirse tüm satırlar hesaplanır.
+
+    Returns:
+        Set[int]: Yeniden hesaplanan (kirli) satırların index'leri.
+
+    Raises:
+        hesaplamalar.AyarHatasi: Ayarlar hesaplama için uygun değilse.
+    """
+    if df.empty:
+        return set()
+
+    if indeksler is None:
+        hedef = df.index
+    else:
+        # df'de olmayan index'leri at, df sırasını koru
+        hedef = df.index[df.index.isin(list(indeksler))]
+    if len(hedef) == 0:
+        return set()
+
+    # Hesaplama fonksiyonu satır bazında çalıştığı için alt küme üzerinde çağırmak yeterli.
+    # Kompakt tipler (UInt8 toplamları taşabilir) hesaplama için genişletilir.
+    sonuc = hesaplamalar.tum_veriyi_hesapla(veri_semasi.hesaplama_icin_genislet(df.loc[hedef]), ayarlar, ders_adi)
+
+    for sutun in HESAPLAMA_SUTUNLARI:
+        if sutun not in sonuc.columns:
+            continue
+        # Sütun ilk kez oluşuyorsa diğer satırlar boş kalır; tipler float32/category olarak korunur
+        veri_semasi.sutuna_yaz(df, hedef, sutun, sonuc.loc[hedef, sutun].values)
+
+    return set(int(i) for i in hedef)
@@ -0,0 +1,5 @@
+# -*- coding: utf-8 -*-
+# --- benchmarks ---
+# Performans ölçüm betikleri. Proje ana dizininden (modules klasörünün bulunduğu yer) çalıştırılır, örn:
+#   python -m modules.benchmarks.olcum_paketi --boyutlar 30 1000 10000
+#   python -m modules.benchmarks.ayristirici_karsilastirma dosya.xlsx
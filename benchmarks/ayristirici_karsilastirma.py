@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+# --- benchmarks/ayristirici_karsilastirma.py ---
+# veri_yukle_excel'in iki okuma motorunu ("pandas" ve "akis") aynı dosyalar
+# üzerinde süre ve en yüksek bellek kullanımı açısından karşılaştırır.
+#
+# Kullanım:
+#   python -m modules.benchmarks.ayristirici_karsilastirma dosya1.xlsx [dosya2.xlsx ...] [--tekrar 3]
+#   python -m modules.benchmarks.ayristirici_karsilastirma --boyut 10000   (örnek dosya üretilir)
+
+import argparse
+import contextlib
+import io
+import time
+import tracemalloc
+from typing import Dict, List
+
+from modules import veri_isleme
+from modules.benchmarks import ornek_veri
+
+MOTORLAR = ["pandas", "akis"]
+
+
+def _sessiz_yukle(dosya_yolu: str, motor: str, satir_atla: int):
+    """Önbelleği kullanmadan yükler; konsol çıktısı ölçüme karışmasın diye bastırılır."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return veri_isleme.veri_yukle_excel(dosya_yolu, satir_atla=satir_atla, onbellek_kullan=False, motor=motor)
+
+
+def olc(dosya_yolu: str, motor: str, satir_atla: int = 15, tekrar: int = 3) -> Dict[str, float]:
+    """Bir motoru ölçer: en iyi süre (sn) ve en yüksek Python bellek kullanımı (MB)."""
+    sureler: List[float] = []
+    ogrenci_sayisi = 0
+    for _ in range(tekrar):
+        baslangic = time.perf_counter()
+        df, _ = _sessiz_yukle(dosya_yolu, motor, satir_atla)
+        sureler.append(time.perf_counter() - baslangic)
+        ogrenci_sayisi = len(df) if df is not None else 0
+
+    # Bellek ayrı bir çalıştırmada ölçülür (tracemalloc süreyi yavaşlatır)
+    tracemalloc.start()
+    _sessiz_yukle(dosya_yolu, motor, satir_atla)
+    _, en_yuksek = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"sure_sn": min(sureler), "bellek_mb": en_yuksek / (1024 * 1024), "ogrenci": ogrenci_sayisi}
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Excel okuma motorlarını karşılaştırır.")
+    parser.add_argument("dosyalar", nargs="*", help="e-Okul .xlsx dosyaları")
+    parser.add_argument("--boyut", type=int, nargs="+", default=[],
+                        help="Bu öğrenci sayılarında örnek dosya üret ve onları da ölç.")
+    parser.add_argument("--satir-atla", type=int, default=ornek_veri.BASLIK_ONCESI_SATIR)
+    parser.add_argument("--tekrar", type=int, default=3)
+    args = parser.parse_args(argv)
+    args.dosyalar += [ornek_veri.ornek_dosya(boyut) for boyut in args.boyut]
+    if not args.dosyalar:
+        parser.error("En az bir dosya veya --boyut verilmeli.")
+
+    print(f"{'Dosya':30} {'Motor':8} {'Öğrenci':>8} {'Süre (sn)':>10} {'Bellek (MB)':>12}")
+    for dosya in args.dosyalar:
+        for motor in MOTORLAR:
+            sonuc = olc(dosya, motor, args.satir_atla, args.tekrar)
+            print(f"{dosya[-30:]:30} {motor:8} {sonuc['ogrenci']:>8} {sonuc['sure_sn']:>10.3f} {sonuc['bellek_mb']:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
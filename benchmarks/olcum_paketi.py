@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+# --- benchmarks/olcum_paketi.py ---
+# Uygulamanın ana aşamalarının öğrenci sayısıyla nasıl ölçeklendiğini ölçer:
+#   veri_yukle_excel, hesaplamalar.tum_veriyi_hesapla, arama dizini ve (gizli bir Tk penceresinde)
+#   treeview_doldur, ogrenci_secildi, veriyi_disa_aktar.
+# Her aşama için en iyi süre ve en yüksek Python bellek kullanımı kaydedilir. Sonuçlar
+# sonuclar/olcumler.jsonl dosyasına eklenir ve önceki sürümün sonuçlarıyla karşılaştırılır.
+#
+# Kullanım:
+#   python -m modules.benchmarks.olcum_paketi [--boyutlar 30 1000 10000 50000] [--tekrar 3] [--kaydetme]
+
+import argparse
+import contextlib
+import copy
+import datetime
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+from unittest import mock
+
+import pandas as pd
+
+from modules import veri_isleme, hesaplamalar, artimli_hesaplama, veri_semasi, arama_dizini
+from modules.benchmarks import ornek_veri
+
+VARSAYILAN_BOYUTLAR = [30, 1000, 10000, 50000]
+SONUC_DOSYASI = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sonuclar", "olcumler.jsonl")
+YAVASLAMA_ESIGI = 0.20 # Önceki sürüme göre %20'den fazla yavaşlama işaretlenir
+
+OLCUM_DERSI = "Matematik"
+OLCUM_AYARLARI: Dict[str, Any] = {
+    "ders_ayarlari": {OLCUM_DERSI: {"kriterler": [{"ad": "Ödev", "agirlik": 0.4},
+                                                  {"ad": "Derse Katılım", "agirlik": 0.3},
+                                                  {"ad": "Sunum", "agirlik": 0.3}]}},
+    "gui_ayarlari": dict(veri_isleme.VARSAYILAN_AYARLAR["gui_ayarlari"]),
+    "genel_ayarlar": dict(veri_isleme.VARSAYILAN_AYARLAR["genel_ayarlar"]),
+}
+# Arama ölçümünde harf harf yazılan sorgular
+ARAMA_TUSLARI = [metin[:n] for metin in ("ayşe yıl", "1234") for n in range(1, len(metin) + 1)]
+
+
+# --- Ölçüm Yardımcıları ---
+def _olc(calistir: Callable[[Any], Any], hazirla: Callable[[], Any] = lambda: None,
+         tekrar: int = 3) -> Dict[str, float]:
+    """
+    calistir(hazirla()) çağrısını ölçer. Hazırlık süreye dahil edilmez.
+    Konsol çıktısı bastırılır; bellek tracemalloc yavaşlatmasın diye ayrı bir çalıştırmada ölçülür.
+
+    Returns:
+        Dict[str, float]: {"sure_sn": en iyi süre, "bellek_mb": en yüksek Python bellek kullanımı}
+    """
+    sureler: List[float] = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(tekrar):
+            girdi = hazirla()
+            baslangic = time.perf_counter()
+            calistir(girdi)
+            sureler.append(time.perf_counter() - baslangic)
+
+        girdi = hazirla()
+        tracemalloc.start()
+        try:
+            calistir(girdi)
+            _, en_yuksek = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return {"sure_sn": min(sureler), "bellek_mb": en_yuksek / (1024 * 1024)}
+
+
+def _kriterleri_ekle(df: pd.DataFrame, tohum: int = 0) -> pd.DataFrame:
+    """Ölçüm dersinin kriter notlarını (arayüzde girilmiş gibi) DataFrame'e ekler."""
+    rastgele = random.Random(tohum)
+    for kriter in OLCUM_AYARLARI["ders_ayarlari"][OLCUM_DERSI]["kriterler"]:
+        df[kriter["ad"]] = [rastgele.randint(0, 100) for _ in range(len(df))]
+    return df
+
+
+# --- Aşamalar ---
+def veri_olc(dosya_yolu: str, tekrar: int) -> Dict[str, Dict[str, float]]:
+    """Tk gerektirmeyen aşamalar: Excel okuma ve not hesaplama."""
+    sonuclar = {}
+    for motor in ("akis", "pandas"):
+        sonuclar[f"veri_yukle_excel[{motor}]"] = _olc(
+            lambda _: veri_isleme.veri_yukle_excel(dosya_yolu, satir_atla=ornek_veri.BASLIK_ONCESI_SATIR,
+                                                   onbellek_kullan=False, motor=motor),
+            tekrar=tekrar)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        df, _ = veri_isleme.veri_yukle_excel(dosya_yolu, satir_atla=ornek_veri.BASLIK_ONCESI_SATIR)
+    df = _kriterleri_ekle(df)
+    sonuclar["tum_veriyi_hesapla"] = _olc(
+        lambda girdi: hesaplamalar.tum_veriyi_hesapla(girdi, OLCUM_AYARLARI, OLCUM_DERSI),
+        hazirla=lambda: veri_semasi.hesaplama_icin_genislet(df), tekrar=tekrar)
+
+    sonuclar["arama_dizini_olustur"] = _olc(lambda _: arama_dizini.AramaDizini.olustur(df), tekrar=tekrar)
+    dizin = arama_dizini.AramaDizini.olustur(df)
+    def _yaz(_):
+        # Bir ad ve bir numara harf harf yazılıyormuş gibi her tuşta arama
+        for sorgu in ARAMA_TUSLARI:
+            dizin.ara(sorgu)
+    olcum = _olc(_yaz, tekrar=tekrar)
+    olcum["sure_sn"] /= len(ARAMA_TUSLARI) # Tuş başına süre
+    sonuclar["arama"] = olcum
+    return sonuclar
+
+
+def arayuz_olc(dosya_yolu: str, tekrar: int) -> Dict[str, Dict[str, float]]:
+    """
+    Tk aşamaları: gizli (withdraw edilmiş) bir pencerede gerçek uygulama nesnesi üzerinde ölçülür.
+    Diyalog kutuları (messagebox/filedialog) ölçüm sırasında devre dışı bırakılır.
+    Ekran (DISPLAY) yoksa boş sözlük döndürür.
+    """
+    import tkinter as tk
+    from modules import gui
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"Uyarı: Tk başlatılamadı, arayüz aşamaları atlanıyor ({e}).")
+        return {}
+    root.withdraw()
+
+    sonuclar: Dict[str, Dict[str, float]] = {}
+    cikti_klasoru = tempfile.mkdtemp(prefix="olcum_disa_aktar_")
+    cikti_yolu = os.path.join(cikti_klasoru, "olcum.xlsx")
+    try:
+        with mock.patch.object(gui.messagebox, "showinfo"), \
+                mock.patch.object(gui.messagebox, "showwarning"), \
+                mock.patch.object(gui.messagebox, "showerror"), \
+                mock.patch.object(gui.filedialog, "asksaveasfilename", return_value=cikti_yolu):
+            with contextlib.redirect_stdout(io.StringIO()):
+                app = gui.PerformansYonetimApp(root)
+                app.ayarlar = copy.deepcopy(OLCUM_AYARLARI)
+                df, sinif_adi = veri_isleme.veri_yukle_excel(dosya_yolu, satir_atla=ornek_veri.BASLIK_ONCESI_SATIR)
+                app._yukleme_tamamlandi(dosya_yolu, (_kriterleri_ekle(df), sinif_adi))
+                artimli_hesaplama.satirlari_hesapla(app.df, app.ayarlar, OLCUM_DERSI)
+                root.update_idletasks()
+
+            def _bos_listeye_don():
+                # İlk doldurma ölçülür: liste ve sütunlar sıfırlanır
+                app.sanal_liste.sifirla()
+                app.tree_sutunlari = []
+                root.update_idletasks()
+
+            def _treeview_doldur(_):
+                app.treeview_doldur()
+                root.update_idletasks() # Çizim maliyeti de dahil
+            sonuclar["treeview_doldur"] = _olc(_treeview_doldur, hazirla=_bos_listeye_don, tekrar=tekrar)
+
+            secilecekler = [str(i) for i in random.Random(0).sample(list(app.df.index), min(50, len(app.df)))]
+            def _ogrenci_sec(_):
+                for iid in secilecekler:
+                    app.sanal_liste.secimi_ayarla(iid, bildir=True)
+                    root.update_idletasks()
+            olcum = _olc(_ogrenci_sec, tekrar=tekrar)
+            olcum["sure_sn"] /= len(secilecekler) # Seçim başına süre
+            sonuclar["ogrenci_secildi"] = olcum
+
+            # Dışa aktarma arka planda (ArkaplanGorevi) çalışır: görev bitip yukleme_gorevi temizlenene
+            # kadar olay döngüsü işletilir (süreye görevin yoklama aralığı da dahil, kullanıcının beklediği gibi)
+            def _onceki_ciktiyi_sil():
+                with contextlib.suppress(OSError):
+                    os.remove(cikti_yolu)
+            def _disa_aktar_ve_bekle(_):
+                app.veriyi_disa_aktar()
+                if app.yukleme_gorevi is None:
+                    raise RuntimeError("Dışa aktarma başlatılamadı.")
+                while app.yukleme_gorevi is not None:
+                    root.update()
+                    time.sleep(0.001)
+                if not os.path.isfile(cikti_yolu):
+                    raise RuntimeError("Dışa aktarma başarısız oldu (çıktı dosyası yazılmadı).")
+            sonuclar["veriyi_disa_aktar"] = _olc(_disa_aktar_ve_bekle, hazirla=_onceki_ciktiyi_sil, tekrar=tekrar)
+    finally:
+        root.destroy()
+        with contextlib.suppress(OSError):
+            os.remove(cikti_yolu)
+            os.rmdir(cikti_klasoru)
+    return sonuclar
+
+
+# --- Sonuçların Saklanması ---
+def _surum_bilgisi() -> str:
+    """Ölçülen kodun git sürümü (kaydedilmemiş değişiklik varsa '+' eklenir)."""
+    dizin = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    try:
+        surum = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=dizin,
+                               capture_output=True, text=True, check=True).stdout.strip()
+        degisiklik = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=dizin,
+                                    capture_output=True, text=True, check=True).stdout.strip()
+        return surum + ("+" if degisiklik else "")
+    except (OSError, subprocess.CalledProcessError):
+        return "bilinmiyor"
+
+
+def sonuclari_oku(dosya_yolu: str = SONUC_DOSYASI) -> List[Dict[str, Any]]:
+    """Önceki ölçüm kayıtlarını okur (dosya yoksa boş liste)."""
+    if not os.path.isfile(dosya_yolu):
+        return []
+    with open(dosya_yolu, "r", encoding="utf-8") as f:
+        return [json.loads(satir) for satir in f if satir.strip()]
+
+
+def sonuclari_kaydet(kayitlar: List[Dict[str, Any]], dosya_yolu: str = SONUC_DOSYASI) -> None:
+    """Ölçüm kayıtlarını JSON Lines dosyasının sonuna ekler."""
+    os.makedirs(os.path.dirname(dosya_yolu), exist_ok=True)
+    with open(dosya_yolu, "a", encoding="utf-8") as f:
+        for kayit in kayitlar:
+            f.write(json.dumps(kayit, ensure_ascii=False) + "\n")
+
+
+def _onceki_kayit(gecmis: List[Dict[str, Any]], kayit: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Aynı aşama ve boyut için başka bir sürümde alınmış en son kaydı bulur."""
+    for eski in reversed(gecmis):
+        if eski["asama"] == kayit["asama"] and eski["ogrenci"] == kayit["ogrenci"] \
+                and eski["surum"] != kayit["surum"]:
+            return eski
+    return None
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Uygulama aşamalarının ölçeklenmesini ölçer.")
+    parser.add_argument("--boyutlar", type=int, nargs="+", default=VARSAYILAN_BOYUTLAR,
+                        help="Ölçülecek öğrenci sayıları.")
+    parser.add_argument("--tekrar", type=int, default=3, help="Her aşamanın tekrar sayısı (en iyi süre alınır).")
+    parser.add_argument("--arayuzsuz", action="store_true", help="Tk aşamalarını atla.")
+    parser.add_argument("--veri-klasoru", default=None, help="Örnek dosyaların üretileceği/saklanacağı klasör.")
+    parser.add_argument("--sonuc-dosyasi", default=SONUC_DOSYASI)
+    parser.add_argument("--kaydetme", action="store_true", help="Sonuçları dosyaya ekleme.")
+    args = parser.parse_args(argv)
+
+    surum = _surum_bilgisi()
+    zaman = datetime.datetime.now().isoformat(timespec="seconds")
+    gecmis = sonuclari_oku(args.sonuc_dosyasi)
+    kayitlar: List[Dict[str, Any]] = []
+
+    print(f"Sürüm: {surum}, Python {platform.python_version()}, pandas {pd.__version__}")
+    print(f"{'Aşama':28} {'Öğrenci':>8} {'Süre (sn)':>10} {'Bellek (MB)':>12} {'Önceki':>10}")
+    for boyut in args.boyutlar:
+        dosya_yolu = ornek_veri.ornek_dosya(boyut, args.veri_klasoru)
+        asamalar = veri_olc(dosya_yolu, args.tekrar)
+        if not args.arayuzsuz:
+            asamalar.update(arayuz_olc(dosya_yolu, args.tekrar))
+
+        for asama, olcum in asamalar.items():
+            kayit = {"zaman": zaman, "surum": surum, "python": platform.python_version(),
+                     "pandas": pd.__version__, "asama": asama, "ogrenci": boyut,
+                     "sure_sn": round(olcum["sure_sn"], 6), "bellek_mb": round(olcum["bellek_mb"], 3)}
+            kayitlar.append(kayit)
+
+            onceki = _onceki_kayit(gecmis, kayit)
+            karsilastirma = ""
+            if onceki and onceki["sure_sn"] > 0:
+                degisim = kayit["sure_sn"] / onceki["sure_sn"] - 1
+                karsilastirma = f"{degisim:+.0%}" + (" YAVAŞLAMA" if degisim > YAVASLAMA_ESIGI else "")
+            print(f"{asama:28} {boyut:>8} {kayit['sure_sn']:>10.4f} {kayit['bellek_mb']:>12.1f} {karsilastirma:>10}")
+
+    if not args.kaydetme:
+        sonuclari_kaydet(kayitlar, args.sonuc_dosyasi)
+        print(f"Sonuçlar kaydedildi: {args.sonuc_dosyasi}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+# --- benchmarks/ornek_veri.py ---
+# Ölçümler için e-Okul biçiminde sahte not dosyaları (.xlsx) üretir:
+# 15 satırlık başlık öncesi bilgi bloğu, e-Okul sütun başlıkları, virgüllü ondalık
+# notlar ve "G" (girmedi) / "-" ile işaretlenmiş boş notlar.
+
+import os
+import random
+from typing import Optional
+
+import openpyxl
+
+# e-Okul not çizelgesindeki sütun başlıkları (veri_isleme.KOLON_ESLESTIRME ile uyumlu)
+E_OKUL_BASLIKLARI = ["S.No", "Okul No", "Adı Soyadı", "Y1", "Y2", "P1", "P2", "D.ET.KAT.", "PROJE"]
+BASLIK_ONCESI_SATIR = 15 # veri_yukle_excel(satir_atla=15) ile okunur
+
+# Üretilen dosyaların varsayılan olarak saklandığı klasör (tekrar üretmemek için)
+ORNEK_KLASORU = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".ornek_dosyalar")
+
+_ADLAR = ["Ahmet", "Ayşe", "Mehmet", "Fatma", "Mustafa", "Zeynep", "Emre", "Elif", "Çağrı", "Şule",
+          "İbrahim", "Gülşen", "Ömer", "Özge", "Burak", "Irmak", "Uğur", "Ebru", "Hüseyin", "Sıla"]
+_SOYADLAR = ["Yılmaz", "Kaya", "Demir", "Şahin", "Çelik", "Yıldız", "Yıldırım", "Öztürk", "Aydın",
+             "Özdemir", "Arslan", "Doğan", "Kılıç", "Aslan", "Çetin", "Kara", "Koç", "Kurt", "Özkan", "Şimşek"]
+
+
+def _not_degeri(rastgele: random.Random, bos_orani: float):
+    """e-Okul'daki gibi karışık biçimli bir not hücresi üretir."""
+    secim = rastgele.random()
+    if secim < bos_orani:
+        return rastgele.choice(["G", "-", None])
+    not_ = rastgele.randint(0, 100)
+    if secim < bos_orani + 0.15:
+        return f"{not_},{rastgele.choice([0, 5])}" # Metin olarak virgüllü ondalık
+    if secim < bos_orani + 0.25:
+        return str(not_) # Metin olarak tam sayı
+    return not_
+
+
+def ornek_calisma_kitabi(dosya_yolu: str, ogrenci_sayisi: int, sinif_adi: str = "9-A",
+                         tohum: int = 0, bos_orani: float = 0.05) -> str:
+    """
+    e-Okul biçiminde tek sayfalık bir not dosyası yazar.
+
+    Args:
+        dosya_yolu (str): Yazılacak .xlsx dosyası.
+        ogrenci_sayisi (int): Öğrenci (veri satırı) sayısı.
+        sinif_adi (str): Sayfa adı (veri_yukle_excel bunu sınıf adı olarak kullanır).
+        tohum (int): Rastgele üretici tohumu; aynı tohum aynı dosyayı üretir.
+        bos_orani (float): "G"/"-"/boş not hücrelerinin yaklaşık oranı.
+
+    Returns:
+        str: Yazılan dosyanın yolu.
+    """
+    rastgele = random.Random(tohum)
+    wb = openpyxl.Workbook(write_only=True) # Büyük dosyalar için satır satır yazar
+    ws = wb.create_sheet(sinif_adi)
+
+    on_bilgi = ["T.C.", "MİLLÎ EĞİTİM BAKANLIĞI", "ÖRNEK ANADOLU LİSESİ", "",
+                "2025-2026 EĞİTİM ÖĞRETİM YILI", "SINIF ŞUBE NOT ÇİZELGESİ", "",
+                f"Sınıfı: {sinif_adi}", "Dersi: MATEMATİK", "Öğretmeni: ....."]
+    for i in range(BASLIK_ONCESI_SATIR):
+        ws.append([on_bilgi[i]] if i < len(on_bilgi) and on_bilgi[i] else [])
+    ws.append(E_OKUL_BASLIKLARI)
+
+    for sira in range(1, ogrenci_sayisi + 1):
+        okul_no = 100 + sira
+        ws.append([
+            sira,
+            str(okul_no) if sira % 7 == 0 else okul_no, # Bazı numaralar metin olarak saklanır
+            f"{rastgele.choice(_ADLAR)} {rastgele.choice(_SOYADLAR).upper()}",
+            _not_degeri(rastgele, bos_orani), _not_degeri(rastgele, bos_orani),
+            _not_degeri(rastgele, bos_orani), _not_degeri(rastgele, bos_orani),
+            rastgele.choice([1, 2, 3, 4]),
+            _not_degeri(rastgele, bos_orani * 4), # Proje notu daha sık boş
+        ])
+
+    os.makedirs(os.path.dirname(os.path.abspath(dosya_yolu)), exist_ok=True)
+    wb.save(dosya_yolu)
+    return dosya_yolu
+
+
+def ornek_dosya(ogrenci_sayisi: int, klasor: Optional[str] = None, tohum: int = 0) -> str:
+    """Verilen boyuttaki örnek dosyayı döndürür; daha önce üretilmediyse üretir."""
+    klasor = klasor or ORNEK_KLASORU
+    dosya_yolu = os.path.join(klasor, f"eokul_{ogrenci_sayisi}_{tohum}.xlsx")
+    if not os.path.isfile(dosya_yolu):
+        print(f"Örnek dosya üretiliyor: {dosya_yolu}")
+        ornek_calisma_kitabi(dosya_yolu, ogrenci_sayisi, tohum=tohum)
+    return dosya_yolu
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+# --- calisma_alani.py ---
+# Birden fazla yüklenmiş sınıfı bellekte tutan çalışma alanı.
+# Sınıflar arasında geçiş dosyayı yeniden ayrıştırmadan anında yapılır; bellekte tutulacak
+# sınıf sayısı sınırlandırılır ve sınır aşılınca en uzun süredir kullanılmayan (LRU) sınıf çıkarılır.
+
+import os
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+import pandas as pd
+
+from modules import arama_dizini, geri_al, siralama
+
+VARSAYILAN_SINIR = 5 # genel_ayarlar.calisma_alani_siniri yoksa
+
+
+class SinifKaydi:
+    """Çalışma alanındaki bir sınıfın verisi ve o sınıfa ait arayüz durumu."""
+
+    def __init__(self, df: pd.DataFrame, dosya_yolu: str, sinif_adi: str) -> None:
+        self.df = df
+        self.dosya_yolu = dosya_yolu
+        self.sinif_adi = sinif_adi
+        self.mevcut_ders: Optional[str] = None  # Sınıfa dönüldüğünde tekrar seçilecek ders
+        self.tam_hesap_gerekli = True           # Bir sonraki kayıtta tüm sınıf hesaplanmalı mı
+        self.degisti = False                    # Dışa aktarılmamış not değişikliği var mı
+        self.depoda = False                     # Sınıf not deposunda mı (kaydedilen notlar depoya yazılır)
+        self.gecmis = geri_al.GeriAlmaGecmisi() # Sınıfın geri al / yinele adımları
+        self.arama_dizini: Optional[arama_dizini.AramaDizini] = None # Öğrenci arama dizini (ilk gerekince kurulur)
+        self.siralama_onbellegi = siralama.SiralamaOnbellegi() # Sütun başlığıyla sıralamanın anahtarları
+
+    @property
+    def disa_aktarilmamis(self) -> bool:
+        """Değişiklikleri sadece bu DataFrame'de mi (depoya yazılmıyor ve dışa aktarılmadı)?"""
+        return self.degisti and not self.depoda
+
+    @property
+    def etiket(self) -> str:
+        """Sınıf seçim kutusunda görünen ad."""
+        return f"{self.sinif_adi} ({os.path.basename(self.dosya_yolu)})"
+
+
+class CalismaAlani:
+    """
+    Yüklenmiş sınıfları LRU sırasıyla tutar (OrderedDict: en son kullanılan sonda).
+
+    Sınır aşıldığında önce değişikliği olmayan, sonra değişiklikleri depoda olan sınıflar çıkarılır.
+    Dışa aktarılmamış değişikliği olan sınıflar (toplu yüklenenler, depoya alınamayanlar) hiç
+    çıkarılmaz: değişiklikler başka yerde saklanmadığından çalışma alanı gerekirse sınırı aşar.
+    """
+
+    def __init__(self, en_fazla_sinif: int = VARSAYILAN_SINIR) -> None:
+        self.en_fazla_sinif = max(1, int(en_fazla_sinif))
+        self._siniflar: "OrderedDict[str, SinifKaydi]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._siniflar)
+
+    @property
+    def sinir_asildi(self) -> bool:
+        """Dışa aktarılmamış sınıflar yüzünden sınırdan fazla sınıf tutuluyor mu?"""
+        return len(self._siniflar) > self.en_fazla_sinif
+
+    def __contains__(self, anahtar: str) -> bool:
+        return anahtar in self._siniflar
+
+    def anahtarlar(self) -> List[str]:
+        """Sınıf anahtarları, seçim kutusu için alfabetik sırayla."""
+        return sorted(self._siniflar)
+
+    def ekle(self, kayit: SinifKaydi) -> Tuple[str, List[SinifKaydi]]:
+        """
+        Sınıfı ekler (aynı dosya/sayfa zaten varsa yerine koyar) ve en son kullanılan yapar.
+
+        Returns:
+            Tuple[str, List[SinifKaydi]]: (sınıfın anahtarı, sınır nedeniyle çıkarılan sınıflar)
+        """
+        anahtar = kayit.etiket
+        sira = 2
+        while anahtar in self._siniflar and self._siniflar[anahtar].dosya_yolu != kayit.dosya_yolu:
+            anahtar = f"{kayit.etiket} [{sira}]" # Farklı klasörlerde aynı adlı dosyalar
+            sira += 1
+        self._siniflar[anahtar] = kayit
+        self._siniflar.move_to_end(anahtar)
+        return anahtar, self._fazlalari_cikar(korunacak=anahtar)
+
+    def getir(self, anahtar: Optional[str], kullanildi: bool = True) -> Optional[SinifKaydi]:
+        """Sınıfı döndürür (yoksa None). kullanildi=True ise en son kullanılan olarak işaretler."""
+        kayit = self._siniflar.get(anahtar) if anahtar is not None else None
+        if kayit is not None and kullanildi:
+            self._siniflar.move_to_end(anahtar)
+        return kayit
+
+    def cikar(self, anahtar: str) -> Optional[SinifKaydi]:
+        return self._siniflar.pop(anahtar, None)
+
+    def sinir_ayarla(self, en_fazla_sinif: int, korunacak: Optional[str] = None) -> List[SinifKaydi]:
+        """Bellekte tutulacak sınıf sayısını değiştirir; fazlalar çıkarılır ve döndürülür."""
+        self.en_fazla_sinif = max(1, int(en_fazla_sinif))
+        return self._fazlalari_cikar(korunacak)
+
+    def _fazlalari_cikar(self, korunacak: Optional[str]) -> List[SinifKaydi]:
+        cikarilanlar = []
+        while len(self._siniflar) > self.en_fazla_sinif:
+            # En az kullanılandan başlayarak; dışa aktarılmamış değişiklikler asla atılmaz
+            adaylar = [a for a in self._siniflar if a != korunacak and not self._siniflar[a].disa_aktarilmamis]
+            if not adaylar:
+                break
+            anahtar = next((a for a in adaylar if not self._siniflar[a].degisti), adaylar[0])
+            cikarilanlar.append(self._siniflar.pop(anahtar))
+            print(f"Çalışma alanından çıkarıldı (LRU): {anahtar}")
+        return cikarilanlar
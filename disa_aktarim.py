@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+# --- disa_aktarim.py ---
+# Öğrenci tablosunu dosyaya yazan dışa aktarma motoru: akışlı (write-only) .xlsx,
+# düz CSV ve Parquet. Yazma parça parça yapılır; ilerleme bildirilir ve iptal edilebilir.
+# Tk'ya bağımlı değildir; arayüz bunu arkaplan.ArkaplanGorevi ile worker thread'de çalıştırır.
+
+import importlib.util
+import os
+import tempfile
+import threading
+from typing import Callable, Optional
+
+import pandas as pd
+
+from modules import olcum, veri_isleme
+
+# Dosya uzantısı -> biçim
+BICIMLER = {".xlsx": "xlsx", ".csv": "csv", ".parquet": "parquet"}
+PARCA_BOYUTU = 2000 # İlerleme/iptal kontrolü arasındaki satır sayısı
+
+
+class DisaAktarimHatasi(Exception):
+    """Dışa aktarma yapılamadığında (desteklenmeyen biçim, eksik kütüphane) fırlatılır."""
+
+
+def bicim_bul(dosya_yolu: str) -> str:
+    """Dosya uzantısından biçimi bulur (tanınmayan uzantılar .xlsx olarak yazılır)."""
+    return BICIMLER.get(os.path.splitext(dosya_yolu)[1].lower(), "xlsx")
+
+
+def _hucre(deger):
+    """pandas/numpy değerlerini openpyxl'in yazabileceği Python değerlerine çevirir (NaN -> boş)."""
+    if deger is None or deger is pd.NA or (isinstance(deger, float) and deger != deger):
+        return None
+    if hasattr(deger, "item"): # numpy skalerleri
+        deger = deger.item()
+        if isinstance(deger, float) and deger != deger:
+            return None
+    return deger
+
+
+def _xlsx_yaz(df: pd.DataFrame, dosya, sayfa_adi: str, bildir, iptal) -> None:
+    import openpyxl
+    wb = openpyxl.Workbook(write_only=True) # Satırlar bellekte tutulmadan sırayla yazılır
+    ws = wb.create_sheet(sayfa_adi[:31] or "Sayfa1") # Excel sayfa adı en fazla 31 karakter
+    ws.append([str(sutun) for sutun in df.columns])
+    toplam = len(df)
+    try:
+        for sira, satir in enumerate(df.itertuples(index=False, name=None)):
+            if sira % PARCA_BOYUTU == 0:
+                veri_isleme._iptal_kontrol(iptal)
+                bildir(0.9 * sira / max(1, toplam), f"Yazılıyor: {sira}/{toplam} satır")
+            ws.append([_hucre(deger) for deger in satir])
+    except BaseException:
+        ws.close() # Yarım kalan sayfanın geçici dosyası açık kalmasın
+        raise
+    veri_isleme._iptal_kontrol(iptal)
+    bildir(0.9, "Dosya kaydediliyor...")
+    wb.save(dosya)
+
+
+def _csv_yaz(df: pd.DataFrame, dosya, bildir, iptal) -> None:
+    toplam = len(df)
+    # utf-8-sig: Excel'in Türkçe karakterleri doğru açması için BOM eklenir
+    with open(dosya, "w", encoding="utf-8-sig", newline="") as f:
+        df.iloc[0:0].to_csv(f, index=False)
+        for baslangic in range(0, toplam, PARCA_BOYUTU):
+            veri_isleme._iptal_kontrol(iptal)
+            bildir(baslangic / max(1, toplam), f"Yazılıyor: {baslangic}/{toplam} satır")
+            df.iloc[baslangic:baslangic + PARCA_BOYUTU].to_csv(f, index=False, header=False)
+
+
+def _parquet_yaz(df: pd.DataFrame, dosya, bildir, iptal) -> None:
+    if importlib.util.find_spec("pyarrow") is None:
+        raise DisaAktarimHatasi("Parquet için 'pyarrow' kütüphanesi gerekli.\n"
+                                "Lütfen terminalde 'pip install pyarrow' komutunu çalıştırın.")
+    veri_isleme._iptal_kontrol(iptal)
+    bildir(0.1, "Parquet yazılıyor...")
+    # Karışık türlü object sütunlar (örn. boş hücreli isimler) pyarrow'da hata vermesin
+    df = df.copy()
+    for sutun in df.columns:
+        if df[sutun].dtype == object:
+            df[sutun] = df[sutun].map(lambda deger: None if _hucre(deger) is None else str(deger))
+    df.to_parquet(dosya, index=False, engine="pyarrow")
+
+
+@olcum.olculen("disa_aktar")
+def disa_aktar(df: pd.DataFrame, dosya_yolu: str, bicim: Optional[str] = None, sayfa_adi: str = "Notlar",
+               ilerleme: Optional[Callable[[float, str], None]] = None,
+               iptal: Optional[threading.Event] = None) -> int:
+    """
+    DataFrame'i seçilen biçimde dosyaya yazar.
+
+    Önce aynı klasörde geçici bir dosyaya yazılır, bitince hedefin yerine konur; iptal veya
+    hata durumunda var olan hedef dosya bozulmaz.
+
+    Args:
+        df (pd.DataFrame): Yazılacak tablo (worker thread'de okunacağı için kopyası verilmeli).
+        dosya_yolu (str): Hedef dosya.
+        bicim (str, optional): "xlsx", "csv" veya "parquet". Verilmezse uzantıdan bulunur.
+        sayfa_adi (str): .xlsx için sayfa adı.
+        ilerleme (callable, optional): ilerleme(oran, mesaj) ile yazma ilerlemesini bildirir.
+        iptal (threading.Event, optional): Set edilirse yazma durdurulur.
+
+    Returns:
+        int: Yazılan satır sayısı.
+
+    Raises:
+        DisaAktarimHatasi: Biçim desteklenmiyorsa veya gerekli kütüphane yoksa.
+        veri_isleme.IslemIptalEdildi: iptal olayı set edildiyse.
+    """
+    bicim = bicim or bicim_bul(dosya_yolu)
+    if bicim not in BICIMLER.values():
+        raise DisaAktarimHatasi(f"Desteklenmeyen dışa aktarma biçimi: {bicim}")
+    bildir = ilerleme if ilerleme else (lambda oran, mesaj: None)
+
+    dizin = os.path.dirname(os.path.abspath(dosya_yolu))
+    fd, gecici_yol = tempfile.mkstemp(prefix=".disa_aktarim.", suffix="." + bicim, dir=dizin)
+    os.close(fd)
+    try:
+        if bicim == "xlsx":
+            _xlsx_yaz(df, gecici_yol, sayfa_adi, bildir, iptal)
+        elif bicim == "csv":
+            _csv_yaz(df, gecici_yol, bildir, iptal)
+        else:
+            _parquet_yaz(df, gecici_yol, bildir, iptal)
+        veri_isleme._iptal_kontrol(iptal)
+        veri_isleme._izinleri_hedefe_uydur(gecici_yol, dosya_yolu) # mkstemp'in 0600 izni kalmasın
+        os.replace(gecici_yol, dosya_yolu)
+    except BaseException:
+        try: os.remove(gecici_yol)
+        except OSError: pass
+        raise
+
+    bildir(1.0, "Dışa aktarma tamamlandı.")
+    return len(df)
+
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+# --- geri_al.py ---
+# Not düzenlemeleri için geri al / yinele geçmişi.
+# DataFrame'in kopyası yerine sadece değişen hücreler (satır, sütun, eski, yeni) saklanır;
+# bir kayıt işlemi (örn. bir öğrencinin notlarının kaydedilmesi) tek bir geri alma adımıdır.
+
+from collections import deque
+from typing import Any, Deque, List, NamedTuple, Optional
+
+import pandas as pd
+
+VARSAYILAN_ADIM_SINIRI = 200 # Sınıf başına saklanan en fazla geri alma adımı
+
+
+class HucreDegisikligi(NamedTuple):
+    index: int
+    sutun: str
+    eski: Any
+    yeni: Any
+
+
+class GeriAlmaGecmisi:
+    """
+    Sınırlı geri al / yinele yığını. Sınır aşılınca en eski adım atılır.
+
+    Args:
+        en_fazla_adim (int): Saklanacak en fazla geri alma adımı.
+    """
+
+    def __init__(self, en_fazla_adim: int = VARSAYILAN_ADIM_SINIRI) -> None:
+        self._geri: Deque[List[HucreDegisikligi]] = deque(maxlen=max(1, int(en_fazla_adim)))
+        self._ileri: List[List[HucreDegisikligi]] = []
+
+    def ekle(self, degisiklikler: List[HucreDegisikligi]) -> None:
+        """Yeni bir adımı kaydeder; yinelenebilecek adımlar silinir. Boş adımlar yok sayılır."""
+        degisiklikler = [d for d in degisiklikler if not ayni_deger(d.eski, d.yeni)]
+        if degisiklikler:
+            self._geri.append(degisiklikler)
+            self._ileri.clear()
+
+    def geri_al(self) -> Optional[List[HucreDegisikligi]]:
+        """Son adımı geri alır. Döndürülen değişikliklerin `yeni` alanı yazılacak (eski) değerdir."""
+        if not self._geri:
+            return None
+        adim = self._geri.pop()
+        self._ileri.append(adim)
+        return [HucreDegisikligi(d.index, d.sutun, d.yeni, d.eski) for d in reversed(adim)]
+
+    def yinele(self) -> Optional[List[HucreDegisikligi]]:
+        """Geri alınan son adımı yeniden uygulamak için değişiklikleri döndürür."""
+        if not self._ileri:
+            return None
+        adim = self._ileri.pop()
+        self._geri.append(adim)
+        return list(adim)
+
+    def temizle(self) -> None:
+        self._geri.clear()
+        self._ileri.clear()
+
+    @property
+    def geri_alinabilir(self) -> bool:
+        return bool(self._geri)
+
+    @property
+    def yinelenebilir(self) -> bool:
+        return bool(self._ileri)
+
+
+def ayni_deger(eski: Any, yeni: Any) -> bool:
+    """İki hücre değeri aynı mı (boş değerler -None/NaN/NA- birbirine eşit sayılır)."""
+    eski_bos, yeni_bos = pd.isna(eski), pd.isna(yeni)
+    if eski_bos or yeni_bos:
+        return bool(eski_bos and yeni_bos)
+    try:
+        return bool(eski == yeni)
+    except (TypeError, ValueError):
+        return False
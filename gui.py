@@ -7,17 +7,35 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, simpledialog, Frame, Label, Entry, Button, PanedWindow, Scrollbar, Canvas, Toplevel
+import numpy as np
 import pandas as pd
 import os
 import sys
 import copy # Ayarlar düzenleme için derin kopya
-from typing import Dict, List, Optional, Any, Tuple
+import multiprocessing # Toplu yüklemedeki süreç havuzu (PyInstaller desteği için)
+from typing import Dict, List, Optional, Any, Set, Tuple
 
 # --- Modül Importları ---
 try:
     # modules klasörünün main.py ile aynı dizinde olduğunu varsayıyoruz
     from modules import veri_isleme
     from modules import hesaplamalar
+    from modules import artimli_hesaplama
+    from modules import sanal_liste
+    from modules import arkaplan
+    from modules import toplu_yukleme
+    from modules import olcum
+    from modules import disa_aktarim
+    from modules import calisma_alani
+    from modules import veri_semasi
+    from modules import not_deposu
+    from modules import gunluk
+    from modules import geri_al
+    from modules import toplu_giris
+    from modules import arama_dizini
+    from modules import yenileme
+    from modules import satir_havuzu
+    from modules import kriter_panelleri
     # Raporlama modülü ileride kullanılabilir
     # from modules import raporlama
 except ImportError as import_err:
@@ -29,6 +47,8 @@ except ImportError as import_err:
     # GUI başlamadan hata vermek için Tkinter kullanmak yerine doğrudan çıkalım
     sys.exit(f"Modül Hatası: {import_err}")
 
+DURUM_MESAJI_SURESI_MS = 5000 # Durum çubuğundaki mesajın ekranda kalma süresi
+
 # --- Ana Uygulama Sınıfı ---
 class PerformansYonetimApp:
     """Performans değerlendirme ana uygulama sınıfı."""
@@ -97,21 +117,55 @@ class PerformansYonetimApp:
         self.mevcut_sinif_adi: Optional[str] = None  # Yüklenen sınıf/sayfa adı
         self.mevcut_ders: Optional[str] = None       # Seçili ders adı
         self.secili_ogrenci_index: Optional[int] = None # Treeview'de seçili öğrencinin df index'i
+        # Veri/ders/ayar değişince bir sonraki kayıtta tüm sınıf hesaplanır, sonra sadece değişen satır
+        self.tam_hesap_gerekli: bool = True
+        self.yukleme_gorevi: Optional[arkaplan.ArkaplanGorevi] = None # Arka planda süren dosya yükleme
+        # Yüklenmiş sınıflar: sınıf seçim kutusundan yeniden ayrıştırmadan geçilir (LRU ile sınırlı)
+        self.calisma_alani = calisma_alani.CalismaAlani(
+            self.ayarlar.get("genel_ayarlar", {}).get("calisma_alani_siniri", calisma_alani.VARSAYILAN_SINIR))
+        self.aktif_sinif_anahtari: Optional[str] = None # Çalışma alanındaki aktif sınıfın anahtarı
+        self.siralama_durumu: Optional[Tuple[str, bool]] = None # Listenin sıralaması (sütun, azalan); None: tablo sırası
+        # Kaydedilen her not SQLite deposuna tek satır olarak yazılır; açılamazsa depo olmadan çalışılır
+        try:
+            self.not_deposu: Optional[not_deposu.NotDeposu] = not_deposu.NotDeposu()
+        except Exception as e:
+            print(f"HATA: Not deposu açılamadı, değişiklikler sadece dışa aktarılınca saklanacak: {e}")
+            self.not_deposu = None
+        # Her not değişikliği önce günlüğe yazılır; önceki oturum çöktüyse kalan kayıtlar
+        # ilgili sınıf yüklendiğinde yeniden uygulanır (sınıf anahtarı -> kayıtlar)
+        self.gunluk = gunluk.DegisiklikGunlugu()
+        try:
+            self.kurtarilacaklar = self.gunluk.bekleyenler()
+        except OSError as e:
+            print(f"HATA: Değişiklik günlüğü okunamadı: {e}")
+            self.kurtarilacaklar = {}
+
+        # Liste/kriter paneli doğrudan çizilmez; eskiyen parçalar işaretlenir ve boşta döngüde bir kez çizilir
+        self.yenileme = yenileme.YenilemeZamanlayici(self.root, self._yenilemeyi_uygula)
+
+        self._durum_zamanlayici: Optional[str] = None # Durum çubuğu mesajını silecek after kimliği
 
         # Kriter giriş alanlarını (Entry) tutacak sözlük {kriter_adı: entry_widget}
         self.kriter_entry_widgets: Dict[str, ttk.Entry] = {}
+        self.kriter_panelleri: Optional[kriter_panelleri.KriterPaneliOnbellegi] = None # Kriter tanımı başına hazır paneller
         # Ayarlar penceresi için geçici ayarlar (düzenleme sırasında kullanılır)
         self.gecici_ayarlar: Dict = {}
         # Ayarlar penceresindeki dinamik widget'lar için (dersler)
         self.ders_widgets: Dict[str, Dict[str, Any]] = {}
         # Ayarlar penceresindeki dinamik widget'lar için (kriterler)
         self.kriter_widgets: List[Dict[str, Any]] = []
+        # Ayarlar/kriter pencerelerindeki satır havuzları (pencere yeniden açılınca yeniden kurulur)
+        self.ders_havuzu: Optional[satir_havuzu.SatirHavuzu] = None
+        self.kriter_havuzu: Optional[satir_havuzu.SatirHavuzu] = None
 
 
         # --- Arayüzü Oluştur ---
         try:
             self.arayuzu_olustur()
             print("Arayüz başarıyla oluşturuldu.")
+            self.root.after(int(gunluk.FSYNC_ARALIGI_SN * 1000), self._gunlugu_senkronize_et)
+            if self.kurtarilacaklar:
+                self.root.after_idle(self._kurtarma_bildir)
         except Exception as e:
              print(f"Kritik Hata: Arayüz oluşturulurken hata oluştu! Hata: {e}")
              import traceback
@@ -124,13 +178,81 @@ class PerformansYonetimApp:
     def on_closing(self) -> None:
         """Pencere kapatılırken onay ister."""
         print("Kapatma işlemi başlatıldı.")
-        # İleride kaydedilmemiş değişiklik kontrolü eklenebilir
-        if messagebox.askokcancel("Çıkış", "Uygulamadan çıkmak istediğinize emin misiniz?"):
+        self._aktif_sinifi_sakla()
+        # Depoya yazılmayan (toplu yüklenen) sınıflardaki değişiklikler sadece dışa aktarılınca saklanır
+        kaydedilmemis = [self.calisma_alani.getir(a, kullanildi=False) for a in self.calisma_alani.anahtarlar()]
+        kaydedilmemis = [k.etiket for k in kaydedilmemis if k.disa_aktarilmamis]
+        soru = "Uygulamadan çıkmak istediğinize emin misiniz?"
+        if kaydedilmemis:
+            soru = ("Şu sınıflarda dışa aktarılmamış değişiklikler var:\n"
+                    + "\n".join(f"- {etiket}" for etiket in kaydedilmemis) + "\n\n" + soru)
+        if messagebox.askokcancel("Çıkış", soru):
             print("Çıkış onaylandı, uygulama kapatılıyor.")
+            try: # Düzgün kapanış: günlük temizlenir, henüz uygulanmamış kurtarma kayıtları bırakılır
+                self.gunluk.kapat(korunacaklar=[k for kayitlar in self.kurtarilacaklar.values() for k in kayitlar])
+            except OSError as e:
+                print(f"HATA: Değişiklik günlüğü kapatılamadı: {e}")
+            if self.not_deposu is not None:
+                self.not_deposu.kapat()
+            self.yenileme.iptal()
             self.root.destroy()
         else:
             print("Çıkış iptal edildi.")
 
+    # --- Değişiklik Günlüğü ---
+    def _gunlugu_senkronize_et(self) -> None:
+        """Günlükte fsync bekleyen kayıtları periyodik olarak diske yazar."""
+        try:
+            self.gunluk.senkronize_et()
+        except OSError as e:
+            print(f"HATA: Değişiklik günlüğü diske yazılamadı: {e}")
+        self.root.after(int(gunluk.FSYNC_ARALIGI_SN * 1000), self._gunlugu_senkronize_et)
+
+    def _kurtarma_bildir(self) -> None:
+        """Önceki oturumdan kurtarılan değişiklikleri kullanıcıya bildirir."""
+        toplam = sum(len(kayitlar) for kayitlar in self.kurtarilacaklar.values())
+        dosyalar = sorted({os.path.basename(sinif.split("|")[0]) for sinif in self.kurtarilacaklar})
+        messagebox.showinfo(
+            "Değişiklikler Kurtarıldı",
+            f"Önceki oturum düzgün kapanmamış. {toplam} not değişikliği kurtarıldı.\n"
+            "Şu dosyalar/klasörler açıldığında değişiklikler otomatik uygulanacak:\n"
+            + "\n".join(f"- {ad}" for ad in dosyalar))
+
+    def _gunluk_siniflari(self, indeksler: List[int]) -> Dict[int, str]:
+        """Satırların günlükteki sınıf anahtarları (birleşik tablolarda satırın geldiği sınıf da eklenir)."""
+        if toplu_yukleme.SINIF_SUTUNU in self.df.columns:
+            etiketler = self.df.loc[indeksler, toplu_yukleme.SINIF_SUTUNU]
+            return {index: not_deposu.sinif_kimligi(self.mevcut_dosya_yolu, etiket) for index, etiket in etiketler.items()}
+        kimlik = not_deposu.sinif_kimligi(self.mevcut_dosya_yolu)
+        return dict.fromkeys(indeksler, kimlik)
+
+    def _gunlugu_uygula(self, kayit: calisma_alani.SinifKaydi) -> int:
+        """Yeni yüklenen sınıfa (kayit) ait kurtarma kayıtlarını uygular; uygulanan kayıt sayısını döndürür."""
+        if not self.kurtarilacaklar or not self.mevcut_dosya_yolu:
+            return 0
+        eksik_veri_degeri = self.ayarlar.get("genel_ayarlar", {}).get("eksik_veri_degeri", 0)
+        if toplu_yukleme.SINIF_SUTUNU in self.df.columns:
+            gruplar = [(not_deposu.sinif_kimligi(self.mevcut_dosya_yolu, etiket), satirlar)
+                       for etiket, satirlar in self.df.groupby(toplu_yukleme.SINIF_SUTUNU, observed=True).groups.items()]
+        else:
+            gruplar = [(not_deposu.sinif_kimligi(self.mevcut_dosya_yolu), None)]
+
+        uygulanan, degisenler = 0, set()
+        for sinif, satirlar in gruplar:
+            kayitlar = self.kurtarilacaklar.pop(sinif, None)
+            if kayitlar:
+                degisenler |= gunluk.uygula(self.df, kayitlar, satirlar, eksik_veri_degeri)
+                uygulanan += len(kayitlar)
+        kimlik = self._depo_kimligi(kayit)
+        if kimlik is not None and degisenler:
+            try:
+                self.not_deposu.satirlari_yaz(kimlik, None, self.df.loc[sorted(degisenler)].to_dict("records"))
+            except Exception as e:
+                print(f"HATA: Kurtarılan notlar depoya yazılamadı: {e}")
+        if uygulanan:
+            print(f"Değişiklik günlüğünden {uygulanan} kayıt uygulandı.")
+        return uygulanan
+
     # --- Ana Arayüz Kurulumu ---
     def arayuzu_olustur(self) -> None:
         """Ana arayüz elemanlarını (widget'ları) oluşturur."""
@@ -143,7 +265,18 @@ class PerformansYonetimApp:
         ust_panel.pack(side=tk.TOP, fill=tk.X, pady=(5, 0))
 
         # Veri Yükle Butonu
-        ttk.Button(ust_panel, text="📊 Veri Yükle (.xlsx)", command=self.dosya_sec_ve_yukle).pack(side=tk.LEFT, padx=5)
+        self.yukle_buton = ttk.Button(ust_panel, text="📊 Veri Yükle (.xlsx)", command=self.dosya_sec_ve_yukle)
+        self.yukle_buton.pack(side=tk.LEFT, padx=5)
+
+        # Toplu Yükle Butonu (bir klasördeki tüm sınıf dosyaları)
+        self.toplu_yukle_buton = ttk.Button(ust_panel, text="📁 Toplu Yükle", command=self.klasor_sec_ve_toplu_yukle)
+        self.toplu_yukle_buton.pack(side=tk.LEFT, padx=5)
+
+        # Sınıf Seçimi (çalışma alanındaki yüklü sınıflar)
+        ttk.Label(ust_panel, text="Sınıf:").pack(side=tk.LEFT, padx=(10, 2))
+        self.sinif_combobox = ttk.Combobox(ust_panel, state="disabled", width=24)
+        self.sinif_combobox.pack(side=tk.LEFT, padx=2)
+        self.sinif_combobox.bind("<<ComboboxSelected>>", self.sinif_degisti)
 
         # Ders Seçimi
         ttk.Label(ust_panel, text="Ders:").pack(side=tk.LEFT, padx=(10, 2))
@@ -155,6 +288,12 @@ class PerformansYonetimApp:
         self.bilgi_etiketi = ttk.Label(ust_panel, text="Lütfen veri dosyası yükleyin.", anchor="center", relief="sunken", padding=3)
         self.bilgi_etiketi.pack(side=tk.LEFT, padx=10, fill=tk.X, expand=True)
 
+        # Yükleme İlerlemesi (sadece yükleme sırasında görünür)
+        self.yukleme_cercevesi = ttk.Frame(ust_panel)
+        self.yukleme_ilerleme = ttk.Progressbar(self.yukleme_cercevesi, mode="determinate", length=120, maximum=100)
+        self.yukleme_ilerleme.pack(side=tk.LEFT, padx=2)
+        ttk.Button(self.yukleme_cercevesi, text="İptal", width=6, command=self.yuklemeyi_iptal_et).pack(side=tk.LEFT, padx=2)
+
         # Dışa Aktar Butonu
         self.disa_aktar_buton = ttk.Button(ust_panel, text="💾 Veriyi Dışa Aktar", command=self.veriyi_disa_aktar, state="disabled")
         self.disa_aktar_buton.pack(side=tk.RIGHT, padx=5)
@@ -162,6 +301,11 @@ class PerformansYonetimApp:
         # Ayarlar Butonu
         ttk.Button(ust_panel, text="⚙️ Ayarlar", command=self.ayarlari_duzenle_ui).pack(side=tk.RIGHT, padx=5)
 
+        # --- Durum Çubuğu (ana alandan önce yerleşir ki pencere küçülünce kaybolmasın) ---
+        # Onaylar modal pencere yerine burada gösterilir ve bir süre sonra silinir
+        self.durum_cubugu = ttk.Label(self.root, text="", anchor="w", relief="sunken", padding=(5, 2))
+        self.durum_cubugu.pack(side=tk.BOTTOM, fill=tk.X, padx=5, pady=(0, 5))
+
         # --- 2. Ana Alan: Liste ve Düzenleme ---
         ana_alan = PanedWindow(self.root, orient=tk.HORIZONTAL, sashrelief=tk.RAISED, sashwidth=5)
         try:
@@ -175,27 +319,44 @@ class PerformansYonetimApp:
         # --- 2a. Sol Panel: Öğrenci Listesi (Treeview) ---
         sol_panel = ttk.Frame(ana_alan, padding=0)
         sol_panel.columnconfigure(0, weight=1)
-        sol_panel.rowconfigure(0, weight=1)
+        sol_panel.rowconfigure(1, weight=1)
         # Sol paneli ana alana ekle, başlangıç ağırlığı 3 (daha geniş)
         ana_alan.add(sol_panel)
 
+        # Arama/filtre kutusu: her tuşta liste, sınıfın arama dizininden daraltılır (Ctrl+F ile odaklanır)
+        arama_cercevesi = ttk.Frame(sol_panel)
+        arama_cercevesi.grid(row=0, column=0, columnspan=2, sticky="ew", pady=(0, 3))
+        arama_cercevesi.columnconfigure(1, weight=1)
+        ttk.Label(arama_cercevesi, text="🔍 Ara:").grid(row=0, column=0, padx=(0, 5))
+        self.arama_var = tk.StringVar()
+        self.arama_entry = ttk.Entry(arama_cercevesi, textvariable=self.arama_var)
+        self.arama_entry.grid(row=0, column=1, sticky="ew")
+        ttk.Button(arama_cercevesi, text="✕", width=3, command=self.aramayi_temizle).grid(row=0, column=2, padx=(3, 0))
+        self.arama_sonuc_etiketi = ttk.Label(arama_cercevesi, text="", foreground="gray")
+        self.arama_sonuc_etiketi.grid(row=0, column=3, padx=(5, 0))
+        self.arama_var.trace_add("write", lambda *_: self._filtreyi_uygula())
+        self.arama_entry.bind("<Return>", self._aramadan_sec)
+        self.arama_entry.bind("<Escape>", lambda e: self.aramayi_temizle())
+        self.arama_entry.bind("<Down>", self._aramadan_sec)
+
         tree_scrollbar_y = Scrollbar(sol_panel, orient=tk.VERTICAL)
         tree_scrollbar_x = Scrollbar(sol_panel, orient=tk.HORIZONTAL)
 
         self.tree = ttk.Treeview(
             sol_panel,
-            yscrollcommand=tree_scrollbar_y.set,
             xscrollcommand=tree_scrollbar_x.set,
             selectmode='browse' # Tek satır seçimi
         )
-        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.tree.grid(row=1, column=0, sticky="nsew")
 
-        tree_scrollbar_y.config(command=self.tree.yview)
         tree_scrollbar_x.config(command=self.tree.xview)
-        tree_scrollbar_y.grid(row=0, column=1, sticky="ns")
-        tree_scrollbar_x.grid(row=1, column=0, sticky="ew")
+        tree_scrollbar_y.grid(row=1, column=1, sticky="ns")
+        tree_scrollbar_x.grid(row=2, column=0, sticky="ew")
 
-        self.tree.bind("<<TreeviewSelect>>", self.ogrenci_secildi)
+        # Sanal liste: sadece görünen satırlar Treeview'de tutulur,
+        # dikey kaydırma ve seçim olayı (<<TreeviewSelect>>) bunun üzerinden yönetilir
+        self.sanal_liste = sanal_liste.SanalListe(self.tree, tree_scrollbar_y, self.ogrenci_secildi)
+        self.tree_sutunlari: List[str] = [] # Treeview'de gösterilen sütunlar (sırasıyla)
 
         # --- 2b. Sağ Panel: Düzenleme Alanı ---
         self.edit_frame = ttk.Frame(ana_alan, padding=10)
@@ -227,6 +388,8 @@ class PerformansYonetimApp:
         ttk.Label(self.edit_frame, text="Proje:").grid(row=6, column=0, padx=5, pady=3, sticky="w")
         self.proje_entry = ttk.Entry(self.edit_frame, width=10)
         self.proje_entry.grid(row=6, column=1, padx=5, pady=3, sticky="w")
+        for entry in (self.y1_entry, self.y2_entry, self.proje_entry):
+            self._not_alani_kisayollari(entry)
 
         ttk.Separator(self.edit_frame, orient=tk.HORIZONTAL).grid(row=7, column=0, columnspan=2, sticky="ew", pady=10)
 
@@ -236,6 +399,7 @@ class PerformansYonetimApp:
         self.kriter_cercevesi = ttk.Frame(self.edit_frame)
         self.kriter_cercevesi.grid(row=9, column=0, columnspan=2, sticky="nsew", pady=(0,5))
         self.kriter_cercevesi.columnconfigure(1, weight=0) # Entry'ler genişlemesin
+        self.kriter_panelleri = kriter_panelleri.KriterPaneliOnbellegi(self.kriter_cercevesi, self._not_alani_kisayollari)
 
         # Hesapla ve Kaydet Butonu
         self.kaydet_buton = ttk.Button(
@@ -246,9 +410,37 @@ class PerformansYonetimApp:
         )
         self.kaydet_buton.grid(row=10, column=0, columnspan=2, pady=(10, 5), sticky="ew")
 
+        # Geri Al / Yinele (sadece değişen hücreler saklanır, bkz. geri_al)
+        gecmis_cercevesi = ttk.Frame(self.edit_frame)
+        gecmis_cercevesi.grid(row=11, column=0, columnspan=2, sticky="ew")
+        gecmis_cercevesi.columnconfigure((0, 1), weight=1)
+        self.geri_al_buton = ttk.Button(gecmis_cercevesi, text="↶ Geri Al (Ctrl+Z)", command=self.geri_al, state="disabled")
+        self.geri_al_buton.grid(row=0, column=0, padx=(0, 2), sticky="ew")
+        self.yinele_buton = ttk.Button(gecmis_cercevesi, text="↷ Yinele (Ctrl+Y)", command=self.yinele, state="disabled")
+        self.yinele_buton.grid(row=0, column=1, padx=(2, 0), sticky="ew")
+
+        # Toplu Not Girişi (yapıştırılan blok veya CSV; tek hesaplama, tek yenileme)
+        self.toplu_giris_buton = ttk.Button(self.edit_frame, text="📋 Toplu Not Girişi...", command=self.toplu_not_girisi_ui)
+        self.toplu_giris_buton.grid(row=12, column=0, columnspan=2, pady=(5, 0), sticky="ew")
+
+        # Hızlı Giriş: not alanında Enter kaydeder ve listedeki sonraki öğrenciye geçer (Shift+Enter: önceki)
+        self.hizli_giris_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(self.edit_frame, text="⚡ Hızlı Giriş (Enter: kaydet ve sonraki öğrenci)",
+                        variable=self.hizli_giris_var).grid(row=13, column=0, columnspan=2, pady=(8, 0), sticky="w")
+        self.tree.bind("<Return>", self._duzenlemeye_gec)
+        self.tree.bind("<KP_Enter>", self._duzenlemeye_gec)
+        for kisayol in ("<Control-z>", "<Control-Z>"):
+            self.root.bind(kisayol, self.geri_al)
+        for kisayol in ("<Control-y>", "<Control-Y>", "<Control-Shift-Z>", "<Control-Shift-z>"):
+            self.root.bind(kisayol, self.yinele)
+        for kisayol in ("<Control-f>", "<Control-F>"):
+            self.root.bind(kisayol, self.aramaya_odaklan)
+
     # --- Dosya Yükleme İşlemi ---
     def dosya_sec_ve_yukle(self) -> None:
-        """Kullanıcıya Excel dosyası seçtirir, veriyi yükler ve arayüzü günceller."""
+        """Kullanıcıya Excel dosyası seçtirir ve veriyi arka planda yüklemeye başlar."""
+        if self.yukleme_gorevi is not None:
+            return # Önceki yükleme sürüyor
         print("Dosya seçme işlemi başlatıldı...")
         dosya_yolu = filedialog.askopenfilename(
             title="e-Okul Not Listesi Seçin (.xlsx)",
@@ -260,42 +452,235 @@ class PerformansYonetimApp:
 
         print(f"Seçilen dosya: {dosya_yolu}")
 
+        # Sınıf daha önce açıldıysa (girilen notlarla birlikte) depodan okunur, Excel ayrıştırılmaz.
+        # Aksi halde başlık satırı worker'da (önbellekte yoksa) aranır; bulunamazsa kullanıcıya sorulur
+        self._yuklemeyi_baslat(dosya_yolu, None, self._depodan_yuklenecek_mi(dosya_yolu))
+
+    def _yuklemeyi_baslat(self, dosya_yolu: str, satir_atla: Optional[int], depodan: bool) -> None:
+        """Sınıfı arka planda yükler; sonuç root.after yoklamasıyla _yukleme_tamamlandi'ya gelir."""
+        print("Sınıf arka planda yükleniyor...")
+        self.yukleme_gorevi = arkaplan.ArkaplanGorevi(
+            self.root,
+            lambda ilerleme, iptal: self._sinifi_yukle(dosya_yolu, satir_atla, depodan, ilerleme, iptal),
+            bitti=lambda sonuc: self._yukleme_tamamlandi(dosya_yolu, sonuc),
+            hata=lambda e: self._yukleme_hatasi(e, dosya_yolu),
+            ilerleme=self._yukleme_ilerledi,
+        ) # İptalde arayüz hemen yuklemeyi_iptal_et içinde eski haline döner
+        self._yukleme_arayuzu(True, f"Yükleniyor: {os.path.basename(dosya_yolu)}")
+        self.yukleme_gorevi.baslat()
+
+    def _depodan_yuklenecek_mi(self, dosya_yolu: str) -> bool:
+        """Sınıf depoda varsa True. Excel depoya alındıktan sonra değiştiyse kullanıcıya sorulur."""
+        if self.not_deposu is None:
+            return False
+        kimlik = not_deposu.sinif_kimligi(dosya_yolu)
+        try:
+            if not self.not_deposu.sinif_var_mi(kimlik):
+                return False
+            if self.not_deposu.kaynak_degisti_mi(kimlik) and not messagebox.askyesno(
+                    "Dosya Değişmiş",
+                    "Bu dosya depoya alındıktan sonra değiştirilmiş.\n"
+                    "Depodaki notlar (girdiğiniz değişikliklerle) kullanılsın mı?\n"
+                    "(Hayır: Excel yeniden okunur ve depodaki kayıt silinir)"):
+                self.not_deposu.sinifi_sil(kimlik)
+                return False
+            return True
+        except Exception as e:
+            print(f"HATA: Not deposu okunamadı, dosya Excel'den yüklenecek: {e}")
+            return False
+
+    def _sinifi_yukle(self, dosya_yolu: str, satir_atla: Optional[int], depodan: bool,
+                      ilerleme, iptal) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
+        """(Worker thread) Sınıfı depodan veya Excel'den okur; Excel'den okunan sınıf depoya alınır."""
+        kimlik = not_deposu.sinif_kimligi(dosya_yolu)
+        eksik_veri_degeri = self.ayarlar.get("genel_ayarlar", {}).get("eksik_veri_degeri", 0)
+        if depodan:
+            ilerleme(0.0, "Depodan okunuyor...")
+            sonuc = self.not_deposu.sinifi_oku(kimlik, eksik_veri_degeri)
+            if sonuc is not None:
+                return sonuc
+
+        df, sinif_adi = veri_isleme.veri_yukle_excel(dosya_yolu, satir_atla=satir_atla, ilerleme=ilerleme, iptal=iptal)
+        if df is not None and self.not_deposu is not None:
+            try:
+                self.not_deposu.sinifi_yaz(kimlik, df, sinif_adi, dosya_yolu)
+            except Exception as e:
+                print(f"Uyarı: Sınıf depoya alınamadı, değişiklikler sadece dışa aktarılınca saklanacak: {e}")
+        return df, sinif_adi
+
+    def _depoda_var_mi(self, dosya_yolu: str) -> bool:
+        """Yüklenen sınıf depoda mı? Depoya alma başarısız olduysa (örn. tekrarlanan numaralar) False."""
+        if self.not_deposu is None:
+            return False
+        try:
+            return self.not_deposu.sinif_var_mi(not_deposu.sinif_kimligi(dosya_yolu))
+        except Exception as e:
+            print(f"HATA: Not deposu okunamadı: {e}")
+            return False
+
+    def _depoda_mi(self, kayit: calisma_alani.SinifKaydi) -> bool:
+        """Sınıfın kaydedilen notları depoya yazılıyor mu (toplu yüklenen veya depoya alınamayan sınıflar yazılmaz)?"""
+        return self.not_deposu is not None and kayit.depoda
+
+    def _depo_kimligi(self, kayit: Optional[calisma_alani.SinifKaydi] = None) -> Optional[str]:
+        """
+        Sınıfın depo anahtarı; sınıf depoda değilse None.
+
+        Args:
+            kayit (calisma_alani.SinifKaydi, optional): Verilmezse aktif sınıfın kaydı.
+        """
+        if kayit is None:
+            kayit = self.calisma_alani.getir(self.aktif_sinif_anahtari, kullanildi=False)
+        if kayit is None or not self._depoda_mi(kayit):
+            return None
+        return not_deposu.sinif_kimligi(kayit.dosya_yolu)
+
+    def _satir_atla_sor(self) -> Optional[int]:
+        """Başlık satırı otomatik bulunamadığında atlanacak satır sayısını kullanıcıya sorar."""
         try:
             varsayilan_satir_atla = 15
             satir_atla = simpledialog.askinteger(
                 "Başlık Satırı Atlama",
-                "Excel dosyasının başından kaç satır atlanacak?\n(Genellikle 15 veya 16'dır)",
+                "Başlık satırı otomatik bulunamadı.\nExcel dosyasının başından kaç satır atlanacak?\n(Genellikle 15 veya 16'dır)",
                 parent=self.root, initialvalue=varsayilan_satir_atla, minvalue=0, maxvalue=100
             )
             if satir_atla is None:
                 print("Satır atlama sayısı girişi iptal edildi.")
-                return
+                return None
             print(f"Atlanacak satır sayısı: {satir_atla}")
+            return satir_atla
         except Exception as e:
             messagebox.showerror("Giriş Hatası", f"Satır atlama sayısı alınamadı: {e}")
+            return None
+
+    # --- Toplu Yükleme İşlemi ---
+    def klasor_sec_ve_toplu_yukle(self) -> None:
+        """Bir klasördeki tüm sınıf dosyalarını paralel yükleyip tek listede birleştirir."""
+        if self.yukleme_gorevi is not None:
+            return # Önceki yükleme sürüyor
+        klasor = filedialog.askdirectory(title="Sınıf Dosyalarının Bulunduğu Klasörü Seçin")
+        if not klasor:
+            print("Klasör seçilmedi.")
+            return
+        dosya_sayisi = len(toplu_yukleme.dosyalari_bul(klasor))
+        if not dosya_sayisi:
+            messagebox.showwarning("Dosya Bulunamadı", f"'{klasor}' klasöründe .xlsx dosyası yok.")
             return
 
-        print("veri_isleme.veri_yukle_excel çağrılıyor...")
-        try:
-            # veri_isleme modülünü kullan
-            df_yeni, sinif_adi = veri_isleme.veri_yukle_excel(dosya_yolu, satir_atla=satir_atla)
-        except Exception as e:
-            print(f"veri_yukle_excel çağrılırken hata: {e}")
-            messagebox.showerror("Yükleme Hatası", f"Dosya işlenirken beklenmedik bir hata oluştu:\n{e}")
-            df_yeni, sinif_adi = None, None # Hata durumunda None ata
+        # Başlık satırı her sayfa için worker'da otomatik bulunur (satir_atla=None)
+        tum_sayfalar = messagebox.askyesno(
+            "Sayfalar", f"{dosya_sayisi} dosya bulundu.\nHer dosyanın TÜM sayfaları yüklensin mi?\n(Hayır: sadece ilk sayfa)")
+
+        self.yukleme_gorevi = arkaplan.ArkaplanGorevi(
+            self.root,
+            lambda ilerleme, iptal: toplu_yukleme.toplu_yukle(klasor, tum_sayfalar=tum_sayfalar,
+                                                              ilerleme=ilerleme, iptal=iptal),
+            bitti=lambda sonuc: self._toplu_yukleme_tamamlandi(klasor, sonuc),
+            hata=self._yukleme_hatasi,
+            ilerleme=self._yukleme_ilerledi,
+        )
+        self._yukleme_arayuzu(True, f"Toplu yükleniyor: {dosya_sayisi} dosya")
+        self.yukleme_gorevi.baslat()
+
+    def _toplu_yukleme_tamamlandi(self, klasor: str, sonuc: Tuple[pd.DataFrame, List[Dict[str, Any]]]) -> None:
+        """Toplu yükleme bittiğinde birleşik tabloyu tek bir sınıf gibi uygulamaya alır ve raporu gösterir."""
+        df_birlesik, rapor = sonuc
+        hatalilar = [r for r in rapor if not r["basarili"]]
+        sinif_sayisi = len(rapor) - len(hatalilar)
+        hata_metni = "\n".join(f"- {os.path.basename(r['dosya'])} [{r['sayfa']}]: {r['hata']}" for r in hatalilar[:15])
+        if len(hatalilar) > 15: hata_metni += f"\n... ve {len(hatalilar) - 15} tane daha"
+
+        if df_birlesik.empty:
+            self._yukleme_iptal_edildi()
+            messagebox.showerror("Toplu Yükleme Başarısız", f"Hiçbir dosya yüklenemedi.\n{hata_metni}")
+            return
+
+        self._yukleme_tamamlandi(klasor, (df_birlesik, f"Toplu ({sinif_sayisi} sınıf)"))
+        if hatalilar:
+            messagebox.showwarning("Toplu Yükleme Raporu",
+                                   f"{sinif_sayisi} sayfa yüklendi, {len(hatalilar)} sayfa yüklenemedi:\n{hata_metni}")
+
+    # --- Arka Plan Yükleme Geri Çağrıları ---
+    def _yukleme_arayuzu(self, yukleniyor: bool, mesaj: str = "") -> None:
+        """Yükleme/dışa aktarma sırasında ilerleme çubuğunu/iptal butonunu gösterir, bittiğinde gizler."""
+        if yukleniyor:
+            self.yukleme_ilerleme["value"] = 0
+            self.yukleme_cercevesi.pack(side=tk.LEFT, padx=5, before=self.bilgi_etiketi)
+            self.yukle_buton.config(state="disabled")
+            self.toplu_yukle_buton.config(state="disabled")
+            self.disa_aktar_buton.config(state="disabled")
+            self.sinif_combobox.config(state="disabled")
+            self.bilgi_etiketi.config(text=mesaj)
+        else:
+            self.yukleme_cercevesi.pack_forget()
+            self.yukle_buton.config(state="normal")
+            self.toplu_yukle_buton.config(state="normal")
+            self.disa_aktar_buton.config(state="normal" if not self.df.empty else "disabled")
+            self.sinif_combobox.config(state="readonly" if len(self.calisma_alani) else "disabled")
+            self.yukleme_gorevi = None
+            if mesaj: self.bilgi_etiketi.config(text=mesaj)
+
+    def _yukleme_ilerledi(self, oran: float, mesaj: str) -> None:
+        self.yukleme_ilerleme["value"] = oran * 100
+        if mesaj: self.bilgi_etiketi.config(text=mesaj)
+
+    def yuklemeyi_iptal_et(self) -> None:
+        """Süren yüklemeyi/dışa aktarmayı iptal eder (iş bitse bile sonucu kullanılmaz)."""
+        if self.yukleme_gorevi and self.yukleme_gorevi.calisiyor:
+            print("Arka plan işlemi iptal ediliyor...")
+            self.yukleme_gorevi.iptal_et()
+            self._yukleme_iptal_edildi()
+
+    def _yukleme_iptal_edildi(self) -> None:
+        eski_mesaj = "Yükleme iptal edildi."
+        if not self.df.empty and self.mevcut_dosya_yolu:
+            eski_mesaj = self._yuklu_sinif_metni()
+        self._yukleme_arayuzu(False, eski_mesaj)
+
+    def _yuklu_sinif_metni(self) -> str:
+        return f"Yüklü: {os.path.basename(self.mevcut_dosya_yolu)} [{self.mevcut_sinif_adi}] ({len(self.df)} Öğr.)"
+
+    def _yukleme_hatasi(self, e: BaseException, dosya_yolu: Optional[str] = None) -> None:
+        print(f"veri_yukle_excel çağrılırken hata: {e}")
+        self._yukleme_iptal_edildi() # Önceki durumu geri yükle
+        if isinstance(e, veri_isleme.BaslikSatiriBulunamadi) and dosya_yolu:
+            # Başlık otomatik bulunamadı: satır sayısını sor ve (depoda olmadığı belli) Excel'den tekrar yükle
+            satir_atla = self._satir_atla_sor()
+            if satir_atla is not None:
+                self._yuklemeyi_baslat(dosya_yolu, satir_atla, depodan=False)
+            return
+        messagebox.showerror("Yükleme Hatası", f"Dosya işlenirken beklenmedik bir hata oluştu:\n{e}")
+
+    def _yukleme_tamamlandi(self, dosya_yolu: str, sonuc: Tuple[Optional[pd.DataFrame], Optional[str]]) -> None:
+        """Arka plan yüklemesi bittiğinde (Tk thread'inde) veriyi uygulamaya alır."""
+        df_yeni, sinif_adi = sonuc
+        self._yukleme_arayuzu(False)
 
         if df_yeni is None or not isinstance(df_yeni, pd.DataFrame):
+            self._yukleme_iptal_edildi() # Bilgi etiketini önceki haline döndür
             messagebox.showerror("Yükleme Başarısız", f"'{os.path.basename(dosya_yolu)}' yüklenemedi.\nKonsol çıktılarını ve dosya formatını kontrol edin.")
             return
 
-        # Başarılı yükleme
+        # Başarılı yükleme: önceki sınıf çalışma alanında kalır, yenisi aktif olur
+        self._aktif_sinifi_sakla()
         self.df = df_yeni
         self.mevcut_dosya_yolu = dosya_yolu
         self.mevcut_sinif_adi = sinif_adi if sinif_adi else "Bilinmeyen Sınıf"
         self.mevcut_ders = None
         self.secili_ogrenci_index = None
+        self.tam_hesap_gerekli = True
+        self.sanal_liste.sifirla() # Yeni sınıf listenin başından gösterilir
+
+        kayit = calisma_alani.SinifKaydi(self.df, dosya_yolu, self.mevcut_sinif_adi)
+        kayit.depoda = self._depoda_var_mi(dosya_yolu) # Depoya alınamadıysa değişiklikler dışa aktarılmalı
+        kurtarilan = self._gunlugu_uygula(kayit) # Önceki oturum çöktüyse bu sınıfta kalan değişiklikler
+        kayit.degisti = bool(kurtarilan)
+        kayit.arama_dizini = arama_dizini.AramaDizini.olustur(self.df) # Aramada tablo taranmasın
+        self.aktif_sinif_anahtari, cikarilanlar = self.calisma_alani.ekle(kayit)
+        self._sinif_listesini_guncelle()
+        self._gecmis_butonlarini_guncelle()
 
-        self.bilgi_etiketi.config(text=f"Yüklü: {os.path.basename(dosya_yolu)} [{self.mevcut_sinif_adi}] ({len(self.df)} Öğr.)")
+        self.bilgi_etiketi.config(text=self._yuklu_sinif_metni())
 
         dersler = list(self.ayarlar.get("ders_ayarlari", {}).keys())
         self.ders_combobox['values'] = dersler
@@ -307,84 +692,188 @@ class PerformansYonetimApp:
             self.ders_combobox.set("")
             self.ders_combobox.config(state="disabled")
             self.mevcut_ders = None
-            self.kriter_alanlarini_guncelle()
+            self.yenileme.kriterleri_isaretle()
             messagebox.showwarning("Ders Bulunamadı", "Ayarlarınızda tanımlı ders yok. Lütfen ders ekleyin.")
 
-        self.treeview_doldur()
+        self.yenileme.listeyi_isaretle()
         self.disa_aktar_buton.config(state="normal")
         self.edit_alanlarini_temizle()
-        messagebox.showinfo("Yükleme Başarılı", f"{len(self.df)} öğrenci verisi yüklendi.")
+        sinir_notu = self._cikarilanlari_bildir(cikarilanlar)
+        kurtarma_metni = f" Önceki oturumdan kurtarılan {kurtarilan} değişiklik uygulandı." if kurtarilan else ""
+        self.durum_bildir(f"{len(self.df)} öğrenci verisi yüklendi.{kurtarma_metni}{sinir_notu}")
         print("Dosya yükleme ve ilk arayüz güncelleme tamamlandı.")
 
+    # --- Sınıf Değiştirme (Çalışma Alanı) ---
+    def sinif_degisti(self, event=None) -> None:
+        """Sınıf Combobox'ı değiştiğinde bellekteki sınıfa dosyayı yeniden okumadan geçer."""
+        anahtar = self.sinif_combobox.get()
+        if not anahtar or anahtar == self.aktif_sinif_anahtari:
+            return
+        kayit = self.calisma_alani.getir(anahtar)
+        if kayit is None: # Bu arada çalışma alanından çıkarılmış
+            self._sinif_listesini_guncelle()
+            return
+
+        self._aktif_sinifi_sakla()
+        self.aktif_sinif_anahtari = anahtar
+        self.df = kayit.df
+        self.mevcut_dosya_yolu = kayit.dosya_yolu
+        self.mevcut_sinif_adi = kayit.sinif_adi
+        self.tam_hesap_gerekli = kayit.tam_hesap_gerekli
+        self.secili_ogrenci_index = None
+        self.sanal_liste.sifirla()
+        self.bilgi_etiketi.config(text=self._yuklu_sinif_metni())
+        self._gecmis_butonlarini_guncelle()
+
+        # Sınıfta en son seçili olan ders (ayarlardan silinmişse ilk ders)
+        dersler = list(self.ayarlar.get("ders_ayarlari", {}).keys())
+        ders = kayit.mevcut_ders if kayit.mevcut_ders in dersler else (dersler[0] if dersler else None)
+        if ders != kayit.mevcut_ders:
+            self.tam_hesap_gerekli = True
+        self.mevcut_ders = ders
+        self.ders_combobox.set(ders or "")
+        self.yenileme.kriterleri_isaretle()
+        self.yenileme.listeyi_isaretle()
+        self.edit_alanlarini_temizle()
+
+    def _aktif_sinifi_sakla(self) -> None:
+        """Aktif sınıfın verisini ve durumunu çalışma alanındaki kaydına yazar."""
+        kayit = self.calisma_alani.getir(self.aktif_sinif_anahtari, kullanildi=False)
+        if kayit is not None:
+            kayit.df = self.df
+            kayit.mevcut_ders = self.mevcut_ders
+            kayit.tam_hesap_gerekli = self.tam_hesap_gerekli
+
+    def _sinif_listesini_guncelle(self) -> None:
+        self.sinif_combobox['values'] = self.calisma_alani.anahtarlar()
+        self.sinif_combobox.set(self.aktif_sinif_anahtari or "")
+        self.sinif_combobox.config(state="readonly" if len(self.calisma_alani) else "disabled")
+
+    def _cikarilanlari_bildir(self, cikarilanlar: List[calisma_alani.SinifKaydi]) -> str:
+        """
+        Bellek sınırı nedeniyle çıkarılan sınıfları günlüğe yazar; sınır aşıldıysa durum çubuğu için not döndürür.
+
+        Dışa aktarılmamış değişikliği olan sınıflar çalışma alanından çıkarılmaz (bkz.
+        calisma_alani.CalismaAlani); sınır bu yüzden aşılırsa kullanıcıya dışa aktarması hatırlatılır.
+        """
+        for kayit in cikarilanlar: # Çıkarılanların değişiklikleri depoda; tekrar açılınca geri gelir
+            print(f"Bellekten çıkarıldı: {kayit.etiket}")
+        if not self.calisma_alani.sinir_asildi:
+            return ""
+        bekleyenler = [a for a in self.calisma_alani.anahtarlar()
+                       if self.calisma_alani.getir(a, kullanildi=False).disa_aktarilmamis]
+        return (f" Bellekte {len(self.calisma_alani)} sınıf var (sınır {self.calisma_alani.en_fazla_sinif}): "
+                f"{len(bekleyenler)} sınıfın değişiklikleri dışa aktarılana kadar bellekte tutuluyor.")
+
     # --- Ders Değiştirme İşlemi ---
     def ders_degisti(self, event=None) -> None:
         """Ders Combobox'ı değiştiğinde ilgili alanları günceller."""
         yeni_ders = self.ders_combobox.get()
         if yeni_ders and yeni_ders != self.mevcut_ders:
             self.mevcut_ders = yeni_ders
+            self.tam_hesap_gerekli = True
             print(f"Ders değiştirildi: {self.mevcut_ders}")
-            self.kriter_alanlarini_guncelle()
-            self.treeview_doldur() # Sütunlar değişmiş olabilir
+            self.yenileme.kriterleri_isaretle() # Liste sütunları da kriterlerle birlikte yenilenir
             self.edit_alanlarini_temizle()
 
     # --- Kriter Alanlarını Güncelleme ---
+    @olcum.olculen("kriter_paneli")
     def kriter_alanlarini_guncelle(self) -> None:
-        """Sağ paneldeki kriter notu giriş alanlarını günceller."""
-        for widget in self.kriter_cercevesi.winfo_children():
-            widget.destroy()
-        self.kriter_entry_widgets.clear()
+        """
+        Sağ paneldeki kriter notu giriş alanlarını dersin kriterlerine göre gösterir.
 
+        Her kriter tanımının paneli bir kez kurulur (bkz. kriter_panelleri); ders değişince
+        sadece görünen panel değişir. Kriterleri ayarlardan değişen dersin paneli yeniden kurulur.
+        """
+        self.kriter_entry_widgets.clear()
         if not self.mevcut_ders:
-            ttk.Label(self.kriter_cercevesi, text="Lütfen bir ders seçin.", font=("Arial", 9, "italic")).grid(row=0, column=0, columnspan=2, pady=5, sticky="w")
+            self.kriter_panelleri.mesaj_goster("Lütfen bir ders seçin.", font=("Arial", 9, "italic"), foreground="")
             return
 
-        print(f"'{self.mevcut_ders}' için kriter alanları oluşturuluyor...")
         try:
-            kriterler = self.ayarlar.get("ders_ayarlari", {}).get(self.mevcut_ders, {}).get("kriterler", [])
-            if not kriterler:
-                 ttk.Label(self.kriter_cercevesi, text="Bu ders için tanımlı kriter yok.", font=("Arial", 9, "italic")).grid(row=0, column=0, columnspan=2, pady=5, sticky="w")
-                 return
-
-            for i, kriter in enumerate(kriterler):
-                kriter_adi = kriter.get("ad")
-                kriter_agirlik = kriter.get("agirlik", 0.0) * 100
-                if not kriter_adi: continue
-
-                label_text = f"{kriter_adi} (%{kriter_agirlik:.1f}):"
-                label = ttk.Label(self.kriter_cercevesi, text=label_text)
-                label.grid(row=i, column=0, padx=5, pady=3, sticky="w")
-                entry = ttk.Entry(self.kriter_cercevesi, width=10)
-                entry.grid(row=i, column=1, padx=5, pady=3, sticky="w")
-                self.kriter_entry_widgets[kriter_adi] = entry
-            print(f"{len(self.kriter_entry_widgets)} kriter alanı oluşturuldu.")
+            ders_ayarlari = self.ayarlar.get("ders_ayarlari", {})
+            tanim = kriter_panelleri.kriter_tanimi(ders_ayarlari.get(self.mevcut_ders, {}).get("kriterler", []))
+            if not tanim:
+                 self.kriter_panelleri.mesaj_goster("Bu ders için tanımlı kriter yok.", font=("Arial", 9, "italic"), foreground="")
+            else:
+                 self.kriter_entry_widgets.update(self.kriter_panelleri.goster(tanim))
+                 for entry in self.kriter_entry_widgets.values():
+                      entry.delete(0, tk.END) # Panel en son gösterildiğindeki not kalmasın
+            # Kriterleri değişen/silinen derslerin eski panelleri
+            self.kriter_panelleri.eskileri_at(kriter_panelleri.kriter_tanimi(ayar.get("kriterler", []))
+                                              for ayar in ders_ayarlari.values())
         except Exception as e:
-             ttk.Label(self.kriter_cercevesi, text=f"Kriterler yüklenirken hata: {e}", foreground="red").grid(row=0, column=0, columnspan=2, pady=5, sticky="w")
+             self.kriter_entry_widgets.clear()
+             self.kriter_panelleri.mesaj_goster(f"Kriterler yüklenirken hata: {e}", font="", foreground="red")
              print(f"Kriter alanları güncellenirken hata: {e}")
 
-    # --- Treeview Doldurma ---
-    def treeview_doldur(self) -> None:
-        """DataFrame'deki verileri Treeview'e yükler."""
-        print("Treeview dolduruluyor...")
-        try: # Önce temizle
-            for item in self.tree.get_children():
-                self.tree.delete(item)
-        except tk.TclError: pass # Widget yoksa hata vermesin
+    # --- Arayüz Yenileme ---
+    def _yenilemeyi_uygula(self, istek: yenileme.Yenileme) -> None:
+        """Boşta döngüde birikmiş yenilemeyi tek seferde çizer (bkz. yenileme.YenilemeZamanlayici)."""
+        if istek.kriterler:
+            self.kriter_alanlarini_guncelle()
+        # Sıralanan sütun veya (filtre varken) ad/numara değiştiyse satırların yeri/varlığı değişir
+        sira_degisti = self.siralama_durumu is not None and self.siralama_durumu[0] in istek.sutunlar
+        filtre_degisti = bool(self.arama_var.get().strip()) and not istek.sutunlar.isdisjoint(arama_dizini.DIZINLI_SUTUNLAR)
+        # Ders değişti ama listedeki sütunlar aynı kaldıysa (örn. aynı kriterlere sahip dersler) liste kurulmaz
+        sutunlar_degisti = istek.kriterler and (self.df.empty or self._gorunecek_sutunlar() != self.tree_sutunlari)
+        if sutunlar_degisti or istek.tum_liste or sira_degisti or filtre_degisti:
+            self.treeview_doldur()
+            if istek.basa_don:
+                self.sanal_liste.kaydir(0)
+            if self.sanal_liste.secili_iid is not None:
+                self.sanal_liste.gor(self.sanal_liste.secili_iid)
+        elif istek.satirlar:
+            self.treeview_doldur(set(istek.satirlar))
 
+    # --- Treeview Doldurma ---
+    @olcum.olculen("cizim")
+    def treeview_doldur(self, kirli_indeksler: Optional[Set[int]] = None) -> None:
+        """
+        DataFrame'deki verileri Treeview'e yükler (sanal liste, satırlar görününce doldurulur).
+
+        Treeview baştan kurulmaz: yeni görüntü modeli mevcut olanla karşılaştırılır, sadece
+        değişen sütunlar ve hücreler güncellenir; kaydırma konumu ve seçim korunur.
+        kirli_indeksler verilirse (ve sütunlar değişmediyse) sadece o satırlar yenilenir.
+        """
         if self.df.empty:
-            print("DataFrame boş.")
+            self.sanal_liste.veri_ayarla([], None)
+            self.arama_sonuc_etiketi.config(text="")
             return
 
-        # Sütunları belirle
-        temel_sutunlar = ["Öğrenci No", "Ad Soyad", "Y1", "Y2", "PROJE"]
+        gorunecek_sutunlar = self._gorunecek_sutunlar()
+        mevcut_kriter_adlari = list(self.kriter_entry_widgets.keys()) # Sağ paneldeki aktif kriterler
+        sutunlar_degisti = gorunecek_sutunlar != self.tree_sutunlari
+        if sutunlar_degisti:
+            self._tree_sutunlarini_ayarla(gorunecek_sutunlar, mevcut_kriter_adlari)
+
+        if kirli_indeksler is not None and not sutunlar_degisti:
+            # Sadece değişen öğrencilerin satırları
+            self.sanal_liste.satirlari_yenile(str(index) for index in kirli_indeksler)
+        else:
+            # Tüm görüntü modeli (iid = df index'i); görünen satırlar farka göre güncellenir
+            self.sanal_liste.veri_ayarla(self._gorunen_iidler(), self._satir_degerleri)
+
+    def _gorunecek_sutunlar(self) -> List[str]:
+        """Listede gösterilecek sütunlar: temel sütunlar, hesaplananlar ve seçili dersin kriterleri."""
+        temel_sutunlar = [toplu_yukleme.SINIF_SUTUNU, "Öğrenci No", "Ad Soyad", "Y1", "Y2", "PROJE"]
         hesaplama_sutunlari = ["Hesaplanan Performans", "Ortalama", "SONUÇ"]
         gorunecek_sutunlar = [col for col in temel_sutunlar if col in self.df.columns]
         gorunecek_sutunlar += [col for col in hesaplama_sutunlari if col in self.df.columns]
 
-        mevcut_kriter_adlari = list(self.kriter_entry_widgets.keys()) # Sağ paneldeki aktif kriterler
-        for kriter_adi in mevcut_kriter_adlari:
+        for kriter_adi in self.kriter_entry_widgets: # Sağ paneldeki aktif kriterler
              if kriter_adi in self.df.columns and kriter_adi not in gorunecek_sutunlar:
                   gorunecek_sutunlar.append(kriter_adi)
+        return gorunecek_sutunlar
+
+    def _tree_sutunlarini_ayarla(self, gorunecek_sutunlar: List[str], kriter_adlari: List[str]) -> None:
+        """Treeview sütunlarını değiştirir; kalan sütunların (kullanıcı) genişlikleri korunur."""
+        genislikler = {}
+        for col in self.tree_sutunlari:
+            try: genislikler[col] = self.tree.column(col, "width")
+            except tk.TclError: pass
 
+        self.tree_sutunlari = gorunecek_sutunlar
         self.tree["columns"] = gorunecek_sutunlar
         self.tree["displaycolumns"] = gorunecek_sutunlar
 
@@ -392,34 +881,141 @@ class PerformansYonetimApp:
         self.tree.heading("#0", text="", anchor='center')
         self.tree.column("#0", width=0, stretch=tk.NO)
         for col in gorunecek_sutunlar:
-            self.tree.heading(col, text=col, anchor='center')
+            self.tree.heading(col, text=col, anchor='center', command=lambda c=col: self.sutuna_gore_sirala(c))
             width = 100
             if col == "Ad Soyad": width = 180
             elif col == "Öğrenci No": width = 80
             elif col == "SONUÇ": width = 70
             elif col in ["Ortalama", "Hesaplanan Performans"]: width = 90
-            elif col in ["Y1", "Y2", "PROJE"] or col in mevcut_kriter_adlari: width = 65
-            self.tree.column(col, anchor='center', width=width, minwidth=40, stretch=True)
-
-        # Verileri ekle
-        print(f"{len(self.df)} öğrenci Treeview'e ekleniyor...")
-        for index, row in self.df.iterrows():
-            values_to_insert = []
-            for col in gorunecek_sutunlar:
-                value = row.get(col, '')
-                if pd.isna(value): value = ''
-                elif isinstance(value, float) and col in ["Ortalama", "Hesaplanan Performans"]: value = f"{value:.2f}"
-                elif isinstance(value, (int, float)): value = int(value) # Diğerlerini tamsayı yap
-                values_to_insert.append(value)
-            try:
-                 self.tree.insert(parent='', index='end', iid=index, text="", values=values_to_insert)
-            except Exception as insert_e:
-                 print(f"HATA: Treeview ekleme (Index: {index}): {insert_e}")
-        print("Treeview doldurma tamamlandı.")
+            elif col in ["Y1", "Y2", "PROJE"] or col in kriter_adlari: width = 65
+            self.tree.column(col, anchor='center', width=genislikler.get(col, width), minwidth=40, stretch=True)
+        self._siralama_basliklarini_guncelle()
+
+    # --- Sıralama ---
+    def sutuna_gore_sirala(self, sutun: str) -> None:
+        """
+        Sütun başlığına tıklanınca: artan -> azalan -> tablo sırası.
+        Satırlar yeniden oluşturulmaz; sanal liste var olan öğeleri yeni sıraya taşır.
+        """
+        if self.siralama_durumu is None or self.siralama_durumu[0] != sutun:
+            self.siralama_durumu = (sutun, False)
+        elif not self.siralama_durumu[1]:
+            self.siralama_durumu = (sutun, True)
+        else:
+            self.siralama_durumu = None
+        self._siralama_basliklarini_guncelle()
+        if not self.df.empty:
+            self.yenileme.listeyi_isaretle()
+
+    def _siralama_basliklarini_guncelle(self) -> None:
+        """Sıralanan sütunun başlığına yön oku koyar."""
+        for col in self.tree_sutunlari:
+            ok = ""
+            if self.siralama_durumu is not None and self.siralama_durumu[0] == col:
+                ok = " ▼" if self.siralama_durumu[1] else " ▲"
+            self.tree.heading(col, text=col + ok)
+
+    def _siralama_konumlari(self) -> Optional[np.ndarray]:
+        """Aktif sıralamaya göre satır konumları (iloc); sıralama yoksa None (tablo sırası)."""
+        if self.siralama_durumu is None or self.siralama_durumu[0] not in self.df.columns:
+            return None
+        kayit = self.calisma_alani.getir(self.aktif_sinif_anahtari, kullanildi=False)
+        if kayit is None:
+            return None
+        sutun, azalan = self.siralama_durumu
+        return kayit.siralama_onbellegi.konumlar(self.df, sutun, azalan)
+
+    def _satir_degerleri(self, iid: str) -> List[Any]:
+        """Sanal liste için bir öğrencinin Treeview hücre değerlerini hazırlar."""
+        index = int(iid)
+        values_to_insert = []
+        for col in self.tree_sutunlari:
+            value = self.df.at[index, col] if col in self.df.columns else ''
+            if pd.isna(value): value = ''
+            elif pd.api.types.is_float(value) and col in ["Ortalama", "Hesaplanan Performans"]: value = f"{value:.2f}"
+            elif pd.api.types.is_number(value): value = int(value) # Diğerlerini tamsayı yap
+            values_to_insert.append(value)
+        return values_to_insert
+
+    # --- Arama / Filtre ---
+    def _arama_dizini(self) -> Optional[arama_dizini.AramaDizini]:
+        """Aktif sınıfın arama dizini (yoksa kurulur ve sınıf kaydında saklanır)."""
+        kayit = self.calisma_alani.getir(self.aktif_sinif_anahtari, kullanildi=False)
+        if kayit is None:
+            return None
+        if kayit.arama_dizini is None:
+            kayit.arama_dizini = arama_dizini.AramaDizini.olustur(self.df)
+        return kayit.arama_dizini
+
+    def _gorunen_iidler(self) -> List[str]:
+        """Listelenecek satırlar: aktif sıralamayla (yoksa tablo sırasıyla), arama kutusu doluysa sadece eşleşenler."""
+        konumlar = self._siralama_konumlari()
+        sorgu = self.arama_var.get()
+        dizin = self._arama_dizini() if sorgu.strip() else None
+        eslesen = dizin.ara(sorgu) if dizin is not None else None
+        if eslesen is None:
+            self.arama_sonuc_etiketi.config(text="")
+        elif len(eslesen) * 8 < len(self.df):
+            # Az sonuç: tabloyu dolaşmak yerine eşleşenlerin konumları bulunup sıralanır
+            secilen = self.df.index.get_indexer(list(eslesen))
+            if konumlar is None:
+                konumlar = np.sort(secilen)
+            else:
+                sirasi = np.empty(len(konumlar), dtype=np.int64) # satır konumu -> listedeki yeri
+                sirasi[konumlar] = np.arange(len(konumlar))
+                konumlar = secilen[np.argsort(sirasi[secilen])]
+        else:
+            tumu = konumlar if konumlar is not None else np.arange(len(self.df))
+            konumlar = tumu[self.df.index.isin(list(eslesen))[tumu]]
+        if eslesen is not None:
+            self.arama_sonuc_etiketi.config(text=f"{len(konumlar)} / {len(self.df)}")
+        indeksler = self.df.index if konumlar is None else self.df.index[konumlar]
+        return [str(index) for index in indeksler.tolist()]
+
+    def _filtreyi_uygula(self) -> None:
+        """
+        Arama kutusu her değiştiğinde listeyi daraltır; liste başa döner, seçili öğrenci görünür kalır.
+        Hızlı yazılan harfler boşta döngüde tek bir çizimde birleşir.
+        """
+        if not self.df.empty:
+            self.yenileme.listeyi_isaretle(basa_don=True)
+
+    def aramayi_temizle(self) -> None:
+        self.arama_var.set("")
+        self.arama_entry.focus_set()
+
+    def aramaya_odaklan(self, event=None):
+        """Ctrl+F: arama kutusuna geçer ve içindeki metni seçer."""
+        self.arama_entry.focus_set()
+        self.arama_entry.select_range(0, tk.END)
+        return "break"
+
+    def _aramadan_sec(self, event=None):
+        """
+        Arama kutusunda Enter/aşağı ok: numara tam eşleşiyorsa o öğrenciyi, yoksa listedeki
+        ilk öğrenciyi seçer ve klavye odağını listeye verir.
+        """
+        self.yenileme.bosalt() # Son yazılan harfin filtresi henüz çizilmemiş olabilir
+        iidler = self.sanal_liste.iidler
+        if not iidler:
+            return "break"
+        iid = iidler[0]
+        sorgu = self.arama_var.get().strip()
+        dizin = self._arama_dizini() if sorgu.isdigit() else None
+        if dizin is not None:
+            gorunen = [str(index) for index in dizin.numara_ile(sorgu)
+                       if self.sanal_liste.konum(str(index)) is not None]
+            if gorunen:
+                iid = min(gorunen, key=self.sanal_liste.konum)
+        self.sanal_liste.secimi_ayarla(iid, bildir=True)
+        self.tree.focus_set()
+        return "break"
 
     # --- Öğrenci Seçme ---
+    @olcum.olculen("secim")
     def ogrenci_secildi(self, event=None) -> None:
         """Treeview'de öğrenci seçildiğinde sağ paneli doldurur."""
+        self.yenileme.bosalt() # Kriter paneli yeniden kurulacaksa önce kurulsun, sonra doldurulsun
         selected_items = self.tree.selection()
         if not selected_items:
             self.edit_alanlarini_temizle()
@@ -428,7 +1024,6 @@ class PerformansYonetimApp:
         try:
             selected_iid_str = selected_items[0]
             self.secili_ogrenci_index = int(selected_iid_str)
-            print(f"Öğrenci seçildi. Index: {self.secili_ogrenci_index}")
 
             if self.secili_ogrenci_index not in self.df.index:
                  messagebox.showerror("Hata", "Seçilen öğrenci index'i geçersiz.")
@@ -453,7 +1048,6 @@ class PerformansYonetimApp:
                  widget.insert(0, str(int(val)) if pd.notna(val) else '')
 
             self.kaydet_buton.config(state="normal")
-            print("Düzenleme alanları dolduruldu.")
 
         except Exception as e:
             messagebox.showerror("Hata", f"Öğrenci bilgileri yüklenirken hata oluştu:\n{e}")
@@ -465,7 +1059,6 @@ class PerformansYonetimApp:
     # --- Düzenleme Alanlarını Temizleme ---
     def edit_alanlarini_temizle(self) -> None:
         """Sağ paneldeki düzenleme alanlarını temizler."""
-        print("Düzenleme alanları temizleniyor.")
         self.no_etiket.config(text="-")
         self.ad_etiket.config(text="-")
         self.y1_entry.delete(0, tk.END)
@@ -475,21 +1068,25 @@ class PerformansYonetimApp:
             widget.delete(0, tk.END)
         self.kaydet_buton.config(state="disabled")
         self.secili_ogrenci_index = None
-        selection = self.tree.selection()
-        if selection: self.tree.selection_remove(selection)
+        self.sanal_liste.secimi_temizle()
 
     # --- Hesaplama ve Kaydetme ---
-    def hesapla_ve_kaydet(self) -> None:
-        """Girilen notları DataFrame'e kaydeder ve hesaplamaları yapar."""
+    def hesapla_ve_kaydet(self) -> bool:
+        """
+        Girilen notları DataFrame'e kaydeder ve hesaplamaları yapar.
+        Onay ve giriş hataları durum çubuğunda gösterilir (modal pencere açılmaz).
+
+        Returns:
+            bool: Notlar kaydedildiyse True.
+        """
         # Kontroller
         if self.secili_ogrenci_index is None or self.secili_ogrenci_index not in self.df.index:
-            messagebox.showwarning("Uyarı", "Lütfen önce geçerli bir öğrenci seçin.")
-            return
+            self.durum_bildir("Lütfen önce geçerli bir öğrenci seçin.", hata=True)
+            return False
         if not self.mevcut_ders:
-            messagebox.showwarning("Uyarı", "Lütfen bir ders seçin.")
-            return
+            self.durum_bildir("Lütfen bir ders seçin.", hata=True)
+            return False
 
-        print(f"Hesapla ve Kaydet başlatıldı. Index: {self.secili_ogrenci_index}, Ders: {self.mevcut_ders}")
         try:
             # Girilen değerleri al ve doğrula
             girilen_notlar = {}
@@ -504,67 +1101,329 @@ class PerformansYonetimApp:
                         raise ValueError("Not 0-100 arasında olmalıdır.")
                     girilen_notlar[ad] = val_int
                 except ValueError:
-                    messagebox.showerror("Geçersiz Giriş", f"'{ad}' notu geçersiz (0-100 tam sayı olmalı).")
-                    widget.focus()
-                    return
-
-            # Eksik kriter sütunlarını DF'ye ekle
-            for kriter_adi in self.kriter_entry_widgets.keys():
-                if kriter_adi not in self.df.columns:
-                    print(f"'{kriter_adi}' sütunu DataFrame'e ekleniyor...")
-                    eksik_veri_degeri = self.ayarlar.get("genel_ayarlar", {}).get("eksik_veri_degeri", 0)
-                    self.df[kriter_adi] = eksik_veri_degeri
-                    self.df[kriter_adi] = self.df[kriter_adi].astype(int)
-
-            # Değerleri DataFrame'e yaz
-            print(f"DataFrame'e yazılıyor (Index: {self.secili_ogrenci_index}): {girilen_notlar}")
-            for sutun, deger in girilen_notlar.items():
-                self.df.loc[self.secili_ogrenci_index, sutun] = deger
-
-            # Hesaplamaları yap
-            print("Hesaplamalar yapılıyor...")
-            try:
-                # hesaplamalar.py'daki güncel fonksiyonu kullan
-                self.df = hesaplamalar.tum_veriyi_hesapla(self.df, self.ayarlar, self.mevcut_ders)
-                print("Hesaplamalar tamamlandı.")
-            except hesaplamalar.AyarHatasi as e:
-                messagebox.showerror("Hesaplama Hatası", f"Hesaplama yapılamadı (Ayar Hatası):\n{e}")
-                return
-            except Exception as e:
-                messagebox.showerror("Hesaplama Hatası", f"Hesaplama sırasında beklenmedik hata:\n{e}")
-                import traceback
-                traceback.print_exc()
-                return
-
-            # Treeview'i güncelle
-            print("Treeview güncelleniyor...")
-            # Seçili olan index'i sakla, doldurmadan sonra tekrar seç
-            kaydedilen_index = self.secili_ogrenci_index
-            self.treeview_doldur()
+                    self.durum_bildir(f"'{ad}' notu geçersiz (0-100 tam sayı olmalı). Kaydedilmedi.", hata=True)
+                    widget.focus_set()
+                    widget.select_range(0, tk.END)
+                    return False
 
-            # Öğrenciyi tekrar seç
-            try:
-                if kaydedilen_index in self.df.index: # Hala geçerliyse
-                    self.tree.selection_set(kaydedilen_index)
-                    self.tree.focus(kaydedilen_index)
-                    self.tree.see(kaydedilen_index)
-                    print(f"Öğrenci (index={kaydedilen_index}) tekrar seçildi.")
-            except Exception as e:
-                print(f"Öğrenci tekrar seçilemedi (önemsiz): {e}")
+            self._kriter_sutunlarini_ekle(self.kriter_entry_widgets.keys())
+            if self._notlari_uygula({self.secili_ogrenci_index: girilen_notlar}) is None:
+                return False
 
-            messagebox.showinfo("Başarılı", "Değişiklikler kaydedildi ve sonuçlar güncellendi.")
+            ogrenci = self.df.loc[self.secili_ogrenci_index]
+            self.durum_bildir(f"Kaydedildi: {ogrenci.get('Ad Soyad', '')} ({ogrenci.get('Öğrenci No', '-')})")
+            return True
 
         except Exception as e:
             messagebox.showerror("Beklenmedik Hata", f"Kaydetme/Hesaplama sırasında genel hata:\n{e}")
             import traceback
             traceback.print_exc()
+            return False
+
+    # --- Klavyeyle Hızlı Giriş ---
+    def _not_alanlari(self) -> List[ttk.Entry]:
+        """Not giriş alanları, Tab sırasıyla (yazılılar, proje, dersin kriterleri)."""
+        return [self.y1_entry, self.y2_entry, self.proje_entry] + list(self.kriter_entry_widgets.values())
+
+    def _not_alani_kisayollari(self, entry: ttk.Entry) -> None:
+        """Not alanı kısayolları: Enter kaydet, Tab/Shift+Tab alanlar arası, Esc listeye dön."""
+        entry.bind("<Return>", lambda e: self._enter_ile_kaydet(1))
+        entry.bind("<KP_Enter>", lambda e: self._enter_ile_kaydet(1))
+        entry.bind("<Shift-Return>", lambda e: self._enter_ile_kaydet(-1))
+        entry.bind("<Tab>", lambda e: self._not_alanina_gec(e.widget, 1))
+        entry.bind("<Shift-Tab>", lambda e: self._not_alanina_gec(e.widget, -1))
+        entry.bind("<ISO_Left_Tab>", lambda e: self._not_alanina_gec(e.widget, -1)) # X11'de Shift+Tab
+        entry.bind("<Escape>", lambda e: self.tree.focus_set())
+        entry.bind("<FocusIn>", lambda e: e.widget.select_range(0, tk.END)) # Yazılan not eskisinin yerine geçsin
+
+    def _not_alanina_gec(self, widget: tk.Widget, adim: int) -> str:
+        """Tab: sonraki (Shift+Tab: önceki) not alanına geçer; sondan başa döner."""
+        alanlar = self._not_alanlari()
+        if widget in alanlar:
+            hedef = alanlar[(alanlar.index(widget) + adim) % len(alanlar)]
+            hedef.focus_set()
+            hedef.select_range(0, tk.END)
+        return "break"
+
+    def _komsu_ogrenci(self, adim: int) -> Optional[str]:
+        """Listede seçili öğrenciden adim kadar sonraki öğrencinin iid'i (liste dışına çıkılırsa None)."""
+        self.yenileme.bosalt() # Görünen sıra güncel olsun
+        konum = self.sanal_liste.konum(str(self.secili_ogrenci_index))
+        if konum is None:
+            return None
+        yeni = konum + adim
+        return self.sanal_liste.iidler[yeni] if 0 <= yeni < len(self.sanal_liste.iidler) else None
+
+    def _enter_ile_kaydet(self, adim: int) -> str:
+        """Enter: notları kaydeder; hızlı giriş açıksa sonraki (Shift+Enter: önceki) öğrenciye geçer."""
+        hizli = self.hizli_giris_var.get()
+        # Hedef kayıttan önce belirlenir: kaydedilen not sıralanan sütundaysa satır yer değiştirebilir
+        hedef = self._komsu_ogrenci(adim) if hizli else None
+        if not self.hesapla_ve_kaydet() or not hizli:
+            return "break"
+        if hedef is None:
+            self.durum_bildir(f"Kaydedildi. Listenin {'sonuna' if adim > 0 else 'başına'} gelindi.")
+            return "break"
+        self.sanal_liste.secimi_ayarla(hedef, bildir=True)
+        self.y1_entry.focus_set()
+        self.y1_entry.select_range(0, tk.END)
+        return "break"
+
+    def _duzenlemeye_gec(self, event=None) -> str:
+        """Listede Enter: seçili öğrencinin ilk not alanına geçer."""
+        if self.secili_ogrenci_index is not None:
+            self.y1_entry.focus_set()
+            self.y1_entry.select_range(0, tk.END)
+        return "break"
+
+    # --- Durum Çubuğu ---
+    def durum_bildir(self, mesaj: str, hata: bool = False) -> None:
+        """Mesajı durum çubuğunda gösterir (modal değil); DURUM_MESAJI_SURESI_MS sonra silinir."""
+        if self._durum_zamanlayici is not None:
+            self.root.after_cancel(self._durum_zamanlayici)
+        self.durum_cubugu.config(text=mesaj, foreground="red" if hata else "")
+        if hata:
+            self.root.bell()
+        self._durum_zamanlayici = self.root.after(DURUM_MESAJI_SURESI_MS, self._durumu_temizle)
+
+    def _durumu_temizle(self) -> None:
+        self._durum_zamanlayici = None
+        self.durum_cubugu.config(text="", foreground="")
+
+    def _kriter_sutunlarini_ekle(self, kriter_adlari) -> None:
+        """DataFrame'de olmayan kriter sütunlarını eksik veri değeriyle ekler."""
+        for kriter_adi in kriter_adlari:
+            if kriter_adi not in self.df.columns:
+                print(f"'{kriter_adi}' sütunu DataFrame'e ekleniyor...")
+                eksik_veri_degeri = self.ayarlar.get("genel_ayarlar", {}).get("eksik_veri_degeri", 0)
+                veri_semasi.sutun_ekle(self.df, kriter_adi, eksik_veri_degeri)
+
+    def _notlari_uygula(self, yeni_degerler: Dict[int, Dict[str, Any]], gecmise_ekle: bool = True) -> Optional[Set[int]]:
+        """
+        Hücre değişikliklerini uygular: günlük, DataFrame, geri alma geçmişi, satır bazlı hesaplama,
+        depo ve Treeview. Kaydetme, geri alma ve yineleme bu yoldan geçer.
+
+        Args:
+            yeni_degerler (dict): {df index: {sütun: yeni değer}}
+            gecmise_ekle (bool): Değişiklikler geri alma geçmişine yeni bir adım olarak eklensin mi.
+
+        Returns:
+            Optional[Set[int]]: Yenilenmek üzere işaretlenen satırlar; hesaplama yapılamadıysa None.
+        """
+        # Eski değerler sütun başına tek seferde okunur (toplu girişte binlerce hücre olabilir)
+        sutunlara_gore: Dict[str, Dict[int, Any]] = {}
+        for index, degerler in yeni_degerler.items():
+            for sutun, deger in degerler.items():
+                sutunlara_gore.setdefault(sutun, {})[index] = deger
+        degisiklikler: List[geri_al.HucreDegisikligi] = []
+        for sutun, degerler in sutunlara_gore.items():
+            eskiler = self.df.loc[list(degerler), sutun].tolist() if sutun in self.df.columns else [None] * len(degerler)
+            degisiklikler.extend(geri_al.HucreDegisikligi(index, sutun, eski, yeni)
+                                 for (index, yeni), eski in zip(degerler.items(), eskiler)
+                                 if not geri_al.ayni_deger(eski, yeni))
+        degisen_satirlar = sorted({d.index for d in degisiklikler})
+
+        # Değişiklikleri DataFrame'den önce günlüğe yaz (çökmede kurtarılabilsin)
+        if "Öğrenci No" in self.df.columns and self.mevcut_dosya_yolu and degisiklikler:
+            try:
+                numaralar = self.df.loc[degisen_satirlar, "Öğrenci No"].to_dict()
+                siniflar = self._gunluk_siniflari(degisen_satirlar)
+                self.gunluk.toplu_ekle((siniflar[d.index], self.mevcut_ders, numaralar[d.index], d.sutun, d.eski, d.yeni)
+                                       for d in degisiklikler)
+            except (OSError, ValueError) as e:
+                print(f"HATA: Değişiklik günlüğüne yazılamadı: {e}")
+
+        # Değerleri DataFrame'e sütun sütun yaz (sütun tipleri korunur, bkz. veri_semasi)
+        sutunlara_gore = {}
+        for d in degisiklikler:
+            sutunlara_gore.setdefault(d.sutun, {})[d.index] = d.yeni
+        for sutun, degerler in sutunlara_gore.items():
+            veri_semasi.sutuna_yaz(self.df, list(degerler), sutun, list(degerler.values()))
+        aktif_kayit = self.calisma_alani.getir(self.aktif_sinif_anahtari, kullanildi=False)
+        if aktif_kayit is not None:
+            if degisiklikler: aktif_kayit.degisti = True
+            if gecmise_ekle: aktif_kayit.gecmis.ekle(degisiklikler)
+        self._gecmis_butonlarini_guncelle()
+
+        # Sıralama anahtarları sadece değişen sütunlar için atılır (hesaplanan sütunlar aşağıda)
+        if aktif_kayit is not None:
+            aktif_kayit.siralama_onbellegi.gecersiz_kil(sutunlara_gore)
+
+        # Arama dizininde sadece adı/numarası değişen satırlar yeniden dizinlenir
+        dizinlenecekler = sorted({d.index for d in degisiklikler if d.sutun in arama_dizini.DIZINLI_SUTUNLAR})
+        if dizinlenecekler and aktif_kayit is not None and aktif_kayit.arama_dizini is not None:
+            for index, satir in self.df.loc[dizinlenecekler].iterrows():
+                aktif_kayit.arama_dizini.guncelle(index, satir.get(veri_semasi.NUMARA_SUTUNU),
+                                                  satir.get(arama_dizini.AD_SUTUNU))
+
+        # Hesaplamaları yap (gerekmedikçe sadece değişen satırlar)
+        try:
+            hesaplanacaklar = None if self.tam_hesap_gerekli else list(yeni_degerler)
+            kirli_indeksler = artimli_hesaplama.satirlari_hesapla(self.df, self.ayarlar, self.mevcut_ders, hesaplanacaklar)
+            self.tam_hesap_gerekli = False
+        except hesaplamalar.AyarHatasi as e:
+            messagebox.showerror("Hesaplama Hatası", f"Hesaplama yapılamadı (Ayar Hatası):\n{e}")
+            return None
+        except Exception as e:
+            messagebox.showerror("Hesaplama Hatası", f"Hesaplama sırasında beklenmedik hata:\n{e}")
+            import traceback
+            traceback.print_exc()
+            return None
+
+        # Değişen öğrencilerin satırları depoya upsert olarak (tek işlemde) yazılır
+        kimlik = self._depo_kimligi()
+        if kimlik is not None and degisen_satirlar:
+            try:
+                self.not_deposu.satirlari_yaz(kimlik, self.mevcut_ders, self.df.loc[degisen_satirlar].to_dict("records"))
+            except Exception as e:
+                print(f"HATA: Not depoya yazılamadı: {e}")
+                messagebox.showwarning("Depo Hatası", f"Not kaydedildi ancak depoya yazılamadı:\n{e}\n"
+                                       "Değişiklikleri kaybetmemek için dışa aktarın.")
+
+        # Treeview'de sadece değişen satırlar (boşta döngüde) güncellenir; seçim ve kaydırma korunur
+        kirli_indeksler = set(kirli_indeksler) | set(yeni_degerler)
+        degisen_sutunlar = set(sutunlara_gore)
+        if kirli_indeksler:
+            degisen_sutunlar.update(artimli_hesaplama.HESAPLAMA_SUTUNLARI)
+            if aktif_kayit is not None:
+                aktif_kayit.siralama_onbellegi.gecersiz_kil(artimli_hesaplama.HESAPLAMA_SUTUNLARI)
+        self.yenileme.satirlari_isaretle(kirli_indeksler, degisen_sutunlar)
+        return kirli_indeksler
+
+    # --- Toplu Not Girişi ---
+    def toplu_not_girisi_ui(self) -> None:
+        """Yapıştırılan sütun bloğu veya CSV ile birden çok öğrencinin notunu tek işlemde girer."""
+        if self.df.empty or not self.mevcut_ders:
+            messagebox.showwarning("Uyarı", "Lütfen önce bir sınıf yükleyin ve ders seçin.")
+            return
+        if self.yukleme_gorevi is not None:
+            return
+        izinli = toplu_giris.izinli_sutunlar(self.ayarlar, self.mevcut_ders)
+
+        top = Toplevel(self.root)
+        top.title(f"Toplu Not Girişi - {self.mevcut_ders}")
+        top.geometry("560x420")
+        top.minsize(420, 300)
+        top.transient(self.root)
+        top.grab_set()
+
+        ttk.Label(top, justify=tk.LEFT, wraplength=520, text=(
+            "Excel'den kopyaladığınız sütunları yapıştırın veya bir CSV dosyası seçin. İlk satır başlık olmalı "
+            "ve 'Öğrenci No' sütununu içermeli. Boş hücreler değiştirilmez.\n"
+            f"Girilebilecek sütunlar: {', '.join(izinli)}")).pack(fill=tk.X, padx=10, pady=(10, 5))
+        metin_cercevesi = ttk.Frame(top)
+        metin_cercevesi.pack(fill=tk.BOTH, expand=True, padx=10)
+        metin = tk.Text(metin_cercevesi, wrap="none", undo=True, height=12)
+        kaydirma = ttk.Scrollbar(metin_cercevesi, orient=tk.VERTICAL, command=metin.yview)
+        metin.configure(yscrollcommand=kaydirma.set)
+        kaydirma.pack(side=tk.RIGHT, fill=tk.Y)
+        metin.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        metin.insert("1.0", "Öğrenci No\t" + "\t".join(izinli[3:] or izinli) + "\n")
+        metin.focus_set()
+
+        def panodan_yapistir():
+            try:
+                metin.insert(tk.END, self.root.clipboard_get())
+            except tk.TclError:
+                messagebox.showwarning("Pano Boş", "Panoda yapıştırılacak metin yok.", parent=top)
+
+        def dosyadan_oku():
+            dosya_yolu = filedialog.askopenfilename(parent=top, title="Not Dosyası Seçin",
+                                                    filetypes=[("CSV / Metin", "*.csv *.txt *.tsv"), ("Tüm Dosyalar", "*.*")])
+            if not dosya_yolu:
+                return
+            try:
+                girdi = toplu_giris.dosyadan_oku(dosya_yolu)
+            except (toplu_giris.TopluGirisHatasi, OSError) as e:
+                messagebox.showerror("Dosya Okunamadı", str(e), parent=top)
+                return
+            if self._toplu_girisi_uygula(girdi, izinli, top):
+                top.destroy()
+
+        def uygula():
+            try:
+                girdi = toplu_giris.metni_ayristir(metin.get("1.0", tk.END))
+            except toplu_giris.TopluGirisHatasi as e:
+                messagebox.showerror("Geçersiz Girdi", str(e), parent=top)
+                return
+            if self._toplu_girisi_uygula(girdi, izinli, top):
+                top.destroy()
+
+        buton_cercevesi = ttk.Frame(top)
+        buton_cercevesi.pack(fill=tk.X, padx=10, pady=10)
+        ttk.Button(buton_cercevesi, text="Panodan Yapıştır", command=panodan_yapistir).pack(side=tk.LEFT)
+        ttk.Button(buton_cercevesi, text="CSV Dosyasından...", command=dosyadan_oku).pack(side=tk.LEFT, padx=5)
+        ttk.Button(buton_cercevesi, text="İptal", command=top.destroy).pack(side=tk.RIGHT)
+        ttk.Button(buton_cercevesi, text="Uygula", command=uygula).pack(side=tk.RIGHT, padx=5)
+
+    def _toplu_girisi_uygula(self, girdi: pd.DataFrame, izinli: List[str], pencere: tk.Toplevel) -> bool:
+        """Toplu girdiyi doğrular ve tek işlem olarak uygular. Uygulandıysa True döner."""
+        try:
+            sonuc = toplu_giris.dogrula(girdi, self.df, izinli)
+        except toplu_giris.TopluGirisHatasi as e:
+            messagebox.showerror("Toplu Giriş Hatası", str(e), parent=pencere)
+            return False
+        if sonuc.hata_sayisi:
+            liste = "\n".join(sonuc.hatalar)
+            if sonuc.hata_sayisi > len(sonuc.hatalar): liste += f"\n... ve {sonuc.hata_sayisi - len(sonuc.hatalar)} hata daha"
+            if not sonuc.hucre_sayisi:
+                messagebox.showerror("Toplu Giriş Hatası", f"Uygulanabilecek geçerli not yok:\n{liste}", parent=pencere)
+                return False
+            if not messagebox.askyesno("Hatalı Satırlar", f"{sonuc.hata_sayisi} hata bulundu:\n{liste}\n\n"
+                                       f"Geçerli {sonuc.hucre_sayisi} not yine de uygulansın mı?", parent=pencere, default="no"):
+                return False
+        if not sonuc.hucre_sayisi:
+            messagebox.showinfo("Toplu Giriş", "Girdide uygulanacak not yok.", parent=pencere)
+            return False
+
+        self._kriter_sutunlarini_ekle({sutun for degerler in sonuc.degerler.values() for sutun in degerler})
+        if self._notlari_uygula(sonuc.degerler) is None: # Tek geri alma adımı, tek hesaplama, tek yenileme
+            return False
+        if self.secili_ogrenci_index in sonuc.degerler:
+            self.ogrenci_secildi()
+        self.durum_bildir(f"Toplu giriş: {sonuc.hucre_sayisi} not, {len(sonuc.degerler)} öğrenci güncellendi.")
+        return True
+
+    # --- Geri Al / Yinele ---
+    def geri_al(self, event=None):
+        """Aktif sınıftaki son not değişikliğini geri alır (Ctrl+Z)."""
+        return self._gecmisten_uygula(geri=True)
+
+    def yinele(self, event=None):
+        """Geri alınan son değişikliği yeniden uygular (Ctrl+Y / Ctrl+Shift+Z)."""
+        return self._gecmisten_uygula(geri=False)
+
+    def _gecmisten_uygula(self, geri: bool):
+        kayit = self.calisma_alani.getir(self.aktif_sinif_anahtari, kullanildi=False)
+        if kayit is None or self.yukleme_gorevi is not None or not self.mevcut_ders:
+            return "break"
+        adim = kayit.gecmis.geri_al() if geri else kayit.gecmis.yinele()
+        if not adim:
+            return "break"
+        yeni_degerler: Dict[int, Dict[str, Any]] = {}
+        for d in adim:
+            if d.index in self.df.index:
+                yeni_degerler.setdefault(d.index, {})[d.sutun] = d.yeni
+        if self._notlari_uygula(yeni_degerler, gecmise_ekle=False) is not None:
+            if self.secili_ogrenci_index in yeni_degerler:
+                self.ogrenci_secildi() # Düzenleme alanları geri alınan değerleri göstersin
+            hucre_sayisi = sum(len(degerler) for degerler in yeni_degerler.values())
+            self.durum_bildir(f"{'Geri alındı' if geri else 'Yinelendi'}: {hucre_sayisi} not ({len(yeni_degerler)} öğrenci)")
+        return "break" # Entry'nin kendi kısayolu çalışmasın
+
+    def _gecmis_butonlarini_guncelle(self) -> None:
+        kayit = self.calisma_alani.getir(self.aktif_sinif_anahtari, kullanildi=False)
+        self.geri_al_buton.config(state="normal" if kayit is not None and kayit.gecmis.geri_alinabilir else "disabled")
+        self.yinele_buton.config(state="normal" if kayit is not None and kayit.gecmis.yinelenebilir else "disabled")
 
     # --- Veriyi Dışa Aktarma ---
     def veriyi_disa_aktar(self) -> None:
-        """Mevcut DataFrame'i yeni bir Excel dosyasına kaydeder."""
+        """Mevcut DataFrame'i seçilen biçimde (.xlsx, .csv, .parquet) arka planda dosyaya yazar."""
         if self.df.empty:
             messagebox.showwarning("Uyarı", "Dışa aktarılacak veri yok.")
             return
+        if self.yukleme_gorevi is not None:
+            return # Süren bir yükleme/dışa aktarma var
 
         # Dosya adı önerisi oluşturma
         try:
@@ -575,16 +1434,41 @@ class PerformansYonetimApp:
 
         dosya_yolu = filedialog.asksaveasfilename(
             title="İşlenmiş Veriyi Kaydet", defaultextension=".xlsx", initialfile=varsayilan_ad,
-            filetypes=[("Excel Dosyaları", "*.xlsx"), ("Tüm Dosyalar", "*.*")]
+            filetypes=[("Excel Dosyaları", "*.xlsx"), ("CSV (Virgülle Ayrılmış)", "*.csv"),
+                       ("Parquet (Arşiv)", "*.parquet"), ("Tüm Dosyalar", "*.*")]
         )
         if not dosya_yolu: return # İptal
 
         print(f"Veri dışa aktarılıyor: {dosya_yolu}")
-        try:
-            self.df.to_excel(dosya_yolu, index=False, engine='openpyxl')
-            messagebox.showinfo("Başarılı", f"Veri başarıyla '{os.path.basename(dosya_yolu)}' dosyasına kaydedildi.")
-        except Exception as e:
-            messagebox.showerror("Kaydetme Hatası", f"Dosya kaydedilirken hata oluştu:\n{e}")
+        # Worker thread kullanıcı düzenlemeleriyle çakışmasın diye anlık kopya yazılır
+        df_kopya = self.df.copy()
+        sayfa_adi = self.mevcut_sinif_adi or "Notlar"
+        sinif_anahtari = self.aktif_sinif_anahtari
+        self.yukleme_gorevi = arkaplan.ArkaplanGorevi(
+            self.root,
+            lambda ilerleme, iptal: disa_aktarim.disa_aktar(df_kopya, dosya_yolu, sayfa_adi=sayfa_adi,
+                                                            ilerleme=ilerleme, iptal=iptal),
+            bitti=lambda satir_sayisi: self._disa_aktarim_tamamlandi(dosya_yolu, satir_sayisi, sinif_anahtari),
+            hata=self._disa_aktarim_hatasi,
+            ilerleme=self._yukleme_ilerledi,
+        )
+        self._yukleme_arayuzu(True, f"Dışa aktarılıyor: {os.path.basename(dosya_yolu)}")
+        self.yukleme_gorevi.baslat()
+
+    def _disa_aktarim_tamamlandi(self, dosya_yolu: str, satir_sayisi: int, sinif_anahtari: Optional[str]) -> None:
+        self._yukleme_iptal_edildi() # Bilgi etiketini yüklü sınıf bilgisine döndür
+        kayit = self.calisma_alani.getir(sinif_anahtari, kullanildi=False)
+        if kayit is not None: kayit.degisti = False # Değişiklikler artık dosyada
+        if self.calisma_alani.sinir_asildi: # Bu sınıf için sınırın üzerinde tutuluyorduysa artık çıkarılabilir
+            self._aktif_sinifi_sakla()
+            self._cikarilanlari_bildir(self.calisma_alani.sinir_ayarla(
+                self.calisma_alani.en_fazla_sinif, korunacak=self.aktif_sinif_anahtari))
+            self._sinif_listesini_guncelle()
+        self.durum_bildir(f"{satir_sayisi} satır '{os.path.basename(dosya_yolu)}' dosyasına kaydedildi.")
+
+    def _disa_aktarim_hatasi(self, e: BaseException) -> None:
+        self._yukleme_iptal_edildi()
+        messagebox.showerror("Kaydetme Hatası", f"Dosya kaydedilirken hata oluştu:\n{e}")
 
     # --- Ayarlar Penceresi ---
     def ayarlari_duzenle_ui(self) -> None:
@@ -641,6 +1525,13 @@ class PerformansYonetimApp:
         self.proje_agirlik_entry.insert(0, int(proje_agirlik_val * 100))
         row_genel += 1
 
+        # Bellekte Tutulacak Sınıf Sayısı (çalışma alanı sınırı)
+        ttk.Label(genel_frame, text="Bellekte Tutulacak Sınıf Sayısı:").grid(row=row_genel, column=0, padx=5, pady=5, sticky="w")
+        self.calisma_alani_entry = ttk.Entry(genel_frame, width=10)
+        self.calisma_alani_entry.grid(row=row_genel, column=1, padx=5, pady=5, sticky="w")
+        self.calisma_alani_entry.insert(0, self.gecici_ayarlar.get("genel_ayarlar", {}).get("calisma_alani_siniri", calisma_alani.VARSAYILAN_SINIR))
+        row_genel += 1
+
         # Not: Performans ağırlığı, (100 - yazili - proje) olarak hesaplanacak.
 
         # --- Sekme 2: Arayüz Ayarları ---
@@ -731,45 +1622,31 @@ class PerformansYonetimApp:
 
     # --- Ayarlar: Dersleri Listeleme ---
     def render_ders_ayarlari(self, parent_frame: ttk.Frame) -> None:
-        """ Geçici ayarlardaki dersleri ayarlar penceresinde listeler. """
+        """
+        Geçici ayarlardaki dersleri ayarlar penceresinde listeler.
+
+        Ders satırları havuzda tutulur: ekleme/silmeden sonra satırlar yeniden oluşturulmaz,
+        sadece adı değişen satırlar yeniden etiketlenir ve fark kadar satır gösterilir/gizlenir.
+        """
         print("Ayarlar: Dersler listeleniyor...")
-        # Önce mevcutları temizle
-        for widget in parent_frame.winfo_children():
-            widget.destroy()
-        self.ders_widgets.clear() # Widget referanslarını temizle
+        havuz = self.ders_havuzu
+        if havuz is None or not havuz.gecerli_mi(parent_frame): # Yeni ayarlar penceresi
+            parent_frame.columnconfigure(0, weight=1)
+            havuz = self.ders_havuzu = satir_havuzu.SatirHavuzu(
+                parent_frame, self._ders_satiri_olustur, self._ders_satirini_yerlestir,
+                lambda satir: satir["frame"].grid_remove(), bos_yerlesimi={"row": 0, "column": 0, "padx": 10, "pady": 10})
 
         dersler = self.gecici_ayarlar.get("ders_ayarlari", {})
-        if not dersler:
-             ttk.Label(parent_frame, text="Henüz ders eklenmemiş.").pack(padx=10, pady=10)
-             return
-
-        row_num = 0
+        self.ders_widgets.clear()
         # Dersleri alfabetik sırala
-        for ders_adi in sorted(dersler.keys()):
-            # Her ders için bir çerçeve
-            ders_cerceve = ttk.Frame(parent_frame, borderwidth=1, relief="groove")
-            # Grid yerine pack kullanalım, daha basit olabilir
-            ders_cerceve.pack(fill=tk.X, padx=5, pady=3)
-
-            # Ders adı (düzenlenemez)
-            ttk.Label(ders_cerceve, text=ders_adi, font=("Arial", 10, "bold")).pack(side=tk.LEFT, padx=10, pady=5)
-
-            # Sil Butonu (Sağa yaslı)
-            ders_sil_button = ttk.Button(ders_cerceve, text="Sil", width=5, style="Danger.TButton",
-                                         command=lambda d=ders_adi, pf=parent_frame: self.dersi_sil_ui(d, pf))
-            ders_sil_button.pack(side=tk.RIGHT, padx=5, pady=5)
-
-            # Kriter Düzenle Butonu (Sağa yaslı, Sil'den önce)
-            kriter_duzenle_button = ttk.Button(ders_cerceve, text="Kriterleri Düzenle", width=15,
-                                               command=lambda d=ders_adi: self.kriter_duzenle(d))
-            kriter_duzenle_button.pack(side=tk.RIGHT, padx=5, pady=5)
-
+        for satir, ders_adi in zip(havuz.esitle(len(dersler)), sorted(dersler.keys())):
+            if satir["ders"] != ders_adi: # Sadece adı değişen satır yeniden etiketlenir
+                satir["ders"] = ders_adi
+                satir["etiket"].configure(text=ders_adi)
             # Widget referanslarını sakla (ileride gerekirse)
-            self.ders_widgets[ders_adi] = {
-                "frame": ders_cerceve,
-                "duzenle_btn": kriter_duzenle_button,
-                "sil_btn": ders_sil_button
-            }
+            self.ders_widgets[ders_adi] = satir
+        havuz.bos_durumu("Henüz ders eklenmemiş.")
+
         # Tehlikeli Eylem Stili (Sil butonu için kırmızı)
         try:
             if "Danger.TButton" not in self.style.element_names():
@@ -783,6 +1660,35 @@ class PerformansYonetimApp:
             pass # Stil yoksa veya hata verirse normal buton görünür
 
 
+    def _ders_satiri_olustur(self, havuz: satir_havuzu.SatirHavuzu) -> Dict[str, Any]:
+        """Ayarlar penceresindeki bir ders satırı. Komutlar dersi satırdan okur; satır başka derse geçebilir."""
+        parent_frame = havuz.ebeveyn
+        satir: Dict[str, Any] = {"ders": None}
+        # Her ders için bir çerçeve
+        ders_cerceve = ttk.Frame(parent_frame, borderwidth=1, relief="groove")
+
+        # Ders adı (düzenlenemez)
+        ders_etiketi = ttk.Label(ders_cerceve, font=("Arial", 10, "bold"))
+        ders_etiketi.pack(side=tk.LEFT, padx=10, pady=5)
+
+        # Sil Butonu (Sağa yaslı)
+        ders_sil_button = ttk.Button(ders_cerceve, text="Sil", width=5, style="Danger.TButton",
+                                     command=lambda: self.dersi_sil_ui(satir["ders"], parent_frame))
+        ders_sil_button.pack(side=tk.RIGHT, padx=5, pady=5)
+
+        # Kriter Düzenle Butonu (Sağa yaslı, Sil'den önce)
+        kriter_duzenle_button = ttk.Button(ders_cerceve, text="Kriterleri Düzenle", width=15,
+                                           command=lambda: self.kriter_duzenle(satir["ders"]))
+        kriter_duzenle_button.pack(side=tk.RIGHT, padx=5, pady=5)
+
+        satir.update({"frame": ders_cerceve, "etiket": ders_etiketi,
+                      "duzenle_btn": kriter_duzenle_button, "sil_btn": ders_sil_button})
+        return satir
+
+    def _ders_satirini_yerlestir(self, satir: Dict[str, Any], konum: int) -> None:
+        satir["frame"].grid(row=konum, column=0, padx=5, pady=3, sticky="ew")
+
+
     # --- Ayarlar: Yeni Ders Ekleme (UI) ---
     def yeni_ders_ekle_ui(self, parent_frame: ttk.Frame) -> None:
         """ Yeni ders eklemek için kullanıcıdan isim alır ve geçici ayarlara ekler. """
@@ -891,7 +1797,7 @@ class PerformansYonetimApp:
 
 
         # Mevcut kriterleri listelemek için fonksiyonu çağır
-        self.kriter_widgets.clear() # Önceki widget referanslarını temizle
+        self.kriter_widgets = [] # Önceki pencerenin satırları (render_kriterler yenilerini bağlar)
         self.render_kriterler(self.kriter_scrollable_frame, ders_adi)
 
         # Alt Buton Paneli
@@ -915,80 +1821,91 @@ class PerformansYonetimApp:
 
     # --- Ayarlar: Kriterleri Listeleme ---
     def render_kriterler(self, parent_frame: ttk.Frame, ders_adi: str) -> None:
-        """ Geçici kriter listesini kriter düzenleme penceresinde gösterir. """
+        """
+        Geçici kriter listesini kriter düzenleme penceresinde gösterir.
+
+        Satırlar havuzdan gelir; ekleme/silme bu fonksiyonu çağırmaz, sadece ilgili satırı
+        ekler/çıkarır (diğer satırlara yazılmış, henüz kaydedilmemiş değerler korunur).
+        """
         print(f"'{ders_adi}' için kriterler render ediliyor...")
-        # Önce mevcutları temizle
-        for widget in parent_frame.winfo_children():
-            widget.destroy()
-        self.kriter_widgets.clear() # Widget referanslarını temizle
-
-        # Başlık Satırı
-        header_frame = ttk.Frame(parent_frame)
-        header_frame.pack(fill=tk.X, padx=5, pady=(0,5))
-        ttk.Label(header_frame, text="Kriter Adı", font=("Arial", 10, "bold")).grid(row=0, column=0, padx=5, sticky="w")
-        ttk.Label(header_frame, text="Ağırlık (%)", font=("Arial", 10, "bold")).grid(row=0, column=1, padx=5, sticky="w")
-        # Sütun genişliklerini ayarla
-        header_frame.columnconfigure(0, weight=3) # Ad sütunu geniş
-        header_frame.columnconfigure(1, weight=1) # Ağırlık dar
-        header_frame.columnconfigure(2, weight=0) # Sil butonu sabit
+        havuz = self.kriter_havuzu
+        if havuz is None or not havuz.gecerli_mi(parent_frame): # Yeni kriter penceresi
+            parent_frame.columnconfigure(0, weight=1)
+            # Başlık Satırı
+            header_frame = ttk.Frame(parent_frame)
+            header_frame.grid(row=0, column=0, sticky="ew", padx=5, pady=(0,5))
+            ttk.Label(header_frame, text="Kriter Adı", font=("Arial", 10, "bold")).grid(row=0, column=0, padx=5, sticky="w")
+            ttk.Label(header_frame, text="Ağırlık (%)", font=("Arial", 10, "bold")).grid(row=0, column=1, padx=5, sticky="w")
+            # Sütun genişliklerini ayarla
+            header_frame.columnconfigure(0, weight=3) # Ad sütunu geniş
+            header_frame.columnconfigure(1, weight=1) # Ağırlık dar
+            header_frame.columnconfigure(2, weight=0) # Sil butonu sabit
+            havuz = self.kriter_havuzu = satir_havuzu.SatirHavuzu(
+                parent_frame, lambda h: self._kriter_satiri_olustur(h, ders_adi), self._kriter_satirini_yerlestir,
+                lambda satir: satir["frame"].grid_remove(), bos_yerlesimi={"row": 1, "column": 0, "pady": 10})
+        self.kriter_widgets = havuz.satirlar # Kaydetme işlemi satırları buradan okur
 
         # Kriterleri Listele
-        if not self.gecici_kriterler:
-             ttk.Label(parent_frame, text="Henüz kriter eklenmemiş.").pack(pady=10)
-             return
-
-        for i, kriter in enumerate(self.gecici_kriterler):
-            # Her kriter için ayrı bir çerçeve
-            kriter_satir_frame = ttk.Frame(parent_frame)
-            kriter_satir_frame.pack(fill=tk.X, padx=5, pady=1)
-            kriter_satir_frame.columnconfigure(0, weight=3)
-            kriter_satir_frame.columnconfigure(1, weight=1)
-            kriter_satir_frame.columnconfigure(2, weight=0)
-
-            # Kriter Adı Girişi
-            ad_entry = ttk.Entry(kriter_satir_frame)
-            ad_entry.insert(0, kriter.get("ad", ""))
-            ad_entry.grid(row=0, column=0, padx=5, pady=2, sticky="ew")
-
-            # Ağırlık Girişi
-            agirlik_entry = ttk.Entry(kriter_satir_frame, width=10)
-            # Ağırlığı 0-1 arasından %'ye çevirip int yap
-            agirlik_val = kriter.get("agirlik", 0.0)
-            agirlik_entry.insert(0, str(int(agirlik_val * 100)))
-            agirlik_entry.grid(row=0, column=1, padx=5, pady=2, sticky="w")
-
-            # Sil Butonu
-            sil_button = ttk.Button(kriter_satir_frame, text="Sil", style="Danger.TButton", width=5,
-                                    # Lambda'da index'i ve parent'ı doğru aktar
-                                    command=lambda idx=i, pf=parent_frame, da=ders_adi: self.kriteri_sil_ui(idx, pf, da))
-            sil_button.grid(row=0, column=2, padx=(5,0), pady=2)
-
-            # Widget referanslarını sakla (Kaydetme işlemi için)
-            self.kriter_widgets.append({
-                "frame": kriter_satir_frame,
-                "ad_entry": ad_entry,
-                "agirlik_entry": agirlik_entry,
-                "sil_btn": sil_button
-            })
+        for satir, kriter in zip(havuz.esitle(len(self.gecici_kriterler)), self.gecici_kriterler):
+            self._kriter_satirini_doldur(satir, kriter)
+        havuz.bos_durumu("Henüz kriter eklenmemiş.")
         print(f"{len(self.kriter_widgets)} kriter listelendi.")
 
+    def _kriter_satiri_olustur(self, havuz: satir_havuzu.SatirHavuzu, ders_adi: str) -> Dict[str, Any]:
+        """Kriter penceresindeki bir satır. Sil butonu satırın o anki konumunu siler."""
+        parent_frame = havuz.ebeveyn
+        # Her kriter için ayrı bir çerçeve
+        kriter_satir_frame = ttk.Frame(parent_frame)
+        kriter_satir_frame.columnconfigure(0, weight=3)
+        kriter_satir_frame.columnconfigure(1, weight=1)
+        kriter_satir_frame.columnconfigure(2, weight=0)
+
+        # Kriter Adı Girişi
+        ad_entry = ttk.Entry(kriter_satir_frame)
+        ad_entry.grid(row=0, column=0, padx=5, pady=2, sticky="ew")
+
+        # Ağırlık Girişi
+        agirlik_entry = ttk.Entry(kriter_satir_frame, width=10)
+        agirlik_entry.grid(row=0, column=1, padx=5, pady=2, sticky="w")
+
+        satir: Dict[str, Any] = {"frame": kriter_satir_frame, "ad_entry": ad_entry, "agirlik_entry": agirlik_entry}
+        # Sil Butonu (satır kaydıkça konumu değişir; tıklandığı anda havuzdan okunur)
+        satir["sil_btn"] = ttk.Button(kriter_satir_frame, text="Sil", style="Danger.TButton", width=5,
+                                      command=lambda: self.kriteri_sil_ui(havuz.satirlar.index(satir), parent_frame, ders_adi))
+        satir["sil_btn"].grid(row=0, column=2, padx=(5,0), pady=2)
+        return satir
+
+    def _kriter_satirini_yerlestir(self, satir: Dict[str, Any], konum: int) -> None:
+        satir["frame"].grid(row=konum + 1, column=0, sticky="ew", padx=5, pady=1) # 0. satır başlık
+
+    def _kriter_satirini_doldur(self, satir: Dict[str, Any], kriter: Dict[str, Any]) -> None:
+        satir["ad_entry"].delete(0, tk.END)
+        satir["ad_entry"].insert(0, kriter.get("ad", ""))
+        # Ağırlığı 0-1 arasından %'ye çevirip int yap
+        agirlik_val = kriter.get("agirlik", 0.0)
+        satir["agirlik_entry"].delete(0, tk.END)
+        satir["agirlik_entry"].insert(0, str(int(agirlik_val * 100)))
+
 
     # --- Ayarlar: Yeni Kriter Ekleme (UI) ---
     def yeni_kriter_ekle_ui(self, parent_frame: ttk.Frame, ders_adi: str) -> None:
-        """ Geçici kriter listesine boş bir kriter ekler ve UI'ı günceller. """
+        """ Geçici kriter listesine boş bir kriter ekler ve UI'a tek satır ekler. """
         print("Yeni kriter satırı ekleniyor...")
+        if self.kriter_havuzu is None or not self.kriter_havuzu.gecerli_mi(parent_frame):
+            self.render_kriterler(parent_frame, ders_adi)
         # Geçici listeye boş bir kriter ekle
-        self.gecici_kriterler.append({"ad": "", "agirlik": 0.0})
-        # Kriter listesini UI'da yeniden çiz
-        self.render_kriterler(parent_frame, ders_adi)
-        # Yeni eklenen satırdaki ad entry'sine odaklan (varsa)
-        if self.kriter_widgets:
-            self.kriter_widgets[-1]["ad_entry"].focus_set()
+        yeni_kriter = {"ad": "", "agirlik": 0.0}
+        self.gecici_kriterler.append(yeni_kriter)
+        satir = self.kriter_havuzu.ekle()
+        self._kriter_satirini_doldur(satir, yeni_kriter)
+        self.kriter_havuzu.bos_durumu("Henüz kriter eklenmemiş.")
+        # Yeni eklenen satırdaki ad entry'sine odaklan
+        satir["ad_entry"].focus_set()
 
 
     # --- Ayarlar: Kriter Silme (UI) ---
     def kriteri_sil_ui(self, index: int, parent_frame: ttk.Frame, ders_adi: str) -> None:
-        """ Belirtilen index'teki kriteri geçici listeden siler ve UI'ı günceller. """
+        """ Belirtilen index'teki kriteri geçici listeden ve UI'dan siler (alttaki satırlar yukarı kayar). """
         print(f"{index}. index'teki kriter siliniyor...")
         try:
             # Index geçerli mi kontrol et
@@ -996,8 +1913,12 @@ class PerformansYonetimApp:
                 # Listeden sil
                 del self.gecici_kriterler[index]
                 print("Kriter geçici listeden silindi.")
-                # Kriter listesini UI'da yeniden çiz
-                self.render_kriterler(parent_frame, ders_adi)
+                # Sadece o satırı havuza bırak
+                if self.kriter_havuzu is not None and self.kriter_havuzu.gecerli_mi(parent_frame):
+                    self.kriter_havuzu.cikar(index)
+                    self.kriter_havuzu.bos_durumu("Henüz kriter eklenmemiş.")
+                else:
+                    self.render_kriterler(parent_frame, ders_adi)
             else:
                  print(f"Hata: Geçersiz kriter index'i: {index}")
                  messagebox.showerror("Hata", "Silinecek kriter bulunamadı (Geçersiz index).", parent=parent_frame.winfo_toplevel())
@@ -1081,11 +2002,13 @@ class PerformansYonetimApp:
                 eksik_veri = int(self.eksik_veri_entry.get())
                 yazili_agirlik_yuzde = int(self.yazili_agirlik_entry.get())
                 proje_agirlik_yuzde = int(self.proje_agirlik_entry.get())
+                calisma_alani_siniri = int(self.calisma_alani_entry.get())
 
                 if not (0 <= basari_siniri <= 100): raise ValueError("Başarı sınırı 0-100 arası olmalı.")
                 # Eksik veri değeri herhangi bir int olabilir.
                 if not (0 <= yazili_agirlik_yuzde <= 100): raise ValueError("Yazılı ağırlığı 0-100 arası olmalı.")
                 if not (0 <= proje_agirlik_yuzde <= 100): raise ValueError("Proje ağırlığı 0-100 arası olmalı.")
+                if not (1 <= calisma_alani_siniri <= 50): raise ValueError("Bellekte tutulacak sınıf sayısı 1-50 arası olmalı.")
                 if yazili_agirlik_yuzde + proje_agirlik_yuzde > 100:
                      raise ValueError("Yazılı ve Proje ağırlıkları toplamı 100'ü geçemez (Performansa yer kalmalı).")
 
@@ -1094,6 +2017,7 @@ class PerformansYonetimApp:
                 self.gecici_ayarlar["genel_ayarlar"]["eksik_veri_degeri"] = eksik_veri
                 self.gecici_ayarlar["genel_ayarlar"]["yazili_agirlik"] = yazili_agirlik_yuzde / 100.0
                 self.gecici_ayarlar["genel_ayarlar"]["proje_agirlik"] = proje_agirlik_yuzde / 100.0
+                self.gecici_ayarlar["genel_ayarlar"]["calisma_alani_siniri"] = calisma_alani_siniri
                 print("Genel ayarlar okundu ve doğrulandı.")
             except ValueError as e:
                 raise ValueError(f"Genel Ayarlar sekmesinde geçersiz değer: {e}")
@@ -1129,12 +2053,13 @@ class PerformansYonetimApp:
             # --- 4. Geçici Ayarları Ana Ayarlara ve Dosyaya Kaydet ---
             # Ana ayarları güncelle (artık geçerli veriler içeriyor)
             self.ayarlar = copy.deepcopy(self.gecici_ayarlar) # Derin kopya önemli olabilir
+            self.tam_hesap_gerekli = True # Ağırlıklar/kriterler değişmiş olabilir
             print("Ana ayarlar güncellendi.")
 
             # Dosyaya kaydet (veri_isleme modülünden)
             if veri_isleme.save_settings(self.ayarlar):
                  print("Ayarlar dosyaya başarıyla kaydedildi.")
-                 messagebox.showinfo("Başarılı", "Ayarlar başarıyla kaydedildi.", parent=toplevel_window)
+                 self.durum_bildir("Ayarlar başarıyla kaydedildi.")
 
                  # --- 5. Ana Arayüzü Güncelle ---
                  print("Ana arayüz güncelleniyor...")
@@ -1149,6 +2074,14 @@ class PerformansYonetimApp:
                       print(f"Ana arayüz teması güncellendi: {self.ayarlar['gui_ayarlari']['tema']}")
                  except tk.TclError: print(f"Uyarı: Tema '{self.ayarlar['gui_ayarlari']['tema']}' uygulanamadı.")
 
+                 # Çalışma alanı sınırı (küçüldüyse fazla sınıflar çıkarılır)
+                 cikarilanlar = self.calisma_alani.sinir_ayarla(
+                     self.ayarlar["genel_ayarlar"]["calisma_alani_siniri"], korunacak=self.aktif_sinif_anahtari)
+                 self._sinif_listesini_guncelle()
+                 sinir_notu = self._cikarilanlari_bildir(cikarilanlar)
+                 if sinir_notu:
+                      self.durum_bildir(f"Ayarlar başarıyla kaydedildi.{sinir_notu}")
+
                  # Ders combobox'ını güncelle
                  dersler = list(self.ayarlar.get("ders_ayarlari", {}).keys())
                  mevcut_secim = self.ders_combobox.get() # Kaydetmeden önceki seçim
@@ -1157,13 +2090,11 @@ class PerformansYonetimApp:
                       self.ders_combobox.set("")
                       self.ders_combobox.config(state="disabled")
                       self.mevcut_ders = None
-                      self.kriter_alanlarini_guncelle() # Kriter alanlarını temizle
-                      self.treeview_doldur() # Treeview'i temizle/güncelle
+                      self.yenileme.kriterleri_isaretle() # Kriter alanları ve Treeview sütunları
                  elif mevcut_secim in dersler: # Önceki seçim hala geçerliyse
                       self.ders_combobox.set(mevcut_secim)
-                      # Seçim değişmese bile kriterler değişmiş olabilir
-                      self.kriter_alanlarini_guncelle()
-                      self.treeview_doldur() # Treeview başlıkları/sütunları değişebilir
+                      # Seçim değişmese bile kriterler (ve Treeview sütunları) değişmiş olabilir
+                      self.yenileme.kriterleri_isaretle()
                  else: # Önceki seçim silinmişse veya hiç yoktuysa
                       self.ders_combobox.set(dersler[0]) # İlk dersi seç
                       self.ders_degisti(None) # Değişikliği ve güncellemeleri tetikle
@@ -1213,4 +2144,5 @@ def baslat():
 if __name__ == "__main__":
     # Bu script doğrudan çalıştırıldığında baslat() fonksiyonunu çağır
     print("main bloğu çalıştırıldı, baslat() çağrılıyor...")
+    multiprocessing.freeze_support() # Paketlenmiş (exe) sürümde toplu yükleme süreçleri için
     baslat()
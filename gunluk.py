@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+# --- gunluk.py ---
+# Not değişikliklerinin yazıldığı, sadece sona eklenen (append-only) değişiklik günlüğü.
+# Uygulama çökerse veya elektrik kesilirse son dışa aktarmadan sonra girilen notlar kaybolmasın diye
+# her değişiklik DataFrame'e yazılmadan önce günlüğe eklenir. Açılışta günlükte kalan kayıtlar
+# okunur ve ilgili sınıf yüklendiğinde taze veri üzerine sırayla yeniden uygulanır.
+#
+# Satır biçimi (JSON dizi, bir satır = bir değişiklik):
+#   [zaman, sınıf, ders, öğrenci_no, sütun, eski_değer, yeni_değer]
+# fsync her kayıtta değil, TOPLU_FSYNC_SAYISI kayıtta bir veya FSYNC_ARALIGI_SN dolunca yapılır.
+
+import json
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set
+
+import pandas as pd
+
+from modules import not_deposu, veri_semasi
+
+GUNLUK_DOSYASI = "degisiklik_gunlugu.jsonl"
+TOPLU_FSYNC_SAYISI = 16   # Bu kadar kayıt birikince diske zorla yazılır
+FSYNC_ARALIGI_SN = 1.0    # Ya da son fsync'ten bu kadar süre geçince
+
+
+class GunlukKaydi(NamedTuple):
+    zaman: float
+    sinif: str
+    ders: Optional[str]
+    ogrenci_no: int
+    sutun: str
+    eski: Any
+    yeni: Any
+
+
+class DegisiklikGunlugu:
+    """
+    Append-only değişiklik günlüğü.
+
+    Args:
+        dosya_yolu (str, optional): Günlük dosyası. Verilmezse proje dizinindeki GUNLUK_DOSYASI.
+    """
+
+    def __init__(self, dosya_yolu: Optional[str] = None) -> None:
+        if dosya_yolu is None:
+            proje_dizini = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+            dosya_yolu = os.path.join(proje_dizini, GUNLUK_DOSYASI)
+        self.dosya_yolu = dosya_yolu
+        self._dosya = None
+        self._senkronize_edilmemis = 0
+        self._son_fsync = time.monotonic()
+
+    # --- Yazma ---
+    def ekle(self, sinif: str, ders: Optional[str], ogrenci_no: int, sutun: str, eski: Any, yeni: Any) -> None:
+        """Bir değişikliği günlüğe ekler (işletim sistemine hemen, diske toplu olarak yazılır)."""
+        self.toplu_ekle([(sinif, ders, ogrenci_no, sutun, eski, yeni)])
+
+    def toplu_ekle(self, degisiklikler: Iterable[tuple]) -> None:
+        """(sınıf, ders, öğrenci_no, sütun, eski, yeni) değişikliklerini tek yazma ile ekler."""
+        if self._dosya is None:
+            self._dosya = open(self.dosya_yolu, "ab")
+            if self._dosya.tell() and not _yeni_satirla_bitiyor(self.dosya_yolu):
+                self._dosya.write(b"\n") # Çökmede yarım kalan satır yeni kaydı bozmasın
+        zaman = round(time.time(), 3)
+        satirlar = [json.dumps([zaman, sinif, ders, int(ogrenci_no), str(sutun),
+                                not_deposu._json_degeri(eski), not_deposu._json_degeri(yeni)],
+                               ensure_ascii=False, separators=(",", ":")) + "\n"
+                    for sinif, ders, ogrenci_no, sutun, eski, yeni in degisiklikler]
+        if not satirlar:
+            return
+        self._dosya.write("".join(satirlar).encode("utf-8"))
+        self._dosya.flush() # Uygulama çökse bile işletim sistemi tamponunda kalır
+        self._senkronize_edilmemis += len(satirlar)
+        if (self._senkronize_edilmemis >= TOPLU_FSYNC_SAYISI
+                or time.monotonic() - self._son_fsync >= FSYNC_ARALIGI_SN):
+            self.senkronize_et()
+
+    def senkronize_et(self) -> None:
+        """Bekleyen kayıtları diske yazar (elektrik kesintisine karşı). Bekleyen yoksa bir şey yapmaz."""
+        if self._dosya is None or not self._senkronize_edilmemis:
+            return
+        os.fsync(self._dosya.fileno())
+        self._senkronize_edilmemis = 0
+        self._son_fsync = time.monotonic()
+
+    def kapat(self, korunacaklar: Iterable[GunlukKaydi] = ()) -> None:
+        """
+        Düzgün kapanışta günlüğü temizler.
+
+        Args:
+            korunacaklar (Iterable[GunlukKaydi]): Henüz hiçbir sınıfa uygulanmamış kurtarma kayıtları;
+                                                  bunlar bir sonraki açılış için dosyada bırakılır.
+        """
+        if self._dosya is not None:
+            self._dosya.close()
+            self._dosya = None
+        self._senkronize_edilmemis = 0
+        korunacaklar = list(korunacaklar)
+        if not korunacaklar:
+            try: os.remove(self.dosya_yolu)
+            except OSError: pass
+            return
+        # Kalan kayıtlar geçici dosyaya yazılıp atomik olarak yerine konur
+        dizin = os.path.dirname(os.path.abspath(self.dosya_yolu))
+        fd, gecici_yol = tempfile.mkstemp(prefix=".gunluk.", suffix=".tmp", dir=dizin)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for kayit in korunacaklar:
+                    f.write(json.dumps(list(kayit), ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(gecici_yol, self.dosya_yolu)
+        except BaseException:
+            try: os.remove(gecici_yol)
+            except OSError: pass
+            raise
+
+    # --- Okuma / Kurtarma ---
+    def kayitlari_oku(self) -> List[GunlukKaydi]:
+        """Günlükteki tüm kayıtları sırayla okur; yarım yazılmış (bozuk) satırlar atlanır."""
+        kayitlar = []
+        try:
+            with open(self.dosya_yolu, "rb") as f:
+                for satir_no, satir in enumerate(f, start=1):
+                    try:
+                        kayitlar.append(GunlukKaydi(*json.loads(satir.decode("utf-8"))))
+                    except (ValueError, TypeError):
+                        print(f"Uyarı: Günlükteki {satir_no}. satır okunamadı (yarım yazılmış olabilir), atlandı.")
+        except FileNotFoundError:
+            pass
+        return kayitlar
+
+    def bekleyenler(self) -> "OrderedDict[str, List[GunlukKaydi]]":
+        """Önceki oturumdan kalan kayıtlar, sınıfa göre gruplanmış (ilk görülme sırasıyla)."""
+        gruplar: "OrderedDict[str, List[GunlukKaydi]]" = OrderedDict()
+        for kayit in self.kayitlari_oku():
+            gruplar.setdefault(kayit.sinif, []).append(kayit)
+        return gruplar
+
+
+def _yeni_satirla_bitiyor(dosya_yolu: str) -> bool:
+    with open(dosya_yolu, "rb") as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b"\n"
+
+
+def uygula(df: pd.DataFrame, kayitlar: List[GunlukKaydi], satirlar: Optional[pd.Index] = None,
+           eksik_veri_degeri: Any = 0) -> Set[int]:
+    """
+    Günlük kayıtlarını sırasıyla DataFrame'e yeniden uygular (aynı hücrede son değer kazanır).
+
+    Args:
+        df (pd.DataFrame): Taze yüklenmiş sınıf verisi (yerinde güncellenir).
+        kayitlar (List[GunlukKaydi]): Bu sınıfa ait kayıtlar.
+        satirlar (pd.Index, optional): Öğrenci No eşleştirmesinin yapılacağı satırlar (birleşik
+                                       tablolarda tek bir sınıfın satırları). Verilmezse tüm tablo.
+        eksik_veri_degeri: Tabloda olmayan (sonradan eklenmiş kriter) sütunları bu değerle oluşturulur.
+
+    Returns:
+        Set[int]: Değişen satırların index'leri.
+    """
+    if not kayitlar or df.empty or veri_semasi.NUMARA_SUTUNU not in df.columns:
+        return set()
+    numaralar = df.loc[satirlar if satirlar is not None else df.index, veri_semasi.NUMARA_SUTUNU]
+    index_bul = {int(no): idx for idx, no in numaralar.items()}
+
+    son_degerler: Dict[str, Dict[Any, Any]] = {} # sütun -> {index: değer}
+    for kayit in kayitlar:
+        idx = index_bul.get(int(kayit.ogrenci_no))
+        if idx is None:
+            print(f"Uyarı: Günlükteki öğrenci ({kayit.ogrenci_no}) sınıfta bulunamadı, atlandı.")
+            continue
+        son_degerler.setdefault(kayit.sutun, {})[idx] = kayit.yeni
+
+    degisenler: Set[int] = set()
+    for sutun, degerler in son_degerler.items():
+        if sutun not in df.columns:
+            veri_semasi.sutun_ekle(df, sutun, eksik_veri_degeri)
+        veri_semasi.sutuna_yaz(df, list(degerler), sutun, list(degerler.values()))
+        degisenler.update(int(idx) for idx in degerler)
+    return degisenler
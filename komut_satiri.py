@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+# --- komut_satiri.py ---
+# Arayüz (tkinter) olmadan çalışan toplu hesaplama aracı.
+# Birden fazla e-Okul dosyasını paralel yükler, seçilen dersler için notları hesaplar
+# ve sonuçları Excel (veya CSV/Parquet) dosyaları olarak yazar. Dönem sonu işlemleri sunucuda tek komutla yapılabilir.
+#
+# Örnek:
+#   python -m modules.komut_satiri "notlar/*.xlsx" --ayarlar ayarlar.json --ders Matematik --ders Fizik -o sonuclar
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional
+
+from modules import veri_isleme, hesaplamalar, toplu_yukleme, disa_aktarim, veri_semasi, olcum
+
+
+def _dosya_adi_icin(metin: str) -> str:
+    """Sınıf/ders adlarını dosya adında kullanılabilir hale getirir."""
+    return "".join(c if c.isalnum() or c in ('-', '_') else '_' for c in str(metin))
+
+
+def _dosyayi_isle(dosya_yolu: str, ayarlar: Dict[str, Any], dersler: List[str], cikti_klasoru: str,
+                  satir_atla: Optional[int], tum_sayfalar: bool, bicim: str = "xlsx") -> List[Dict[str, Any]]:
+    """
+    (Worker süreci) Bir dosyayı yükler, her ders için hesaplar ve sonucu seçilen biçimde yazar.
+    Her (sayfa, ders) için {"dosya", "sayfa", "sinif_adi", "ders", "cikti", "ogrenci_sayisi", "hata"} döndürür.
+    """
+    eksik_veri_degeri = ayarlar.get("genel_ayarlar", {}).get("eksik_veri_degeri", 0)
+    sonuclar = []
+    for sayfa in toplu_yukleme._dosyayi_yukle(dosya_yolu, satir_atla, tum_sayfalar, eksik_veri_degeri):
+        temel = {"dosya": dosya_yolu, "sayfa": sayfa["sayfa"], "sinif_adi": sayfa["sinif_adi"]}
+        df = sayfa["df"]
+        if df is None:
+            sonuclar.append({**temel, "ders": None, "cikti": None, "ogrenci_sayisi": 0, "hata": sayfa["hata"]})
+            continue
+
+        # Farklı dosyalarda aynı sınıf adı olabileceği için çıktı adı kaynak dosya adıyla başlar
+        dosya_kok = os.path.splitext(os.path.basename(dosya_yolu))[0]
+        on_ek = _dosya_adi_icin(dosya_kok)
+        if sayfa["sinif_adi"] and sayfa["sinif_adi"] != dosya_kok:
+            on_ek += "_" + _dosya_adi_icin(sayfa["sinif_adi"])
+        for ders in dersler:
+            try:
+                hesaplanmis = hesaplamalar.tum_veriyi_hesapla(veri_semasi.hesaplama_icin_genislet(df), ayarlar, ders)
+                cikti = os.path.join(cikti_klasoru, f"{on_ek}_{_dosya_adi_icin(ders)}_Hesaplanmis.{bicim}")
+                disa_aktarim.disa_aktar(hesaplanmis, cikti, bicim=bicim, sayfa_adi=sayfa["sinif_adi"] or dosya_kok)
+                sonuclar.append({**temel, "ders": ders, "cikti": cikti, "ogrenci_sayisi": len(hesaplanmis), "hata": None})
+            except hesaplamalar.AyarHatasi as e:
+                sonuclar.append({**temel, "ders": ders, "cikti": None, "ogrenci_sayisi": 0, "hata": f"Ayar hatası: {e}"})
+            except Exception as e:
+                sonuclar.append({**temel, "ders": ders, "cikti": None, "ogrenci_sayisi": 0, "hata": str(e)})
+    return sonuclar
+
+
+def toplu_hesapla(dosyalar: List[str], ayarlar: Dict[str, Any], dersler: List[str], cikti_klasoru: str,
+                  satir_atla: Optional[int] = None, tum_sayfalar: bool = False,
+                  en_fazla_islem: Optional[int] = None, bicim: str = "xlsx") -> List[Dict[str, Any]]:
+    """
+    Dosyaları süreç havuzunda paralel işler.
+
+    Args:
+        dosyalar (List[str]): İşlenecek Excel dosyaları.
+        ayarlar (dict): Uygulama ayarları (ders kriterleri, genel ayarlar).
+        dersler (List[str]): Hesaplanacak dersler.
+        cikti_klasoru (str): Sonuç dosyalarının yazılacağı klasör (yoksa oluşturulur).
+        satir_atla (int, optional): Başlık satırından önce atlanacak satır sayısı. None ise otomatik bulunur.
+        tum_sayfalar (bool): True ise her dosyanın tüm sayfaları ayrı sınıf olarak işlenir.
+        en_fazla_islem (int, optional): Süreç sayısı (varsayılan: çekirdek sayısı).
+        bicim (str): Sonuç dosyası biçimi: "xlsx", "csv" veya "parquet".
+
+    Returns:
+        List[Dict]: Her (dosya, sayfa, ders) için sonuç raporu, dosya sırasıyla.
+    """
+    os.makedirs(cikti_klasoru, exist_ok=True)
+    sonuclar: Dict[str, List[Dict[str, Any]]] = {}
+    with ProcessPoolExecutor(max_workers=en_fazla_islem) as havuz:
+        isler = {havuz.submit(olcum.surecte_calistir, _dosyayi_isle, yol, ayarlar, dersler, cikti_klasoru,
+                              satir_atla, tum_sayfalar, bicim): yol
+                 for yol in dosyalar}
+        for tamamlanan, is_ in enumerate(as_completed(isler), start=1):
+            yol = isler[is_]
+            try:
+                sonuclar[yol], olcumler = is_.result()
+                olcum.birlestir(olcumler) # Worker'ın ölçümleri ana sürecin raporuna
+            except Exception as e: # Worker süreci çöktüyse
+                sonuclar[yol] = [{"dosya": yol, "sayfa": None, "sinif_adi": None, "ders": None,
+                                  "cikti": None, "ogrenci_sayisi": 0, "hata": str(e)}]
+            print(f"[{tamamlanan}/{len(dosyalar)}] {os.path.basename(yol)}")
+    return [sonuc for yol in dosyalar for sonuc in sonuclar.get(yol, [])]
+
+
+def _arguman_ayristirici() -> argparse.ArgumentParser:
+    ayristirici = argparse.ArgumentParser(
+        prog="komut_satiri",
+        description="e-Okul Excel dosyalarındaki notları arayüz olmadan toplu hesaplar ve dışa aktarır.")
+    ayristirici.add_argument("kaynaklar", nargs="+",
+                             help="Excel dosyaları, klasörler veya glob desenleri (örn. 'notlar/*.xlsx').")
+    ayristirici.add_argument("-a", "--ayarlar", default="ayarlar.json",
+                             help="Ayarlar dosyası (varsayılan: proje dizinindeki ayarlar.json).")
+    ayristirici.add_argument("-d", "--ders", action="append", dest="dersler", metavar="DERS",
+                             help="Hesaplanacak ders (birden fazla verilebilir). Verilmezse ayarlardaki tüm dersler.")
+    ayristirici.add_argument("-o", "--cikti", default="sonuclar",
+                             help="Sonuç dosyalarının yazılacağı klasör (varsayılan: sonuclar).")
+    ayristirici.add_argument("-b", "--bicim", choices=sorted(set(disa_aktarim.BICIMLER.values())), default="xlsx",
+                             help="Sonuç dosyası biçimi (varsayılan: xlsx).")
+    ayristirici.add_argument("--satir-atla", type=int, default=None,
+                             help="Başlık satırından önce atlanacak satır sayısı (varsayılan: otomatik bul).")
+    ayristirici.add_argument("--tum-sayfalar", action="store_true",
+                             help="Her dosyanın tüm sayfalarını ayrı sınıf olarak işle.")
+    ayristirici.add_argument("-j", "--islem", type=int, default=None,
+                             help="Paralel süreç sayısı (varsayılan: çekirdek sayısı).")
+    return ayristirici
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Komut satırı giriş noktası. Tüm işler başarılıysa 0, aksi halde 1 döndürür."""
+    args = _arguman_ayristirici().parse_args(argv)
+
+    ayarlar_yolu = os.path.abspath(args.ayarlar) if os.path.exists(args.ayarlar) else args.ayarlar
+    if not os.path.isfile(veri_isleme._ayarlar_yolu(ayarlar_yolu)):
+        print(f"HATA: Ayarlar dosyası bulunamadı: {args.ayarlar}", file=sys.stderr)
+        return 1
+    ayarlar = veri_isleme.load_settings(ayarlar_yolu)
+
+    tanimli_dersler = list(ayarlar.get("ders_ayarlari", {}).keys())
+    dersler = args.dersler or tanimli_dersler
+    bilinmeyen = [ders for ders in dersler if ders not in tanimli_dersler]
+    if bilinmeyen:
+        print(f"HATA: Ayarlarda tanımlı olmayan ders(ler): {', '.join(bilinmeyen)}", file=sys.stderr)
+        return 1
+    if not dersler:
+        print("HATA: Ayarlarda tanımlı ders yok.", file=sys.stderr)
+        return 1
+
+    dosyalar: List[str] = []
+    for kaynak in args.kaynaklar:
+        bulunan = toplu_yukleme.dosyalari_bul(kaynak)
+        if not bulunan:
+            print(f"Uyarı: '{kaynak}' için dosya bulunamadı.")
+        dosyalar.extend(yol for yol in bulunan if yol not in dosyalar)
+    if not dosyalar:
+        print("HATA: İşlenecek Excel dosyası yok.", file=sys.stderr)
+        return 1
+
+    print(f"{len(dosyalar)} dosya, {len(dersler)} ders işlenecek ({', '.join(dersler)}).")
+    baslangic = time.perf_counter()
+    rapor = toplu_hesapla(dosyalar, ayarlar, dersler, args.cikti,
+                          satir_atla=args.satir_atla, tum_sayfalar=args.tum_sayfalar, en_fazla_islem=args.islem,
+                          bicim=args.bicim)
+    sure = time.perf_counter() - baslangic
+
+    hatalar = [r for r in rapor if r["hata"]]
+    basarili = [r for r in rapor if not r["hata"]]
+    for r in hatalar:
+        konum = os.path.basename(r["dosya"]) + (f" [{r['sayfa']}]" if r["sayfa"] is not None else "")
+        ders = f" / {r['ders']}" if r["ders"] else ""
+        print(f"HATA: {konum}{ders}: {r['hata']}", file=sys.stderr)
+    print(f"Tamamlandı: {len(basarili)} sonuç dosyası, {sum(r['ogrenci_sayisi'] for r in basarili)} satır, "
+          f"{len(hatalar)} hata, {sure:.1f} sn. Çıktı: {os.path.abspath(args.cikti)}")
+    return 1 if hatalar else 0
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
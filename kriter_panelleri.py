@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+# --- kriter_panelleri.py ---
+# Sağ paneldeki kriter notu giriş alanlarının önbelleği.
+# Her kriter tanımı (kriter adları ve ağırlıkları) için etiket + Entry'lerden oluşan bir çerçeve
+# bir kez kurulur ve saklanır. Ders değiştirmek sadece görünen çerçeveyi değiştirir; aynı kriterlere
+# sahip dersler aynı paneli paylaşır. Bir dersin kriterleri ayarlardan değişince tanımı da değişir:
+# o ders için yeni panel kurulur, artık hiçbir dersin kullanmadığı paneller atılır.
+
+import tkinter as tk
+from tkinter import ttk
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+KriterTanimi = Tuple[Tuple[str, float], ...] # ((kriter adı, ağırlık), ...)
+
+
+def kriter_tanimi(kriterler: Iterable[Dict[str, Any]]) -> KriterTanimi:
+    """Ayarlardaki kriter listesinin önbellek anahtarı (adı boş kriterler panelde gösterilmez)."""
+    return tuple((str(kriter["ad"]), float(kriter.get("agirlik", 0.0) or 0.0))
+                 for kriter in kriterler if kriter.get("ad"))
+
+
+class KriterPaneli:
+    """Bir kriter tanımının giriş alanları (çerçeve ve kriter adı -> Entry)."""
+
+    def __init__(self, ebeveyn: tk.Misc, tanim: KriterTanimi, entry_hazirla: Callable[[ttk.Entry], None]) -> None:
+        self.tanim = tanim
+        self.cerceve = ttk.Frame(ebeveyn)
+        self.entryler: Dict[str, ttk.Entry] = {}
+        for i, (kriter_adi, agirlik) in enumerate(tanim):
+            ttk.Label(self.cerceve, text=f"{kriter_adi} (%{agirlik * 100:.1f}):").grid(row=i, column=0, padx=5, pady=3, sticky="w")
+            entry = ttk.Entry(self.cerceve, width=10)
+            entry.grid(row=i, column=1, padx=5, pady=3, sticky="w")
+            entry_hazirla(entry)
+            self.entryler[kriter_adi] = entry
+
+
+class KriterPaneliOnbellegi:
+    """
+    Kriter tanımı -> KriterPaneli önbelleği; aynı anda tek panel (veya bir mesaj) görünür.
+
+    Args:
+        ebeveyn (tk.Misc): Panellerin yerleştirileceği çerçeve (gui'de kriter_cercevesi).
+        entry_hazirla (Callable[[ttk.Entry], None]): Her Entry oluşturulurken bir kez çağrılır (kısayollar).
+    """
+
+    def __init__(self, ebeveyn: tk.Misc, entry_hazirla: Callable[[ttk.Entry], None]) -> None:
+        self.ebeveyn = ebeveyn
+        self._entry_hazirla = entry_hazirla
+        self._paneller: Dict[KriterTanimi, KriterPaneli] = {}
+        self._gorunen: Optional[KriterPaneli] = None
+        self._mesaj_etiketi: Optional[ttk.Label] = None
+
+    def __len__(self) -> int:
+        return len(self._paneller)
+
+    def goster(self, tanim: KriterTanimi) -> Dict[str, ttk.Entry]:
+        """
+        Tanımın panelini gösterir (önbellekte yoksa kurar).
+
+        Returns:
+            Dict[str, ttk.Entry]: Panelin kriter adı -> Entry sözlüğü.
+        """
+        panel = self._paneller.get(tanim)
+        if panel is None:
+            panel = self._paneller[tanim] = KriterPaneli(self.ebeveyn, tanim, self._entry_hazirla)
+        if self._mesaj_etiketi is not None:
+            self._mesaj_etiketi.grid_remove()
+        if panel is not self._gorunen:
+            if self._gorunen is not None:
+                self._gorunen.cerceve.grid_remove()
+            panel.cerceve.grid(row=0, column=0, columnspan=2, sticky="nw")
+            self._gorunen = panel
+        return panel.entryler
+
+    def mesaj_goster(self, metin: str, **etiket_ayarlari: Any) -> None:
+        """Panel yerine bir bilgi/hata mesajı gösterir (ders seçili değil, kriter yok...)."""
+        if self._gorunen is not None:
+            self._gorunen.cerceve.grid_remove()
+            self._gorunen = None
+        if self._mesaj_etiketi is None:
+            self._mesaj_etiketi = ttk.Label(self.ebeveyn)
+        self._mesaj_etiketi.configure(text=metin, **etiket_ayarlari)
+        self._mesaj_etiketi.grid(row=0, column=0, columnspan=2, pady=5, sticky="w")
+
+    def eskileri_at(self, kullanilan_tanimlar: Iterable[KriterTanimi]) -> List[KriterTanimi]:
+        """Artık hiçbir dersin kullanmadığı panelleri yok eder (görünen panel korunur)."""
+        kullanilan = set(kullanilan_tanimlar)
+        if self._gorunen is not None:
+            kullanilan.add(self._gorunen.tanim)
+        atilanlar = [tanim for tanim in self._paneller if tanim not in kullanilan]
+        for tanim in atilanlar:
+            self._paneller.pop(tanim).cerceve.destroy()
+        return atilanlar
@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+# --- not_deposu.py ---
+# Notları proje dizinindeki yerel bir SQLite veritabanında saklayan depo.
+# Bir sınıf ilk açıldığında tamamı depoya alınır; sonraki her kayıt tek satırlık bir upsert'tür.
+# Aynı sınıf tekrar açıldığında Excel yeniden ayrıştırılmaz, veri depodan okunur.
+#
+# Tablolar:
+#   siniflar(sinif, dosya_yolu, sinif_adi, sutunlar, kaynak_mtime_ns, kaynak_boyut, guncelleme)
+#   notlar(sinif, ders, ogrenci_no, veriler, guncelleme)  -- PRIMARY KEY (sinif, ders, ogrenci_no)
+# notlar.veriler öğrencinin tüm satırını JSON olarak tutar. İlk alınan satırlar ders='' ile yazılır;
+# okurken her öğrenci için en son güncellenen satır kullanılır.
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from modules import veri_semasi
+
+DEPO_DOSYASI = "not_deposu.sqlite3"
+ILK_ALIM_DERSI = "" # Excel'den ilk alınan satırların ders değeri
+
+_SEMA = """
+CREATE TABLE IF NOT EXISTS siniflar (
+    sinif TEXT PRIMARY KEY,
+    dosya_yolu TEXT NOT NULL,
+    sinif_adi TEXT,
+    sutunlar TEXT NOT NULL,
+    kaynak_mtime_ns INTEGER,
+    kaynak_boyut INTEGER,
+    guncelleme REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS notlar (
+    sinif TEXT NOT NULL,
+    ders TEXT NOT NULL,
+    ogrenci_no INTEGER NOT NULL,
+    veriler TEXT NOT NULL,
+    guncelleme REAL NOT NULL,
+    PRIMARY KEY (sinif, ders, ogrenci_no)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS notlar_ogrenci ON notlar (sinif, ogrenci_no, guncelleme);
+"""
+
+
+class NotDeposuHatasi(Exception):
+    """Depoya yazılamadığında veya sınıf depoya alınamadığında fırlatılır."""
+
+
+def sinif_kimligi(dosya_yolu: str, sayfa: Any = 0) -> str:
+    """Bir sınıfın depodaki anahtarı: dosyanın mutlak yolu ve sayfası."""
+    return f"{os.path.normcase(os.path.abspath(dosya_yolu))}|{sayfa}"
+
+
+def _json_degeri(deger: Any) -> Any:
+    """pandas/numpy değerlerini JSON'a yazılabilir Python değerlerine çevirir (NaN/NA -> None)."""
+    if deger is None or deger is pd.NA:
+        return None
+    if hasattr(deger, "item"): # numpy skalerleri
+        deger = deger.item()
+    if isinstance(deger, float) and deger != deger:
+        return None
+    return deger
+
+
+def _satir_json(satir: Dict[str, Any]) -> str:
+    return json.dumps({str(k): _json_degeri(v) for k, v in satir.items()}, ensure_ascii=False)
+
+
+class NotDeposu:
+    """
+    SQLite not deposu. Tek bağlantı kilitle korunur; yükleme worker thread'inden de kullanılabilir.
+
+    Args:
+        dosya_yolu (str, optional): Veritabanı dosyası. Verilmezse proje dizinindeki DEPO_DOSYASI.
+    """
+
+    def __init__(self, dosya_yolu: Optional[str] = None) -> None:
+        if dosya_yolu is None:
+            proje_dizini = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+            dosya_yolu = os.path.join(proje_dizini, DEPO_DOSYASI)
+        self.dosya_yolu = dosya_yolu
+        self._kilit = threading.Lock()
+        self._sutunlar: Dict[str, List[str]] = {} # sinif -> sütun sırası (satir_yaz'da tekrar okunmasın)
+        self._baglanti = sqlite3.connect(dosya_yolu, check_same_thread=False)
+        # WAL + NORMAL: her kayıt ayrı bir işlem ama fsync sadece checkpoint'te; çökmede veri kaybolmaz
+        self._baglanti.execute("PRAGMA journal_mode=WAL")
+        self._baglanti.execute("PRAGMA synchronous=NORMAL")
+        self._baglanti.executescript(_SEMA)
+        print(f"Not deposu açıldı: {dosya_yolu}")
+
+    def kapat(self) -> None:
+        with self._kilit:
+            self._baglanti.close()
+
+    # --- Sınıflar ---
+    def sinif_var_mi(self, sinif: str) -> bool:
+        with self._kilit:
+            return self._baglanti.execute("SELECT 1 FROM siniflar WHERE sinif = ?", (sinif,)).fetchone() is not None
+
+    def kaynak_degisti_mi(self, sinif: str) -> bool:
+        """Sınıf depoya alındıktan sonra kaynak Excel dosyası değiştirilmiş mi?"""
+        with self._kilit:
+            satir = self._baglanti.execute(
+                "SELECT dosya_yolu, kaynak_mtime_ns, kaynak_boyut FROM siniflar WHERE sinif = ?", (sinif,)).fetchone()
+        if satir is None:
+            return False
+        try:
+            bilgi = os.stat(satir[0])
+        except OSError:
+            return False # Kaynak silinmiş/taşınmış; depodaki veri kullanılabilir
+        return (bilgi.st_mtime_ns, bilgi.st_size) != (satir[1], satir[2])
+
+    def sinifi_yaz(self, sinif: str, df: pd.DataFrame, sinif_adi: Optional[str], dosya_yolu: str) -> None:
+        """
+        Sınıfın tamamını depoya alır (varsa önceki kayıtları silinir).
+
+        Raises:
+            NotDeposuHatasi: DataFrame'de tam sayı 'Öğrenci No' sütunu yoksa veya numaralar tekrarlanıyorsa.
+        """
+        if veri_semasi.NUMARA_SUTUNU not in df.columns or not pd.api.types.is_integer_dtype(df[veri_semasi.NUMARA_SUTUNU]):
+            raise NotDeposuHatasi("Depoya almak için tam sayı 'Öğrenci No' sütunu gerekli.")
+        numaralar = df[veri_semasi.NUMARA_SUTUNU]
+        tekrarlananlar = sorted(set(numaralar[numaralar.duplicated()].tolist()))
+        if tekrarlananlar: # Depoda her öğrenci numarası tek satırdır (PRIMARY KEY)
+            ornekler = ", ".join(str(numara) for numara in tekrarlananlar[:10])
+            fazlasi = f" ve {len(tekrarlananlar) - 10} tane daha" if len(tekrarlananlar) > 10 else ""
+            raise NotDeposuHatasi(f"Sınıfta aynı 'Öğrenci No' birden fazla öğrencide var: {ornekler}{fazlasi}")
+        sutunlar = [str(sutun) for sutun in df.columns]
+        try:
+            bilgi = os.stat(dosya_yolu)
+            kaynak = (bilgi.st_mtime_ns, bilgi.st_size)
+        except OSError:
+            kaynak = (None, None)
+        simdi = time.time()
+        satirlar = ((sinif, ILK_ALIM_DERSI, int(satir[veri_semasi.NUMARA_SUTUNU]), _satir_json(satir), simdi)
+                    for satir in df.to_dict("records"))
+        with self._kilit, self._baglanti: # Tek işlem: yarım kalan alım olmaz
+            self._baglanti.execute("DELETE FROM notlar WHERE sinif = ?", (sinif,))
+            self._baglanti.execute(
+                "INSERT OR REPLACE INTO siniflar VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (sinif, os.path.abspath(dosya_yolu), sinif_adi, json.dumps(sutunlar, ensure_ascii=False), *kaynak, simdi))
+            self._baglanti.executemany("INSERT INTO notlar VALUES (?, ?, ?, ?, ?)", satirlar)
+            self._sutunlar[sinif] = sutunlar
+        print(f"Sınıf depoya alındı: {sinif_adi} ({len(df)} öğrenci)")
+
+    def sinifi_oku(self, sinif: str, eksik_veri_degeri: Any = 0) -> Optional[Tuple[pd.DataFrame, Optional[str]]]:
+        """
+        Sınıfı depodan okur (her öğrencinin en son kaydedilen satırı).
+
+        Args:
+            sinif (str): sinif_kimligi ile üretilen anahtar.
+            eksik_veri_degeri: Sonradan eklenen (örn. kriter) sütunlarında değeri olmayan öğrenciler için.
+
+        Returns:
+            Optional[Tuple[pd.DataFrame, Optional[str]]]: (df, sınıf adı); sınıf depoda yoksa None.
+        """
+        with self._kilit:
+            sinif_satiri = self._baglanti.execute(
+                "SELECT sinif_adi, sutunlar FROM siniflar WHERE sinif = ?", (sinif,)).fetchone()
+            if sinif_satiri is None:
+                return None
+            # SQLite: MAX() ile birlikte seçilen sütunlar en büyük değerin olduğu satırdan gelir
+            kayitlar = self._baglanti.execute(
+                "SELECT veriler, MAX(guncelleme) FROM notlar WHERE sinif = ? GROUP BY ogrenci_no", (sinif,)).fetchall()
+        sinif_adi, sutunlar = sinif_satiri[0], json.loads(sinif_satiri[1])
+        self._sutunlar[sinif] = sutunlar
+
+        hesaplanan = set(veri_semasi.ONDALIK_SUTUNLAR) | set(veri_semasi.KATEGORI_SUTUNLARI)
+        satirlar = []
+        for veriler, _ in kayitlar:
+            satir = json.loads(veriler)
+            for sutun in sutunlar:
+                if sutun not in satir: # Sütun bu öğrenci en son kaydedildikten sonra eklenmiş
+                    satir[sutun] = None if sutun in hesaplanan else eksik_veri_degeri
+            satirlar.append(satir)
+        df = pd.DataFrame.from_records(satirlar, columns=sutunlar)
+        if not df.empty:
+            df.sort_values(by=veri_semasi.NUMARA_SUTUNU, inplace=True, ignore_index=True)
+        veri_semasi.sema_uygula(df)
+        print(f"Sınıf depodan yüklendi: {sinif_adi} ({len(df)} öğrenci)")
+        return df, sinif_adi
+
+    def sinifi_sil(self, sinif: str) -> None:
+        with self._kilit, self._baglanti:
+            self._baglanti.execute("DELETE FROM notlar WHERE sinif = ?", (sinif,))
+            self._baglanti.execute("DELETE FROM siniflar WHERE sinif = ?", (sinif,))
+            self._sutunlar.pop(sinif, None)
+
+    # --- Satırlar ---
+    def satir_yaz(self, sinif: str, ders: Optional[str], satir: Dict[str, Any]) -> None:
+        """
+        Bir öğrencinin satırını (sınıf, ders, Öğrenci No) anahtarıyla tek upsert olarak yazar.
+
+        Raises:
+            NotDeposuHatasi: Sınıf depoda yoksa veya satırda Öğrenci No yoksa.
+        """
+        self.satirlari_yaz(sinif, ders, [satir])
+
+    def satirlari_yaz(self, sinif: str, ders: Optional[str], satirlar: List[Dict[str, Any]]) -> None:
+        """Birden fazla öğrencinin satırını tek işlemde upsert eder (bkz. satir_yaz)."""
+        kayitlar = []
+        simdi = time.time()
+        for satir in satirlar:
+            ogrenci_no = _json_degeri(satir.get(veri_semasi.NUMARA_SUTUNU))
+            if ogrenci_no is None:
+                raise NotDeposuHatasi("Satırda 'Öğrenci No' yok.")
+            kayitlar.append((sinif, ders or ILK_ALIM_DERSI, int(ogrenci_no), _satir_json(satir), simdi))
+        if not kayitlar:
+            return
+        with self._kilit, self._baglanti:
+            sutunlar = self._sutunlar.get(sinif)
+            if sutunlar is None:
+                kayit = self._baglanti.execute("SELECT sutunlar FROM siniflar WHERE sinif = ?", (sinif,)).fetchone()
+                if kayit is None:
+                    raise NotDeposuHatasi(f"Sınıf depoda yok: {sinif}")
+                sutunlar = self._sutunlar[sinif] = json.loads(kayit[0])
+            yeni_sutunlar = [str(sutun) for sutun in satirlar[0] if str(sutun) not in sutunlar]
+            if yeni_sutunlar: # Yeni kriter sütunu: sınıfın sütun sırasına eklenir
+                sutunlar.extend(yeni_sutunlar)
+                self._baglanti.execute("UPDATE siniflar SET sutunlar = ? WHERE sinif = ?",
+                                       (json.dumps(sutunlar, ensure_ascii=False), sinif))
+            self._baglanti.executemany(
+                "INSERT INTO notlar VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (sinif, ders, ogrenci_no) DO UPDATE SET veriler = excluded.veriler, guncelleme = excluded.guncelleme",
+                kayitlar)
@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+# --- olcum.py ---
+# Adlandırılmış süre ölçümleri (span) ve işlem başına gecikme histogramları.
+# Konsola yazdırmak yerine süreler bellekte toplanır ve çıkışta bir dosyaya yazılır.
+#
+# Varsayılan olarak KAPALIDIR. Açmak için ortam değişkeni:
+#   PERFORMANS_OLCUM=1                       (rapor: proje dizininde olcum_raporu.json)
+#   PERFORMANS_OLCUM_DOSYASI=C:/yol/rapor.json (isteğe bağlı rapor yolu)
+# Kapalıyken `with olcum.olc("ad"):` sadece hazır bir boş nesne döndürür; zaman ölçülmez.
+#
+# Kullanım:
+#   with olcum.olc("yukle.oku"):
+#       ...
+#   @olcum.olculen("cizim")
+#   def treeview_doldur(self): ...
+
+import atexit
+import functools
+import json
+import multiprocessing
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Histogram kova üst sınırları (milisaniye); sonuncusundan büyükler taşma kovasına düşer
+KOVA_SINIRLARI_MS = [0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+VARSAYILAN_RAPOR_DOSYASI = "olcum_raporu.json"
+
+
+class _Istatistik:
+    """Tek bir span adı için sayım, toplam, en küçük/en büyük ve kova sayaçları."""
+    __slots__ = ("sayi", "toplam_ms", "en_kucuk_ms", "en_buyuk_ms", "kovalar")
+
+    def __init__(self) -> None:
+        self.sayi = 0
+        self.toplam_ms = 0.0
+        self.en_kucuk_ms = float("inf")
+        self.en_buyuk_ms = 0.0
+        self.kovalar = [0] * (len(KOVA_SINIRLARI_MS) + 1)
+
+    def ekle(self, sure_ms: float) -> None:
+        self.sayi += 1
+        self.toplam_ms += sure_ms
+        if sure_ms < self.en_kucuk_ms: self.en_kucuk_ms = sure_ms
+        if sure_ms > self.en_buyuk_ms: self.en_buyuk_ms = sure_ms
+        for i, sinir in enumerate(KOVA_SINIRLARI_MS):
+            if sure_ms <= sinir:
+                self.kovalar[i] += 1
+                return
+        self.kovalar[-1] += 1
+
+    def yuzdelik(self, oran: float) -> float:
+        """Kova üst sınırına göre yaklaşık yüzdelik (ms)."""
+        hedef = oran * self.sayi
+        birikimli = 0
+        for i, adet in enumerate(self.kovalar):
+            birikimli += adet
+            if birikimli >= hedef and adet:
+                return KOVA_SINIRLARI_MS[i] if i < len(KOVA_SINIRLARI_MS) else self.en_buyuk_ms
+        return self.en_buyuk_ms
+
+    def ham(self) -> Dict[str, Any]:
+        """Başka bir süreçte birleştirilebilecek ham sayaçlar (bkz. birlestir)."""
+        return {"sayi": self.sayi, "toplam_ms": self.toplam_ms, "en_kucuk_ms": self.en_kucuk_ms,
+                "en_buyuk_ms": self.en_buyuk_ms, "kovalar": list(self.kovalar)}
+
+    def birlestir(self, ham: Dict[str, Any]) -> None:
+        self.sayi += ham["sayi"]
+        self.toplam_ms += ham["toplam_ms"]
+        self.en_kucuk_ms = min(self.en_kucuk_ms, ham["en_kucuk_ms"])
+        self.en_buyuk_ms = max(self.en_buyuk_ms, ham["en_buyuk_ms"])
+        self.kovalar = [a + b for a, b in zip(self.kovalar, ham["kovalar"])]
+
+    def sozluk(self) -> Dict[str, Any]:
+        etiketler = [f"<={sinir}ms" for sinir in KOVA_SINIRLARI_MS] + [f">{KOVA_SINIRLARI_MS[-1]}ms"]
+        return {
+            "sayi": self.sayi,
+            "toplam_ms": round(self.toplam_ms, 3),
+            "ortalama_ms": round(self.toplam_ms / self.sayi, 3) if self.sayi else 0.0,
+            "en_kucuk_ms": round(self.en_kucuk_ms, 3) if self.sayi else 0.0,
+            "en_buyuk_ms": round(self.en_buyuk_ms, 3),
+            "p50_ms": self.yuzdelik(0.50),
+            "p95_ms": self.yuzdelik(0.95),
+            "histogram": {etiket: adet for etiket, adet in zip(etiketler, self.kovalar) if adet},
+        }
+
+
+class _BosSpan:
+    """Ölçüm kapalıyken kullanılan, hiçbir şey yapmayan bağlam yöneticisi."""
+    __slots__ = ()
+
+    def __enter__(self) -> "_BosSpan":
+        return self
+
+    def __exit__(self, *hata) -> bool:
+        return False
+
+
+class _Span:
+    __slots__ = ("ad", "_baslangic")
+
+    def __init__(self, ad: str) -> None:
+        self.ad = ad
+
+    def __enter__(self) -> "_Span":
+        self._baslangic = time.perf_counter()
+        return self
+
+    def __exit__(self, *hata) -> bool:
+        kaydet(self.ad, (time.perf_counter() - self._baslangic) * 1000.0)
+        return False # Hatalar yutulmaz; hatalı çağrıların süresi de kaydedilir
+
+
+_BOS_SPAN = _BosSpan()
+_istatistikler: Dict[str, _Istatistik] = {}
+_kilit = threading.Lock() # Yükleme gibi işler worker thread'lerinde de ölçülür
+_etkin = False
+_rapor_dosyasi: Optional[str] = None
+
+
+def olc(ad: str):
+    """Adlandırılmış bir süre ölçümü başlatır: `with olcum.olc("hesapla"): ...`"""
+    if not _etkin:
+        return _BOS_SPAN
+    return _Span(ad)
+
+
+def olculen(ad: str) -> Callable[[Callable], Callable]:
+    """Fonksiyonun her çağrısını `ad` adıyla ölçen dekoratör (kapalıyken sadece bayrak kontrolü)."""
+    def dekorator(fonksiyon: Callable) -> Callable:
+        @functools.wraps(fonksiyon)
+        def sarmalayici(*args, **kwargs):
+            if not _etkin:
+                return fonksiyon(*args, **kwargs)
+            with _Span(ad):
+                return fonksiyon(*args, **kwargs)
+        return sarmalayici
+    return dekorator
+
+
+def kaydet(ad: str, sure_ms: float) -> None:
+    """Bir ölçümü (milisaniye) ilgili histograma ekler. Ölçüm kapalıysa yok sayılır."""
+    if not _etkin:
+        return
+    with _kilit:
+        istatistik = _istatistikler.get(ad)
+        if istatistik is None:
+            istatistik = _istatistikler[ad] = _Istatistik()
+        istatistik.ekle(sure_ms)
+
+
+def etkin_mi() -> bool:
+    return _etkin
+
+
+def etkinlestir(rapor_dosyasi: Optional[str] = None) -> None:
+    """Ölçümü açar; program kapanırken rapor verilen dosyaya (varsayılan: proje dizini) yazılır."""
+    global _etkin, _rapor_dosyasi
+    if not _etkin:
+        atexit.register(_cikista_yaz)
+    _etkin = True
+    if rapor_dosyasi:
+        _rapor_dosyasi = rapor_dosyasi
+    elif _rapor_dosyasi is None:
+        proje_dizini = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+        _rapor_dosyasi = os.path.join(proje_dizini, VARSAYILAN_RAPOR_DOSYASI)
+
+
+def devre_disi_birak() -> None:
+    """Ölçümü kapatır (toplanan veriler silinmez)."""
+    global _etkin
+    _etkin = False
+
+
+def ozet() -> Dict[str, Dict[str, Any]]:
+    """Tüm span'lerin istatistikleri, ada göre sıralı."""
+    with _kilit:
+        return {ad: _istatistikler[ad].sozluk() for ad in sorted(_istatistikler)}
+
+
+def ham_veriler() -> Dict[str, Dict[str, Any]]:
+    """
+    Tüm span'lerin ham sayaçları. Toplu yükleme süreçleri bunu sonuçlarıyla birlikte ana sürece
+    gönderir; ana süreç birlestir ile kendi ölçümlerine ekler.
+    """
+    with _kilit:
+        return {ad: istatistik.ham() for ad, istatistik in _istatistikler.items()}
+
+
+def birlestir(ham_veriler: Dict[str, Dict[str, Any]]) -> None:
+    """Başka bir süreçten gelen ham sayaçları ölçümlere ekler. Ölçüm kapalıysa yok sayılır."""
+    if not _etkin or not ham_veriler:
+        return
+    with _kilit:
+        for ad, ham in ham_veriler.items():
+            istatistik = _istatistikler.get(ad)
+            if istatistik is None:
+                istatistik = _istatistikler[ad] = _Istatistik()
+            istatistik.birlestir(ham)
+
+
+def surecte_calistir(fonksiyon: Callable, *args, **kwargs) -> Tuple[Any, Dict[str, Dict[str, Any]]]:
+    """
+    (Worker süreci) Fonksiyonu çalıştırır; sonucu ve bu işin ölçümlerini (ölçüm kapalıysa boş) döndürür.
+
+    ProcessPoolExecutor süreçleri (Linux'ta fork/forkserver) os._exit ile kapanır; atexit çalışmaz.
+    Bu yüzden ölçümler sonuçla birlikte ana sürece gönderilir ve orada birlestir ile eklenir:
+        sonuc, olcumler = is_.result(); olcum.birlestir(olcumler)
+    """
+    sifirla() # Süreç önceki işlerin (fork'ta ana sürecin) ölçümlerini taşımasın
+    sonuc = fonksiyon(*args, **kwargs)
+    return sonuc, (ham_veriler() if _etkin else {})
+
+
+def sifirla() -> None:
+    """Toplanan tüm ölçümleri siler."""
+    with _kilit:
+        _istatistikler.clear()
+
+
+def rapor_yaz(dosya_yolu: Optional[str] = None) -> Optional[str]:
+    """
+    Ölçüm özetini JSON olarak yazar.
+
+    Args:
+        dosya_yolu (str, optional): Rapor dosyası. Verilmezse etkinlestir'de belirlenen dosya.
+
+    Returns:
+        Optional[str]: Yazılan dosyanın yolu, yazılacak ölçüm yoksa None.
+    """
+    dosya_yolu = dosya_yolu or _rapor_dosyasi or VARSAYILAN_RAPOR_DOSYASI
+    veriler = ozet()
+    if not veriler:
+        return None
+    rapor = {"zaman": time.strftime("%Y-%m-%dT%H:%M:%S"), "pid": os.getpid(), "olcumler": veriler}
+    with open(dosya_yolu, "w", encoding="utf-8") as f:
+        json.dump(rapor, f, ensure_ascii=False, indent=2)
+    return dosya_yolu
+
+
+def _cikista_yaz() -> None:
+    if multiprocessing.parent_process() is not None:
+        # Toplu yükleme süreçlerinin ölçümleri iş sonuçlarıyla ana sürece gider (bkz. ham_veriler);
+        # spawn ile başlayan süreçler ana sürecin raporunun üzerine yazmasın
+        return
+    try:
+        yol = rapor_yaz()
+        if yol:
+            print(f"Performans ölçüm raporu yazıldı: {yol}")
+    except Exception as e:
+        print(f"HATA: Performans ölçüm raporu yazılamadı: {e}")
+
+
+if os.environ.get("PERFORMANS_OLCUM", "").strip() not in ("", "0"):
+    etkinlestir(os.environ.get("PERFORMANS_OLCUM_DOSYASI") or None)
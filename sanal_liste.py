@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+# --- sanal_liste.py ---
+# Öğrenci listesi (ttk.Treeview) için sanal liste desteği.
+# Binlerce satırlık listelerde sadece ekranda görünen satırlar gerçek Tk öğesi
+# olarak tutulur, diğerleri kaydırıldıkça doldurulur.
+
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, Dict, List, Optional, Tuple
+
+VARSAYILAN_SATIR_YUKSEKLIGI = 20 # Tema satır yüksekliği bildirmezse kullanılır
+
+
+class SanalListe:
+    """
+    Bir ttk.Treeview'i sanal liste olarak yönetir.
+
+    Tüm satırların sırası `iidler` listesinde tutulur (iid = df index'inin metin hali).
+    Treeview'de sadece görünen pencere kadar öğe bulunur; kaydırma çubuğu, fare tekerleği
+    ve ok tuşları bu pencereyi kaydırır. Seçim mantıksal olarak saklanır, böylece seçili
+    satır ekrandan çıkıp geri geldiğinde seçim kaybolmaz ve geri çağrı tekrar tetiklenmez.
+    """
+
+    def __init__(self, tree: ttk.Treeview, scrollbar_y: tk.Scrollbar,
+                 secim_geri_cagrisi: Callable[[Optional[tk.Event]], None]) -> None:
+        self.tree = tree
+        self.scrollbar_y = scrollbar_y
+        self.secim_geri_cagrisi = secim_geri_cagrisi
+
+        self.iidler: List[str] = []          # Tüm satırlar (görüntüleme sırasıyla)
+        self._sira: Dict[str, int] = {}      # iid -> iidler içindeki konumu
+        self._saglayici: Optional[Callable[[str], Tuple]] = None # iid -> hücre değerleri
+        self._degerler: Dict[str, Tuple] = {} # Hesaplanmış hücre değerleri (tembel doldurulur)
+        self.baslangic = 0                   # Görünen penceredeki ilk satırın konumu
+        self.gorunen_satir = 20              # Pencereye sığan satır sayısı
+        self.secili_iid: Optional[str] = None
+
+        self.scrollbar_y.config(command=self.yview)
+        self.tree.bind("<<TreeviewSelect>>", self._secim_olayi)
+        self.tree.bind("<Configure>", self._boyut_degisti)
+        self.tree.bind("<MouseWheel>", self._tekerlek)
+        self.tree.bind("<Button-4>", self._tekerlek)
+        self.tree.bind("<Button-5>", self._tekerlek)
+        for tus in ("<Up>", "<Down>", "<Prior>", "<Next>", "<Home>", "<End>"):
+            self.tree.bind(tus, self._tus)
+
+    # --- Veri ---
+    def veri_ayarla(self, iidler: List[str], saglayici: Optional[Callable[[str], Tuple]]) -> None:
+        """
+        Listelenecek satırları ve hücre değerlerini üretecek fonksiyonu ayarlar.
+
+        Treeview'de zaten bulunan satırlar silinmez; değerleri yeni modelden farklıysa
+        yerinde güncellenir. Kaydırma konumu ve (satır hâlâ varsa) seçim korunur.
+        """
+        gorunen_eski = {iid: self._degerler[iid] for iid in self.tree.get_children() if iid in self._degerler}
+        self.iidler = list(iidler)
+        self._sira = {iid: konum for konum, iid in enumerate(self.iidler)}
+        self._saglayici = saglayici
+        self._degerler = {}
+        if self.secili_iid not in self._sira:
+            self.secili_iid = None
+        self.kaydir(self.baslangic, zorla=True) # Eksik satırları ekler, fazlaları siler
+        try:
+            for iid, eski in gorunen_eski.items():
+                if self.tree.exists(iid):
+                    yeni = self.degerler(iid)
+                    if yeni != eski:
+                        self.tree.item(iid, values=yeni)
+        except tk.TclError as e:
+            print(f"Sanal liste güncellenirken hata: {e}")
+
+    def satirlari_yenile(self, iidler) -> None:
+        """Verilen satırların değerlerini yeniden hesaplar; görünenlerden değişenleri günceller."""
+        try:
+            gorunen = set(self.tree.get_children())
+            for iid in iidler:
+                eski = self._degerler.pop(iid, None)
+                if iid in gorunen:
+                    yeni = self.degerler(iid)
+                    if yeni != eski:
+                        self.tree.item(iid, values=yeni)
+        except tk.TclError as e:
+            print(f"Sanal liste satırları yenilenirken hata: {e}")
+
+    def sifirla(self) -> None:
+        """Listeyi, kaydırma konumunu ve seçimi tamamen temizler."""
+        self.secili_iid = None
+        self.baslangic = 0
+        try:
+            mevcut = self.tree.get_children()
+            if mevcut: self.tree.delete(*mevcut)
+        except tk.TclError: pass
+        self.veri_ayarla([], None)
+
+    def konum(self, iid: str) -> Optional[int]:
+        """Satırın listedeki konumu (listede yoksa None)."""
+        return self._sira.get(iid)
+
+    def degerler(self, iid: str) -> Tuple:
+        """Bir satırın hücre değerlerini döndürür (ilk istekte hesaplanır)."""
+        deger = self._degerler.get(iid)
+        if deger is None:
+            deger = tuple(self._saglayici(iid)) if self._saglayici else ()
+            self._degerler[iid] = deger
+        return deger
+
+    # --- Kaydırma ---
+    def yview(self, *args) -> None:
+        """Kaydırma çubuğu komutu ('moveto' / 'scroll')."""
+        if not args:
+            return
+        if args[0] == "moveto":
+            self.kaydir(int(float(args[1]) * len(self.iidler)))
+        elif args[0] == "scroll":
+            adim = int(args[1])
+            if len(args) > 2 and args[2] == "pages":
+                adim *= max(1, self.gorunen_satir - 1)
+            self.kaydir(self.baslangic + adim)
+
+    def kaydir(self, yeni_baslangic: int, zorla: bool = False) -> None:
+        """Görünen pencereyi verilen konumdan başlayacak şekilde kaydırır."""
+        en_fazla = max(0, len(self.iidler) - self.gorunen_satir)
+        yeni_baslangic = max(0, min(yeni_baslangic, en_fazla))
+        if zorla or yeni_baslangic != self.baslangic:
+            self.baslangic = yeni_baslangic
+            self._ciz()
+
+    def gor(self, iid: str) -> None:
+        """Verilen satır görünür olacak şekilde kaydırır (Treeview.see karşılığı)."""
+        konum = self._sira.get(iid)
+        if konum is None:
+            return
+        if konum < self.baslangic:
+            self.kaydir(konum)
+        elif konum >= self.baslangic + self.gorunen_satir:
+            self.kaydir(konum - self.gorunen_satir + 1)
+
+    def _ciz(self) -> None:
+        """Görünen penceredeki satırları gerçek Treeview öğeleri olarak yerleştirir."""
+        istenen = self.iidler[self.baslangic:self.baslangic + self.gorunen_satir]
+        try:
+            mevcut = self.tree.get_children()
+            if tuple(istenen) != mevcut:
+                istenen_kume = set(istenen)
+                silinecek = [iid for iid in mevcut if iid not in istenen_kume]
+                if silinecek:
+                    self.tree.delete(*silinecek)
+                for konum, iid in enumerate(istenen):
+                    if self.tree.exists(iid):
+                        self.tree.move(iid, '', konum)
+                    else:
+                        self.tree.insert('', konum, iid=iid, text="", values=self.degerler(iid))
+            # Mantıksal seçim görünen penceredeyse Treeview seçimini geri yükle
+            if self.secili_iid is not None and self.tree.exists(self.secili_iid) \
+                    and self.tree.selection() != (self.secili_iid,):
+                self.tree.selection_set(self.secili_iid)
+                self.tree.focus(self.secili_iid)
+        except tk.TclError as e:
+            print(f"Sanal liste çizilirken hata: {e}")
+        self._kaydirma_cubugunu_guncelle()
+
+    def _kaydirma_cubugunu_guncelle(self) -> None:
+        toplam = len(self.iidler)
+        if toplam <= 0:
+            self.scrollbar_y.set(0.0, 1.0)
+            return
+        ilk = self.baslangic / toplam
+        son = min(1.0, (self.baslangic + self.gorunen_satir) / toplam)
+        self.scrollbar_y.set(ilk, son)
+
+    def _boyut_degisti(self, event=None) -> None:
+        """Treeview yeniden boyutlandığında pencereye sığan satır sayısını günceller."""
+        satir_yuksekligi = VARSAYILAN_SATIR_YUKSEKLIGI
+        baslik_yuksekligi = VARSAYILAN_SATIR_YUKSEKLIGI + 4
+        children = self.tree.get_children()
+        kutu = self.tree.bbox(children[0]) if children else None
+        if kutu: # Gerçek ölçüler biliniyorsa onları kullan
+            baslik_yuksekligi, satir_yuksekligi = kutu[1], kutu[3]
+        else:
+            try: satir_yuksekligi = int(ttk.Style().lookup("Treeview", "rowheight")) or satir_yuksekligi
+            except (ValueError, tk.TclError): pass
+        yeni = max(1, (self.tree.winfo_height() - baslik_yuksekligi) // max(1, satir_yuksekligi))
+        if yeni != self.gorunen_satir:
+            self.gorunen_satir = yeni
+            self.kaydir(self.baslangic, zorla=True)
+
+    def _tekerlek(self, event: tk.Event) -> str:
+        if event.num == 4: adim = -3
+        elif event.num == 5: adim = 3
+        else: adim = -3 if event.delta > 0 else 3
+        self.kaydir(self.baslangic + adim)
+        return "break"
+
+    # --- Seçim ---
+    def secimi_ayarla(self, iid: str, bildir: bool = False) -> None:
+        """Satırı seçer ve görünür yapar. bildir=True ise seçim geri çağrısı çalıştırılır."""
+        if iid not in self._sira:
+            return
+        self.secili_iid = iid
+        self.gor(iid)
+        self._ciz()
+        if bildir:
+            self.secim_geri_cagrisi(None)
+
+    def secimi_temizle(self) -> None:
+        """Mantıksal seçimi ve Treeview seçimini kaldırır."""
+        self.secili_iid = None
+        secim = self.tree.selection()
+        if secim: self.tree.selection_remove(secim)
+
+    def _secim_olayi(self, event: tk.Event) -> None:
+        secim = self.tree.selection()
+        if secim:
+            if secim[0] == self.secili_iid:
+                return # Kaydırma sonrası geri yüklenen seçim, değişiklik yok
+            self.secili_iid = secim[0]
+        elif self.secili_iid is not None and not self.tree.exists(self.secili_iid):
+            return # Seçili satır sadece ekrandan çıktı
+        else:
+            self.secili_iid = None
+        self.secim_geri_cagrisi(event)
+
+    def _tus(self, event: tk.Event) -> str:
+        """Ok/sayfa tuşlarıyla seçimi tüm liste üzerinde hareket ettirir."""
+        if not self.iidler:
+            return "break"
+        konum = self._sira.get(self.secili_iid) if self.secili_iid is not None else None
+        son = len(self.iidler) - 1
+        if event.keysym == "Home": yeni = 0
+        elif event.keysym == "End": yeni = son
+        elif konum is None: yeni = self.baslangic
+        elif event.keysym == "Up": yeni = konum - 1
+        elif event.keysym == "Down": yeni = konum + 1
+        elif event.keysym == "Prior": yeni = konum - max(1, self.gorunen_satir - 1)
+        else: yeni = konum + max(1, self.gorunen_satir - 1)
+        yeni = max(0, min(yeni, son))
+        if yeni != konum:
+            self.secimi_ayarla(self.iidler[yeni], bildir=True)
+        return "break"
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+# --- satir_havuzu.py ---
+# Ayar ve kriter düzenleyicilerinde tekrar kullanılan satır widget'ları.
+# Liste değiştiğinde (ders/kriter eklendi, silindi, ders değişti) tüm satırları yok edip
+# baştan kurmak yerine görünen satırlar korunur: eksik satırlar havuzdan alınır (havuz boşsa
+# oluşturulur), fazla satırlar gizlenip havuza bırakılır, silinen satırın altındakiler sadece
+# bir üst konuma kaydırılır. Satırlar gui.py'deki gibi widget sözlükleridir.
+
+import tkinter as tk
+from tkinter import ttk
+from typing import Any, Callable, Dict, List, Optional
+
+Satir = Dict[str, Any]
+
+
+class SatirHavuzu:
+    """
+    Bir çerçevedeki satırları sırayla tutan ve gizlenen satırları tekrar kullanan havuz.
+
+    Args:
+        ebeveyn (tk.Misc): Satırların yerleştirildiği çerçeve. Çerçeve değişirse (pencere yeniden
+            açıldıysa) yeni bir havuz kurulmalıdır.
+        olustur (Callable[[SatirHavuzu], Satir]): Yeni bir satırın widget'larını oluşturur
+            (komutlar ve kısayollar burada bir kez bağlanır).
+        yerlestir (Callable[[Satir, int], None]): Satırı verilen konumda gösterir (grid).
+        gizle (Callable[[Satir], None]): Satırı gizler (grid_remove); widget'lar yok edilmez.
+        bos_yerlesimi (Dict[str, Any], optional): Hiç satır yokken gösterilen etiketin grid ayarları.
+    """
+
+    def __init__(self, ebeveyn: tk.Misc,
+                 olustur: Callable[["SatirHavuzu"], Satir],
+                 yerlestir: Callable[[Satir, int], None],
+                 gizle: Callable[[Satir], None],
+                 bos_yerlesimi: Optional[Dict[str, Any]] = None) -> None:
+        self.ebeveyn = ebeveyn
+        self._olustur = olustur
+        self._yerlestir = yerlestir
+        self._gizle = gizle
+        self._bos_yerlesimi = bos_yerlesimi or {"row": 0, "column": 0, "sticky": "w"}
+        self.satirlar: List[Satir] = [] # Görünen satırlar, ekrandaki sırayla
+        self._bosta: List[Satir] = []   # Gizlenmiş, tekrar kullanılacak satırlar
+        self._bos_etiketi: Optional[ttk.Label] = None
+
+    def __len__(self) -> int:
+        return len(self.satirlar)
+
+    def gecerli_mi(self, ebeveyn: tk.Misc) -> bool:
+        """Havuz bu çerçeveye ait ve çerçeve hâlâ duruyor mu?"""
+        if self.ebeveyn is not ebeveyn:
+            return False
+        try:
+            return bool(ebeveyn.winfo_exists())
+        except tk.TclError:
+            return False
+
+    # --- Satırlar ---
+    def ekle(self) -> Satir:
+        """Listenin sonuna bir satır ekler (havuzda gizli satır varsa o kullanılır)."""
+        satir = self._bosta.pop() if self._bosta else self._olustur(self)
+        self.satirlar.append(satir)
+        self._yerlestir(satir, len(self.satirlar) - 1)
+        return satir
+
+    def cikar(self, konum: int) -> Satir:
+        """Verilen konumdaki satırı gizleyip havuza bırakır; alttaki satırlar yukarı kayar."""
+        satir = self.satirlar.pop(konum)
+        self._gizle(satir)
+        self._bosta.append(satir)
+        for yeni_konum in range(konum, len(self.satirlar)):
+            self._yerlestir(self.satirlar[yeni_konum], yeni_konum)
+        return satir
+
+    def esitle(self, sayi: int) -> List[Satir]:
+        """Görünen satır sayısını verilen sayıya getirir (sondan ekler/çıkarır) ve satırları döndürür."""
+        while len(self.satirlar) > sayi:
+            self.cikar(len(self.satirlar) - 1)
+        while len(self.satirlar) < sayi:
+            self.ekle()
+        return self.satirlar
+
+    # --- Boş Liste Etiketi ---
+    def bos_durumu(self, metin: str, **etiket_ayarlari: Any) -> None:
+        """Satır yoksa etiketi verilen metinle gösterir, satır varsa gizler."""
+        if self.satirlar:
+            if self._bos_etiketi is not None:
+                self._bos_etiketi.grid_remove()
+            return
+        if self._bos_etiketi is None:
+            self._bos_etiketi = ttk.Label(self.ebeveyn)
+        self._bos_etiketi.configure(text=metin, **etiket_ayarlari)
+        self._bos_etiketi.grid(**self._bos_yerlesimi)
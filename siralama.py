@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+# --- siralama.py ---
+# Öğrenci listesinin sütun başlığına tıklanarak sıralanması.
+# Her sütun için satırların sıra numaraları (eşit değerler aynı numara) bir kez hesaplanıp
+# saklanır; aynı sütuna tekrar tıklamak veya yön değiştirmek sadece bir tam sayı argsort'u,
+# daha önce sıralanmış bir yöne dönmek ise sözlükten okumadır. Metin sütunları Türkçe
+# alfabeye göre sıralanır (bkz. turkce.siralama_anahtari). Bir sütun düzenlendiğinde
+# sadece o sütunun önbelleği geçersiz kılınır.
+
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+import pandas as pd
+
+from modules import turkce
+
+_SONDA = np.iinfo(np.int64).max # Boş hücrelerin anahtarı: iki yönde de listenin sonunda
+
+
+def sira_numaralari(seri: pd.Series) -> np.ndarray:
+    """
+    Her satırın değerinin sütundaki sıra numarası (eşit değerler aynı numarayı alır, boş = -1).
+
+    Sayısal sütunlar değerine, diğerleri Türkçe sıralama anahtarına göre numaralanır.
+    """
+    bos = seri.isna().to_numpy()
+    numaralar = np.full(len(seri), -1, dtype=np.int64)
+    dolu = seri[~bos]
+    if pd.api.types.is_numeric_dtype(seri.dtype) and not pd.api.types.is_bool_dtype(seri.dtype):
+        degerler = dolu.to_numpy(dtype="float64")
+    else:
+        degerler = np.array([turkce.siralama_anahtari(deger) for deger in dolu], dtype=str)
+    if len(degerler):
+        _, numaralar[~bos] = np.unique(degerler, return_inverse=True)
+    return numaralar
+
+
+class SiralamaOnbellegi:
+    """Bir sınıfın sütun bazında sıralama önbelleği (sıra numaraları ve hazır sıralamalar)."""
+
+    def __init__(self) -> None:
+        self._numaralar: Dict[str, np.ndarray] = {}              # sütun -> sira_numaralari
+        self._siralar: Dict[Tuple[str, bool], np.ndarray] = {}   # (sütun, azalan) -> satır konumları
+
+    def konumlar(self, df: pd.DataFrame, sutun: str, azalan: bool = False) -> np.ndarray:
+        """
+        Satırların (iloc) konumlarını sütuna göre sıralı döndürür.
+
+        Sıralama kararlıdır (eşit değerler tablodaki sırasını korur); boş hücreler iki yönde de sonda.
+        """
+        sira = self._siralar.get((sutun, azalan))
+        if sira is not None and len(sira) == len(df):
+            return sira
+        numaralar = self._numaralar.get(sutun)
+        if numaralar is None or len(numaralar) != len(df):
+            numaralar = self._numaralar[sutun] = sira_numaralari(df[sutun])
+        anahtarlar = np.where(numaralar < 0, _SONDA, -numaralar if azalan else numaralar)
+        sira = self._siralar[(sutun, azalan)] = np.argsort(anahtarlar, kind="stable")
+        return sira
+
+    def gecersiz_kil(self, sutunlar: Iterable[str]) -> None:
+        """Değişen sütunların anahtarlarını ve sıralamalarını atar (diğer sütunlar etkilenmez)."""
+        for sutun in sutunlar:
+            self._numaralar.pop(sutun, None)
+            self._siralar.pop((sutun, False), None)
+            self._siralar.pop((sutun, True), None)
+
+    def temizle(self) -> None:
+        self._numaralar.clear()
+        self._siralar.clear()
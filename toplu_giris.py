@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+# --- toplu_giris.py ---
+# Bir sınıfın notlarını tek seferde girmek için: Excel'den kopyalanıp yapıştırılan sütun bloğu
+# veya CSV dosyası okunur, Öğrenci No ile eşleştirilir ve tüm değerler vektörel olarak doğrulanır.
+# Tk'ya bağımlı değildir; arayüz sonucu tek bir işlem olarak uygular (tek hesaplama, tek yenileme).
+#
+# Beklenen biçim (ilk satır başlık; ayraç sekme, noktalı virgül veya virgül):
+#   Öğrenci No <TAB> Kriter 1 <TAB> Kriter 2
+#   101        <TAB> 85       <TAB> 90
+# Boş hücreler değiştirilmez. Birleşik (toplu yüklenen) tablolarda 'Sınıf' sütunu da verilebilir.
+
+import csv
+import io
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+import pandas as pd
+
+from modules import turkce, veri_semasi
+
+NOT_ARALIGI = (0, 100)
+EN_FAZLA_HATA = 20 # Kullanıcıya gösterilecek en fazla hata satırı
+SINIF_SUTUNU = "Sınıf" # toplu_yukleme.SINIF_SUTUNU (döngüsel içe aktarma olmasın diye tekrar tanımlı)
+
+# Başlıkta "Öğrenci No" yerine kabul edilen yazımlar (küçük harfe çevrilmiş)
+NUMARA_BASLIKLARI = {"öğrenci no", "ogrenci no", "öğrenci numarası", "numara", "no", "okul no"}
+
+
+class TopluGirisHatasi(Exception):
+    """Girdi okunamadığında veya sınıfla eşleştirilemediğinde fırlatılır (mesaj kullanıcıya gösterilir)."""
+
+
+class TopluGirisSonucu(NamedTuple):
+    degerler: Dict[int, Dict[str, int]] # {df index: {sütun: not}} (sadece geçerli ve boş olmayanlar)
+    hatalar: List[str]                  # Satır/sütun bazında doğrulama hataları (ilk EN_FAZLA_HATA tanesi)
+    hata_sayisi: int
+    hucre_sayisi: int                   # Uygulanacak hücre sayısı
+
+
+def _kucuk(metin: Any) -> str:
+    return turkce.kucuk_harf(metin)
+
+
+def metni_ayristir(metin: str) -> pd.DataFrame:
+    """
+    Yapıştırılan metni veya CSV içeriğini başlıklı bir tabloya çevirir (tüm hücreler metin).
+
+    Raises:
+        TopluGirisHatasi: Metin boşsa veya başlık satırında Öğrenci No sütunu yoksa.
+    """
+    satirlar = [satir for satir in metin.strip("﻿\r\n").splitlines() if satir.strip()]
+    if len(satirlar) < 2:
+        raise TopluGirisHatasi("En az bir başlık satırı ve bir veri satırı gerekli.")
+    # Excel'den kopyalanan bloklar sekmeyle ayrılır; Türkçe Excel CSV'leri genelde noktalı virgül kullanır
+    ilk = satirlar[0]
+    ayrac = "\t" if "\t" in ilk else ";" if ";" in ilk else ","
+    okuyucu = csv.reader(io.StringIO("\n".join(satirlar)), delimiter=ayrac)
+    basliklar, *veri = list(okuyucu)
+    basliklar = [baslik.strip() for baslik in basliklar]
+    for i, baslik in enumerate(basliklar):
+        if _kucuk(baslik) in NUMARA_BASLIKLARI:
+            basliklar[i] = veri_semasi.NUMARA_SUTUNU
+        elif _kucuk(baslik) == _kucuk(SINIF_SUTUNU):
+            basliklar[i] = SINIF_SUTUNU
+    if veri_semasi.NUMARA_SUTUNU not in basliklar:
+        raise TopluGirisHatasi("Başlık satırında 'Öğrenci No' sütunu bulunamadı.\n"
+                               "İlk satır sütun adlarını içermeli (örn. Öğrenci No, Kriter 1, ...).")
+    genislik = len(basliklar)
+    veri = [(satir + [""] * genislik)[:genislik] for satir in veri] # Eksik/fazla hücreleri düzelt
+    return pd.DataFrame(veri, columns=basliklar, dtype=object)
+
+
+def dosyadan_oku(dosya_yolu: str) -> pd.DataFrame:
+    """CSV/metin dosyasını okur (UTF-8, BOM'lu UTF-8 veya Windows-1254)."""
+    for kodlama in ("utf-8-sig", "cp1254"):
+        try:
+            with open(dosya_yolu, encoding=kodlama) as f:
+                return metni_ayristir(f.read())
+        except UnicodeDecodeError:
+            continue
+    raise TopluGirisHatasi("Dosyanın karakter kodlaması okunamadı (UTF-8 veya Windows-1254 olmalı).")
+
+
+def dogrula(girdi: pd.DataFrame, df: pd.DataFrame, izinli_sutunlar: Sequence[str]) -> TopluGirisSonucu:
+    """
+    Girdi tablosunu sınıfla eşleştirir ve tüm notları tek geçişte (vektörel) doğrular.
+
+    Args:
+        girdi (pd.DataFrame): metni_ayristir/dosyadan_oku sonucu.
+        df (pd.DataFrame): Aktif sınıfın verisi.
+        izinli_sutunlar (Sequence[str]): Not girilebilecek sütunlar (yazılılar, proje, dersin kriterleri).
+
+    Returns:
+        TopluGirisSonucu: Uygulanacak değerler ve hatalar.
+
+    Raises:
+        TopluGirisHatasi: Not sütunu yoksa, izin verilmeyen sütun varsa veya öğrenciler eşleştirilemiyorsa.
+    """
+    not_sutunlari = [s for s in girdi.columns if s not in (veri_semasi.NUMARA_SUTUNU, SINIF_SUTUNU)]
+    bilinmeyenler = [s for s in not_sutunlari if s not in izinli_sutunlar]
+    if bilinmeyenler:
+        raise TopluGirisHatasi(f"Bu ders için not girilemeyen sütunlar: {', '.join(bilinmeyenler)}\n"
+                               f"Girilebilecek sütunlar: {', '.join(izinli_sutunlar)}")
+    if not not_sutunlari:
+        raise TopluGirisHatasi("Öğrenci No dışında en az bir not sütunu gerekli.")
+    if len(set(girdi.columns)) != len(girdi.columns):
+        raise TopluGirisHatasi("Aynı sütun başlığı birden fazla kez kullanılmış.")
+    if veri_semasi.NUMARA_SUTUNU not in df.columns:
+        raise TopluGirisHatasi("Yüklü sınıfta 'Öğrenci No' sütunu yok.")
+
+    hatalar: List[str] = []
+    satir_no = pd.Series(range(2, len(girdi) + 2), index=girdi.index) # Kullanıcının gördüğü satır (başlık = 1)
+
+    # --- Öğrencileri eşleştir: (Sınıf,) Öğrenci No -> df index ---
+    numaralar = pd.to_numeric(girdi[veri_semasi.NUMARA_SUTUNU].str.strip(), errors="coerce")
+    anahtar_sutunlari = [veri_semasi.NUMARA_SUTUNU]
+    if SINIF_SUTUNU in df.columns and SINIF_SUTUNU in girdi.columns:
+        anahtar_sutunlari.insert(0, SINIF_SUTUNU)
+    elif df[veri_semasi.NUMARA_SUTUNU].dropna().duplicated().any():
+        raise TopluGirisHatasi("Bu tabloda aynı öğrenci numarası birden fazla sınıfta var.\n"
+                               "Girdiye 'Sınıf' sütunu ekleyin veya sınıfı tek başına açın.")
+    # Numarası boş öğrenciler (sütun float64 + NaN kalır) numarayla eşleştirilemez; haritaya girmez
+    numarasi_olan = df[veri_semasi.NUMARA_SUTUNU].notna()
+    hedef = pd.DataFrame({veri_semasi.NUMARA_SUTUNU: df.loc[numarasi_olan, veri_semasi.NUMARA_SUTUNU].astype("int64")})
+    if len(anahtar_sutunlari) == 2:
+        hedef[SINIF_SUTUNU] = df.loc[numarasi_olan, SINIF_SUTUNU].astype(str)
+    index_haritasi = pd.Series(hedef.index, index=pd.MultiIndex.from_frame(hedef[anahtar_sutunlari])
+                               if len(anahtar_sutunlari) == 2 else hedef[veri_semasi.NUMARA_SUTUNU])
+
+    gecerli_no = numaralar.notna() & (numaralar % 1 == 0)
+    if len(anahtar_sutunlari) == 2:
+        anahtarlar = pd.MultiIndex.from_arrays([girdi[SINIF_SUTUNU].str.strip(), numaralar.fillna(-1).astype("int64")])
+    else:
+        anahtarlar = pd.Index(numaralar.fillna(-1).astype("int64"))
+    indeksler = pd.Series(index_haritasi.reindex(anahtarlar).to_numpy(), index=girdi.index)
+    bulunamayan = gecerli_no & indeksler.isna()
+    tekrar = gecerli_no & anahtarlar.duplicated(keep=False)
+    for satir in satir_no[~gecerli_no]:
+        hatalar.append(f"Satır {satir}: Öğrenci No geçersiz.")
+    for satir, no in zip(satir_no[bulunamayan], girdi.loc[bulunamayan, veri_semasi.NUMARA_SUTUNU]):
+        hatalar.append(f"Satır {satir}: {no} numaralı öğrenci sınıfta yok.")
+    for satir, no in zip(satir_no[tekrar], girdi.loc[tekrar, veri_semasi.NUMARA_SUTUNU]):
+        hatalar.append(f"Satır {satir}: {no} numaralı öğrenci birden fazla kez girilmiş.")
+    eslesen = gecerli_no & ~bulunamayan & ~tekrar
+
+    # --- Notları doğrula: 0-100 arası tam sayı, boş hücre = değişiklik yok ---
+    metinler = girdi[not_sutunlari].apply(lambda sutun: sutun.str.strip().str.replace(",", ".", regex=False))
+    bos = metinler.isna() | (metinler == "")
+    sayilar = metinler.apply(pd.to_numeric, errors="coerce")
+    gecersiz = ~bos & (sayilar.isna() | (sayilar % 1 != 0) | (sayilar < NOT_ARALIGI[0]) | (sayilar > NOT_ARALIGI[1]))
+    for sutun in not_sutunlari:
+        for satir, deger in zip(satir_no[gecersiz[sutun]], girdi.loc[gecersiz[sutun], sutun]):
+            hatalar.append(f"Satır {satir}, '{sutun}': '{deger}' geçersiz (0-100 tam sayı olmalı).")
+
+    degerler: Dict[int, Dict[str, int]] = {}
+    uygulanacak = ~bos & ~gecersiz & eslesen.to_numpy()[:, None]
+    for sutun in not_sutunlari:
+        maske = uygulanacak[sutun]
+        for index, deger in zip(indeksler[maske], sayilar.loc[maske, sutun]):
+            degerler.setdefault(int(index), {})[sutun] = int(deger)
+
+    return TopluGirisSonucu(degerler, hatalar[:EN_FAZLA_HATA], len(hatalar), int(uygulanacak.to_numpy().sum()))
+
+
+def izinli_sutunlar(ayarlar: Dict[str, Any], ders: Optional[str]) -> List[str]:
+    """Arayüzde not girilebilen sütunlar: yazılılar, proje ve dersin kriterleri."""
+    kriterler = ayarlar.get("ders_ayarlari", {}).get(ders, {}).get("kriterler", []) if ders else []
+    return ["Y1", "Y2", "PROJE"] + [kriter["ad"] for kriter in kriterler if kriter.get("ad")]
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+# --- toplu_yukleme.py ---
+# Bir klasördeki (veya glob desenine uyan) tüm e-Okul Excel dosyalarını
+# işlemci çekirdeklerine dağıtarak paralel yükler ve tek bir tabloda birleştirir.
+
+import glob
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from modules import olcum, veri_isleme, veri_semasi
+
+SINIF_SUTUNU = "Sınıf" # Birleşik tabloda öğrencinin geldiği sınıf/sayfa
+
+
+def dosyalari_bul(kaynak: str) -> List[str]:
+    """
+    Klasör verilirse içindeki .xlsx dosyalarını, aksi halde glob desenine uyan dosyaları döndürür.
+    Excel'in açık dosyalar için oluşturduğu '~$' kilit dosyaları atlanır.
+    """
+    if os.path.isdir(kaynak):
+        desen = os.path.join(kaynak, "*.xlsx")
+    else:
+        desen = kaynak
+    dosyalar = [yol for yol in glob.glob(desen)
+                if os.path.isfile(yol) and not os.path.basename(yol).startswith("~$")]
+    return sorted(dosyalar)
+
+
+def _dosyayi_yukle(dosya_yolu: str, satir_atla: Optional[int], tum_sayfalar: bool,
+                   eksik_veri_degeri: Any = None) -> List[Dict[str, Any]]:
+    """
+    (Worker süreci) Bir dosyanın ilk sayfasını veya tüm sayfalarını yükler.
+    Her sayfa için {"dosya", "sayfa", "df", "sinif_adi", "hata"} sözlüğü döndürür.
+    eksik_veri_degeri None ise veri_yukle_excel bunu ayarlar.json'dan okur.
+    """
+    sayfalar: List[Any] = [0]
+    if tum_sayfalar:
+        try:
+            import openpyxl
+            wb = openpyxl.load_workbook(dosya_yolu, read_only=True)
+            sayfalar = list(wb.sheetnames)
+            wb.close()
+        except Exception as e:
+            return [{"dosya": dosya_yolu, "sayfa": None, "df": None, "sinif_adi": None, "hata": f"Sayfalar okunamadı: {e}"}]
+
+    sonuclar = []
+    for sayfa in sayfalar:
+        try:
+            df, sinif_adi = veri_isleme.veri_yukle_excel(dosya_yolu, satir_atla=satir_atla, sheet_name=sayfa,
+                                                         eksik_veri_degeri=eksik_veri_degeri)
+            hata = None if df is not None else "Dosya işlenemedi (sütunlar veya satır atlama sayısı uyumsuz olabilir)."
+        except Exception as e:
+            df, sinif_adi, hata = None, None, str(e)
+        sonuclar.append({"dosya": dosya_yolu, "sayfa": sayfa, "df": df, "sinif_adi": sinif_adi, "hata": hata})
+    return sonuclar
+
+
+def toplu_yukle(kaynak: str, satir_atla: Optional[int] = None, tum_sayfalar: bool = False,
+                en_fazla_islem: Optional[int] = None,
+                ilerleme: Optional[Callable[[float, str], None]] = None,
+                iptal: Optional[threading.Event] = None) -> Tuple[pd.DataFrame, List[Dict[str, Any]]]:
+    """
+    Birden fazla sınıf dosyasını süreç havuzunda paralel yükler.
+
+    Args:
+        kaynak (str): Klasör yolu veya glob deseni (örn. 'C:/notlar/*.xlsx').
+        satir_atla (int, optional): Her sayfada başlık satırından önce atlanacak satır sayısı.
+                                    None (varsayılan) ise her sayfanın başlık satırı otomatik bulunur.
+        tum_sayfalar (bool): True ise her dosyanın tüm sayfaları ayrı sınıf olarak yüklenir.
+        en_fazla_islem (int, optional): Süreç sayısı (varsayılan: çekirdek sayısı).
+        ilerleme (callable, optional): ilerleme(oran, mesaj) ile tamamlanan dosyaları bildirir.
+        iptal (threading.Event, optional): Set edilirse bekleyen dosyalar iptal edilir.
+
+    Returns:
+        Tuple[pd.DataFrame, List[Dict]]: ('Sınıf' sütunu eklenmiş birleşik tablo,
+        her sayfa için {"dosya", "sayfa", "sinif_adi", "basarili", "ogrenci_sayisi", "hata"} raporu)
+
+    Raises:
+        veri_isleme.IslemIptalEdildi: iptal olayı set edildiyse.
+    """
+    bildir = ilerleme if ilerleme else (lambda oran, mesaj: None)
+    dosyalar = dosyalari_bul(kaynak)
+    print(f"Toplu yükleme: {len(dosyalar)} dosya bulundu ({kaynak}).")
+    if not dosyalar:
+        return pd.DataFrame(), []
+
+    sonuclar: Dict[str, List[Dict[str, Any]]] = {}
+    bildir(0.0, f"{len(dosyalar)} dosya yükleniyor...")
+    havuz = ProcessPoolExecutor(max_workers=en_fazla_islem)
+    iptal_edildi = False
+    try:
+        isler = {havuz.submit(olcum.surecte_calistir, _dosyayi_yukle, yol, satir_atla, tum_sayfalar): yol
+                 for yol in dosyalar}
+        for tamamlanan, is_ in enumerate(as_completed(isler), start=1):
+            veri_isleme._iptal_kontrol(iptal)
+            yol = isler[is_]
+            try:
+                sonuclar[yol], olcumler = is_.result()
+                olcum.birlestir(olcumler) # Worker'ın ölçümleri ana sürecin raporuna
+            except Exception as e: # Worker süreci çöktüyse
+                sonuclar[yol] = [{"dosya": yol, "sayfa": None, "df": None, "sinif_adi": None, "hata": str(e)}]
+            bildir(tamamlanan / len(dosyalar), f"{tamamlanan}/{len(dosyalar)} dosya: {os.path.basename(yol)}")
+    except veri_isleme.IslemIptalEdildi:
+        iptal_edildi = True
+        raise
+    finally:
+        # İptalde bekleyen işler atılır, çalışanların bitmesi beklenmez
+        havuz.shutdown(wait=not iptal_edildi, cancel_futures=True)
+
+    # Dosya sırasını koruyarak birleştir
+    parcalar = []
+    rapor = []
+    for yol in dosyalar:
+        for sonuc in sonuclar.get(yol, []):
+            df = sonuc["df"]
+            basarili = df is not None
+            if basarili:
+                df = df.copy()
+                df.insert(0, SINIF_SUTUNU, sonuc["sinif_adi"] or os.path.splitext(os.path.basename(yol))[0])
+                parcalar.append(df)
+            rapor.append({
+                "dosya": yol, "sayfa": sonuc["sayfa"], "sinif_adi": sonuc["sinif_adi"],
+                "basarili": basarili, "ogrenci_sayisi": len(df) if basarili else 0, "hata": sonuc["hata"],
+            })
+
+    birlesik = pd.concat(parcalar, ignore_index=True) if parcalar else pd.DataFrame()
+    veri_semasi.sema_uygula(birlesik) # Sınıf sütunu category; birleşince genişleyen tipler tekrar küçültülür
+    basarili_sayisi = sum(1 for r in rapor if r["basarili"])
+    print(f"Toplu yükleme tamamlandı: {basarili_sayisi}/{len(rapor)} sayfa, {len(birlesik)} öğrenci.")
+    return birlesik, rapor
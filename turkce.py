@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+# --- turkce.py ---
+# Türkçe metin yardımcıları. str.lower() Türkçe kurallarına uymaz:
+# "I" -> "i" (doğrusu "ı") ve "İ" -> "i̇" (i + birleşik nokta) üretir; bu yüzden
+# arama ve karşılaştırmalarda buradaki fonksiyonlar kullanılır.
+
+import re
+import unicodedata
+from typing import Any
+
+
+def kucuk_harf(metin: Any) -> str:
+    """
+    Metni Türkçe kurallarıyla küçük harfe çevirir (İ -> i, I -> ı).
+
+    Unicode NFC'ye normalleştirilir (Excel'den gelen ayrışık karakterler tek karaktere
+    birleşir) ve ardışık boşluklar teke indirilir.
+    """
+    metin = unicodedata.normalize("NFC", str(metin))
+    return " ".join(metin.replace("İ", "i").replace("I", "ı").lower().split())
+
+
+_SAYI = re.compile(r"\d+")
+
+# Türk alfabesi sırası (q, w, x yabancı adlar için araya yerleştirildi)
+_ALFABE = "abcçdefgğhıijklmnoöpqrsştuüvwxyz"
+# Harfler özel kullanım alanına (U+E000...) alfabe sırasıyla taşınır: rakam, boşluk ve
+# noktalama harflerden önce sıralanır. Şapkalı harfler şapkasız karşılığıyla aynı sayılır.
+_SIRALAMA_TABLOSU = str.maketrans({harf: chr(0xE000 + sira) for sira, harf in enumerate(_ALFABE)})
+_SIRALAMA_TABLOSU.update(str.maketrans({"â": chr(0xE000), "î": chr(0xE000 + _ALFABE.index("i")),
+                                        "û": chr(0xE000 + _ALFABE.index("u"))}))
+
+
+def siralama_anahtari(metin: Any) -> str:
+    """
+    Türkçe alfabetik sıralama için karşılaştırma anahtarı (büyük/küçük harf duyarsız).
+
+    Sistem yereline (locale.strxfrm, tr_TR) bağlı değildir; her platformda aynı sırayı verir:
+    "Çelik" "Cem"den sonra, "Işık" "İnce"den önce gelir. Metindeki sayılar sayı olarak
+    karşılaştırılır ("9-A" < "10-A").
+    """
+    metin = _SAYI.sub(lambda sayi: sayi.group().zfill(12), kucuk_harf(metin))
+    return metin.translate(_SIRALAMA_TABLOSU)
@@ -6,10 +6,31 @@ import openpyxl # Excel okumak için
 import os
 import sys
 import json
-from typing import Dict, Optional, Any, Tuple
+import copy
+import hashlib
+import pickle
+import stat
+import tempfile
+import threading
+from typing import Callable, Dict, List, Optional, Any, Tuple
+
+from modules import olcum, veri_semasi
 
 # --- Yardımcı Fonksiyonlar ---
 
+class IslemIptalEdildi(Exception):
+    """Uzun süren bir işlem (örn. arka planda yükleme) kullanıcı tarafından iptal edildi."""
+    pass
+
+class BaslikSatiriBulunamadi(ValueError):
+    """satir_atla=None ile yüklenen sayfada başlık satırı otomatik bulunamadı (kullanıcıya sorulmalı)."""
+    pass
+
+def _iptal_kontrol(iptal: Optional[threading.Event]) -> None:
+    """İptal istenmişse IslemIptalEdildi fırlatır."""
+    if iptal is not None and iptal.is_set():
+        raise IslemIptalEdildi("İşlem iptal edildi.")
+
 def get_resource_path(relative_path: str) -> str:
     """PyInstaller ile paketlendiğinde veya normal çalışırken dosya yolunu bulur."""
     try:
@@ -21,234 +42,522 @@ def get_resource_path(relative_path: str) -> str:
     return os.path.join(base_path, relative_path)
 
 # --- Ayar Fonksiyonları ---
-
-def load_settings(dosya_adi: str = "ayarlar.json") -> Dict[str, Any]:
-    """Ayarlar dosyasını (varsayılan: ayarlar.json) yükler."""
-    # Ayarlar dosyasının tam yolu (Proje ana dizininde arar)
-    # Not: get_resource_path kullanmak yerine doğrudan göreceli yol kullanmak
-    #      genellikle daha basittir, eğer PyInstaller kullanmayacaksanız.
-    #      Şimdilik basit yolu kullanalım:
+# ayarlar.json bir kez okunup doğrulanır ve bellekte tutulur; dosya sadece değişiklik
+# zamanı/boyutu değiştiğinde yeniden okunur. Kayıt geçici dosya + rename ile atomik yapılır.
+
+# Varsayılan ayarlar (dosya bulunamazsa veya bozuksa kullanılır)
+VARSAYILAN_AYARLAR = {
+    "ders_ayarlari": {},
+    "gui_ayarlari": {"tema": "clam", "pencere_boyutu": "1200x700", "baslik": "Performans Değerlendirme Sistemi"},
+    "genel_ayarlar": {"basari_siniri": 50, "eksik_veri_degeri": 0, "yazili_agirlik": 0.6, "proje_agirlik": 0.2,
+                      "calisma_alani_siniri": 5}
+}
+
+# {ayarlar dosyasının tam yolu: (st_mtime_ns, st_size, doğrulanmış ayarlar)}
+_ayar_onbellegi: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+_ayar_kilidi = threading.Lock()
+
+def _ayarlar_yolu(dosya_adi: str) -> str:
+    """Ayarlar dosyasının tam yolu (Proje ana dizininde arar; tam yol verilirse aynen kullanılır)."""
     try:
         # Ana proje dizinini bul (bu dosyanın olduğu yerin bir üstü)
         proje_dizini = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-        ayarlar_dosyasi = os.path.join(proje_dizini, dosya_adi)
-        print(f"Ayarlar dosyası aranıyor: {ayarlar_dosyasi}")
+        return os.path.join(proje_dizini, dosya_adi)
     except Exception:
-         # Eğer dizin bulunamazsa, mevcut dizinde ara (daha az olası)
-         ayarlar_dosyasi = dosya_adi
-
+        # Eğer dizin bulunamazsa, mevcut dizinde ara (daha az olası)
+        return dosya_adi
+
+def _ayarlari_tamamla(ayarlar: Dict[str, Any]) -> Dict[str, Any]:
+    """Yüklenen ayarlarda eksik anahtarlar varsa varsayılanlarla tamamlar (güvenlik için)."""
+    for anahtar, deger in VARSAYILAN_AYARLAR.items():
+        if anahtar not in ayarlar:
+            print(f"Uyarı: Ayarlarda '{anahtar}' bölümü eksik, varsayılan ekleniyor.")
+            ayarlar[anahtar] = copy.deepcopy(deger)
+        elif isinstance(deger, dict): # Eğer bölüm bir sözlükse, içini de kontrol et
+            for alt_anahtar, alt_deger in deger.items():
+                if alt_anahtar not in ayarlar[anahtar]:
+                    print(f"Uyarı: Ayarlarda '{anahtar}.{alt_anahtar}' ayarı eksik, varsayılan ekleniyor.")
+                    ayarlar[anahtar][alt_anahtar] = alt_deger
+    return ayarlar
+
+def _izinleri_hedefe_uydur(gecici_yol: str, hedef_yol: str) -> None:
+    """
+    mkstemp'in açtığı geçici dosya sadece sahibine açıktır (0600) ve os.replace bu izni korur.
+    Yerine konmadan önce izinler hedef dosyanınkine (yoksa open(..., "w") ile oluşacak varsayılana) ayarlanır.
+    """
+    try:
+        izinler = stat.S_IMODE(os.stat(hedef_yol).st_mode)
+    except OSError: # Hedef henüz yok: aynı dizinde normal yolla bir deneme dosyası oluşturup iznine bakılır
+        # (os.umask okumak için değiştirmek gerekir, bu da süreçteki diğer iş parçacıklarını etkilerdi)
+        deneme_yolu = f"{gecici_yol}.izin"
+        with open(deneme_yolu, "x"):
+            pass
+        try:
+            izinler = stat.S_IMODE(os.stat(deneme_yolu).st_mode)
+        finally:
+            os.remove(deneme_yolu)
+    os.chmod(gecici_yol, izinler)
+
+def _json_atomik_yaz(yol: str, veri: Any) -> None:
+    """JSON'u aynı dizindeki geçici dosyaya yazıp os.replace ile yerine koyar (yarım dosya kalmaz)."""
+    dizin = os.path.dirname(os.path.abspath(yol))
+    fd, gecici_yol = tempfile.mkstemp(prefix=".ayarlar.", suffix=".tmp", dir=dizin)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(veri, f, ensure_ascii=False, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        _izinleri_hedefe_uydur(gecici_yol, yol) # mkstemp'in 0600 izni ayar dosyasına geçmesin
+        os.replace(gecici_yol, yol)
+    except BaseException:
+        try: os.remove(gecici_yol)
+        except OSError: pass
+        raise
+
+def _onbellekteki_ayarlar(dosya_adi: str) -> Dict[str, Any]:
+    """Önbellekteki ayarları döndürür; dosya değiştiyse/yoksa yeniden okur. Dönen sözlük DEĞİŞTİRİLMEMELİ."""
+    ayarlar_dosyasi = _ayarlar_yolu(dosya_adi)
+    with _ayar_kilidi:
+        try:
+            bilgi = os.stat(ayarlar_dosyasi)
+        except OSError:
+            bilgi = None
 
-    # Varsayılan ayarlar (dosya bulunamazsa veya bozuksa kullanılır)
-    varsayilan_ayarlar = {
-        "ders_ayarlari": {},
-        "gui_ayarlari": {"tema": "clam", "pencere_boyutu": "1200x700", "baslik": "Performans Değerlendirme Sistemi"},
-        "genel_ayarlar": {"basari_siniri": 50, "eksik_veri_degeri": 0, "yazili_agirlik": 0.6, "proje_agirlik": 0.2}
-    }
+        kayit = _ayar_onbellegi.get(ayarlar_dosyasi)
+        if bilgi is not None and kayit is not None and kayit[0] == bilgi.st_mtime_ns and kayit[1] == bilgi.st_size:
+            return kayit[2]
 
-    try:
-        # Dosya var mı kontrol et
-        if not os.path.exists(ayarlar_dosyasi):
+        if bilgi is None:
             print(f"Uyarı: Ayarlar dosyası bulunamadı: {ayarlar_dosyasi}. Varsayılan ayarlar kullanılacak ve oluşturulacak.")
+            ayarlar = copy.deepcopy(VARSAYILAN_AYARLAR)
             try:
                 # Varsayılan ayarları içeren yeni bir dosya oluştur
-                with open(ayarlar_dosyasi, 'w', encoding='utf-8') as f:
-                    json.dump(varsayilan_ayarlar, f, ensure_ascii=False, indent=4)
+                _json_atomik_yaz(ayarlar_dosyasi, ayarlar)
                 print(f"Varsayılan ayarlar dosyası oluşturuldu: {ayarlar_dosyasi}")
-                return varsayilan_ayarlar
+                bilgi = os.stat(ayarlar_dosyasi)
             except Exception as create_e:
                 print(f"HATA: Varsayılan ayarlar dosyası oluşturulamadı: {create_e}")
                 print("Varsayılan ayarlar bellekte kullanılacak.")
-                return varsayilan_ayarlar # Yine de varsayılanı döndür
-
-        # Dosya varsa oku
-        with open(ayarlar_dosyasi, 'r', encoding='utf-8') as f:
-            ayarlar = json.load(f)
-            print("Ayarlar dosyası başarıyla okundu.")
-            # Yüklenen ayarlarda eksik anahtarlar varsa varsayılanlarla tamamla (güvenlik için)
-            for anahtar, deger in varsayilan_ayarlar.items():
-                if anahtar not in ayarlar:
-                    print(f"Uyarı: Ayarlarda '{anahtar}' bölümü eksik, varsayılan ekleniyor.")
-                    ayarlar[anahtar] = deger
-                elif isinstance(deger, dict): # Eğer bölüm bir sözlükse, içini de kontrol et
-                     for alt_anahtar, alt_deger in deger.items():
-                          if alt_anahtar not in ayarlar[anahtar]:
-                               print(f"Uyarı: Ayarlarda '{anahtar}.{alt_anahtar}' ayarı eksik, varsayılan ekleniyor.")
-                               ayarlar[anahtar][alt_anahtar] = alt_deger
-            return ayarlar
-    except json.JSONDecodeError:
-        print(f"HATA: Ayarlar dosyası ({ayarlar_dosyasi}) geçersiz JSON formatında. Varsayılan ayarlar kullanılıyor.")
-        return varsayilan_ayarlar
-    except Exception as e:
-        print(f"HATA: Ayarlar yüklenirken beklenmedik bir hata oluştu: {e}. Varsayılan ayarlar kullanılıyor.")
-        return varsayilan_ayarlar
+                return ayarlar # Önbelleğe alınmaz, bir sonraki çağrıda tekrar denenir
+        else:
+            print(f"Ayarlar dosyası okunuyor: {ayarlar_dosyasi}")
+            try:
+                with open(ayarlar_dosyasi, 'r', encoding='utf-8') as f:
+                    ayarlar = _ayarlari_tamamla(json.load(f))
+            except json.JSONDecodeError:
+                print(f"HATA: Ayarlar dosyası ({ayarlar_dosyasi}) geçersiz JSON formatında. Varsayılan ayarlar kullanılıyor.")
+                ayarlar = copy.deepcopy(VARSAYILAN_AYARLAR)
+            except Exception as e:
+                print(f"HATA: Ayarlar yüklenirken beklenmedik bir hata oluştu: {e}. Varsayılan ayarlar kullanılıyor.")
+                ayarlar = copy.deepcopy(VARSAYILAN_AYARLAR)
+
+        # Bozuk dosya için de kaydedilir: dosya düzeltilene (değişene) kadar tekrar okunmaz
+        _ayar_onbellegi[ayarlar_dosyasi] = (bilgi.st_mtime_ns, bilgi.st_size, ayarlar)
+        return ayarlar
 
-def save_settings(ayarlar: Dict[str, Any], dosya_adi: str = "ayarlar.json") -> bool:
-    """Ayarları JSON dosyasına (varsayılan: ayarlar.json) kaydeder."""
-    try:
-        # Ana proje dizinini bul
-        proje_dizini = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-        ayarlar_dosyasi = os.path.join(proje_dizini, dosya_adi)
-    except Exception:
-         ayarlar_dosyasi = dosya_adi
+def load_settings(dosya_adi: str = "ayarlar.json") -> Dict[str, Any]:
+    """Ayarlar dosyasını (varsayılan: ayarlar.json) yükler. Çağıranın değiştirebileceği bir kopya döndürür."""
+    return copy.deepcopy(_onbellekteki_ayarlar(dosya_adi))
 
+def ayar_degeri(bolum: str, anahtar: str, varsayilan: Any = None, dosya_adi: str = "ayarlar.json") -> Any:
+    """Tek bir ayarı kopyalamadan okur (örn. ayar_degeri("genel_ayarlar", "eksik_veri_degeri", 0))."""
+    return _onbellekteki_ayarlar(dosya_adi).get(bolum, {}).get(anahtar, varsayilan)
+
+def save_settings(ayarlar: Dict[str, Any], dosya_adi: str = "ayarlar.json") -> bool:
+    """Ayarları JSON dosyasına (varsayılan: ayarlar.json) atomik olarak kaydeder."""
+    ayarlar_dosyasi = _ayarlar_yolu(dosya_adi)
     try:
-        with open(ayarlar_dosyasi, 'w', encoding='utf-8') as f:
-            json.dump(ayarlar, f, ensure_ascii=False, indent=4)
+        with _ayar_kilidi:
+            _json_atomik_yaz(ayarlar_dosyasi, ayarlar)
+            bilgi = os.stat(ayarlar_dosyasi)
+            _ayar_onbellegi[ayarlar_dosyasi] = (bilgi.st_mtime_ns, bilgi.st_size, copy.deepcopy(ayarlar))
         print(f"Ayarlar başarıyla kaydedildi: {ayarlar_dosyasi}")
         return True
     except Exception as e:
         print(f"HATA: Ayarlar kaydedilirken bir hata oluştu: {e}")
         return False
 
+# --- Excel Sütunları ---
+
+# *** === KOLON EŞLEŞTİRME (DÜZELTİLDİ!) === ***
+# Bu sözlükteki anahtarlar (sol taraf) Excel'deki GERÇEK başlıklar olmalı.
+# Değerler (sağ taraf) program içinde kullanacağımız isimlerdir.
+KOLON_ESLESTIRME = {
+    # Excel Başlığı : Programdaki Adı
+    "Okul No"      : "Öğrenci No",
+    "Adı Soyadı"   : "Ad Soyad",
+    "Y1"           : "Y1",          # Düzeltildi (Önce "1. Yazılı" idi)
+    "Y2"           : "Y2",          # Düzeltildi (Önce "2. Yazılı" idi)
+    "P1"           : "Perf1",       # Düzeltildi (Önce "1. Performans" idi)
+    "P2"           : "Perf2",       # Düzeltildi (Önce "2. Performans" idi)
+    "D.ET.KAT."    : "DersEtKat",   # Düzeltildi (Önce "Ders Et. Kat." idi)
+    "PROJE"        : "PROJE"
+    # Başka sütunlar da almak isterseniz buraya ekleyebilirsiniz.
+    # Örneğin: "Ortalama": "Eokul Ortalama" # e-Okul'un kendi ortalamasını almak için
+}
+# *** ======================================== ***
+
+# Sayısal olması gereken sütunlar (program içindeki standart adlarla)
+SAYISAL_HEDEF_SUTUNLAR = ["Öğrenci No", "Y1", "Y2", "Perf1", "Perf2", "DersEtKat", "PROJE"]
+
+# Not hücrelerinde "not yok" anlamına gelen değerler (girmedi, boş vb.)
+BOS_NOT_DEGERLERI = {"", "G", "-"}
+
+# --- Ayrıştırılmış Veri Önbelleği ---
+# Temizlenmiş/dönüştürülmüş DataFrame, proje dizinindeki önbellek klasöründe saklanır.
+# Aynı dosya (yol, değişiklik zamanı, boyut) aynı parametrelerle tekrar açılırsa
+# Excel yeniden ayrıştırılmaz. Ayrıştırma mantığı değişirse ONBELLEK_SURUMU artırılmalı.
+
+ONBELLEK_KLASORU = ".veri_onbellegi"
+ONBELLEK_SURUMU = 3 # 3: kompakt sütun tipleri (veri_semasi)
+
+def _onbellek_anahtari(dosya_yolu: str, satir_atla: int, sheet_name, eksik_veri_degeri) -> Optional[Tuple]:
+    """Dosyanın önbellek anahtarını döndürür (dosya okunamazsa None)."""
+    try:
+        bilgi = os.stat(dosya_yolu)
+    except OSError:
+        return None
+    return (ONBELLEK_SURUMU, os.path.abspath(dosya_yolu), bilgi.st_mtime_ns, bilgi.st_size,
+            satir_atla, sheet_name, eksik_veri_degeri)
+
+def _onbellek_dosyasi(anahtar: Tuple) -> str:
+    """Anahtarın (yol, sayfa, satır atlama) önbellek dosyasının yolunu döndürür."""
+    proje_dizini = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    ozet = hashlib.sha1(repr((anahtar[1], anahtar[4], anahtar[5])).encode("utf-8")).hexdigest()
+    return os.path.join(proje_dizini, ONBELLEK_KLASORU, f"{ozet}.pkl")
+
+def _onbellekten_oku(anahtar: Optional[Tuple]) -> Optional[Tuple[pd.DataFrame, str]]:
+    """Geçerli bir önbellek kaydı varsa (DataFrame, sınıf adı) döndürür."""
+    if anahtar is None:
+        return None
+    yol = _onbellek_dosyasi(anahtar)
+    try:
+        with open(yol, "rb") as f:
+            kayit = pickle.load(f)
+        if kayit.get("anahtar") != anahtar: # Dosya değişmiş veya farklı ayarlar
+            return None
+        return kayit["df"], kayit["sinif_adi"]
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Uyarı: Önbellek okunamadı ({yol}): {e}")
+        return None
+
+def _onbellege_yaz(anahtar: Optional[Tuple], df: pd.DataFrame, sinif_adi: str) -> None:
+    """Ayrıştırılmış veriyi önbelleğe yazar (yarım dosya kalmaması için geçici dosya + rename)."""
+    if anahtar is None:
+        return
+    yol = _onbellek_dosyasi(anahtar)
+    try:
+        os.makedirs(os.path.dirname(yol), exist_ok=True)
+        gecici_yol = f"{yol}.{os.getpid()}.tmp"
+        with open(gecici_yol, "wb") as f:
+            pickle.dump({"anahtar": anahtar, "df": df, "sinif_adi": sinif_adi}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(gecici_yol, yol)
+    except Exception as e:
+        print(f"Uyarı: Önbelleğe yazılamadı ({yol}): {e}")
+
 # --- Veri Yükleme Fonksiyonu (Excel için) ---
 
-def veri_yukle_excel(dosya_yolu: str, satir_atla: int = 15, sheet_name=0) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
+def _sayfa_sec(sayfa_adlari, sheet_name) -> str:
+    """İstenen sayfa indeksini/adını çözer; geçersizse ilk sayfanın adını döndürür."""
+    if isinstance(sheet_name, int): # Eğer sayfa indeksi verildiyse
+        if 0 <= sheet_name < len(sayfa_adlari):
+            return sayfa_adlari[sheet_name]
+        print(f"Uyarı: İstenen sayfa indeksi ({sheet_name}) geçersiz, ilk sayfa kullanılacak.")
+    elif isinstance(sheet_name, str): # Eğer sayfa adı verildiyse
+        if sheet_name in sayfa_adlari:
+            return sheet_name
+        print(f"Uyarı: Belirtilen sayfa adı '{sheet_name}' bulunamadı, ilk sayfa kullanılacak.")
+    return sayfa_adlari[0]
+
+def baslik_satirini_bul(dosya_yolu: str, sheet_name=0, taranacak_satir: int = 40,
+                        en_az_eslesme: int = 2) -> Tuple[Optional[int], List[str]]:
     """
-    Belirtilen Excel (.xlsx) dosyasını okur, başlık satırlarını atlar ve temel sütunları yeniden adlandırır.
-    DataFrame ve sınıf adı (sheet adından veya dosya adından) döndürür.
+    Sayfanın ilk satırlarını read_only modda tarayıp KOLON_ESLESTIRME başlıklarına en çok
+    uyan satırı bulur. Asıl yüklemeden önce ucuz bir ön okuma olarak kullanılır.
 
     Args:
-        dosya_yolu (str): Okunacak Excel dosyasının yolu.
-        satir_atla (int): Dosyanın başından atlanacak satır sayısı (0'dan başlar).
-                         Başlık satırının BİR ÜSTÜNDEKİ satırın index'i.
-                         Eğer başlıklar 16. satırdaysa, satir_atla=15 girilmelidir.
-        sheet_name (int or str): Okunacak sayfanın indeksi (0) veya adı.
+        dosya_yolu (str): Excel dosyasının yolu.
+        sheet_name (int or str): Taranacak sayfanın indeksi veya adı.
+        taranacak_satir (int): Baştan en fazla kaç satıra bakılacağı.
+        en_az_eslesme (int): Bir satırın başlık sayılması için gereken en az eşleşen sütun sayısı.
 
     Returns:
-        Tuple[Optional[pd.DataFrame], Optional[str]]: (DataFrame, Sınıf Adı) veya (None, None)
+        Tuple[Optional[int], List[str]]: (satir_atla değeri, eşleşen Excel başlıkları).
+        Uygun satır bulunamazsa (None, []).
     """
-    print(f"Excel dosyası okunuyor: {dosya_yolu}, Atlanacak satır: {satir_atla}, Sayfa: {sheet_name}")
+    en_iyi_satir, en_iyi_eslesenler = None, []
     try:
-        # *** === KOLON EŞLEŞTİRME (DÜZELTİLDİ!) === ***
-        # Bu sözlükteki anahtarlar (sol taraf) Excel'deki GERÇEK başlıklar olmalı.
-        # Değerler (sağ taraf) program içinde kullanacağımız isimlerdir.
-        kolon_eslestirme = {
-            # Excel Başlığı : Programdaki Adı
-            "Okul No"      : "Öğrenci No",
-            "Adı Soyadı"   : "Ad Soyad",
-            "Y1"           : "Y1",          # Düzeltildi (Önce "1. Yazılı" idi)
-            "Y2"           : "Y2",          # Düzeltildi (Önce "2. Yazılı" idi)
-            "P1"           : "Perf1",       # Düzeltildi (Önce "1. Performans" idi)
-            "P2"           : "Perf2",       # Düzeltildi (Önce "2. Performans" idi)
-            "D.ET.KAT."    : "DersEtKat",   # Düzeltildi (Önce "Ders Et. Kat." idi)
-            "PROJE"        : "PROJE"
-            # Başka sütunlar da almak isterseniz buraya ekleyebilirsiniz.
-            # Örneğin: "Ortalama": "Eokul Ortalama" # e-Okul'un kendi ortalamasını almak için
-        }
-        # *** ======================================== ***
-        print(f"Kullanılacak kolon eşleştirmesi: {kolon_eslestirme}")
-
-        # Excel dosyasını oku
-        # header=0: satir_atla kadar atladıktan SONRAKI ilk satırı başlık olarak kabul et.
-        df = pd.read_excel(
-            dosya_yolu,
-            sheet_name=sheet_name,
+        wb = openpyxl.load_workbook(dosya_yolu, read_only=True, data_only=True)
+        try:
+            ws = wb[_sayfa_sec(wb.sheetnames, sheet_name)]
+            for sira, satir in enumerate(ws.iter_rows(max_row=taranacak_satir, values_only=True)):
+                basliklar = {str(h).strip() for h in satir if h is not None}
+                eslesenler = [col for col in KOLON_ESLESTIRME if col in basliklar]
+                if len(eslesenler) > len(en_iyi_eslesenler):
+                    en_iyi_satir, en_iyi_eslesenler = sira, eslesenler
+                    if len(eslesenler) == len(KOLON_ESLESTIRME):
+                        break # Daha iyisi olamaz
+        finally:
+            wb.close()
+    except Exception as e:
+        print(f"Başlık satırı aranırken hata: {e}")
+        return None, []
+
+    if len(en_iyi_eslesenler) < min(en_az_eslesme, len(KOLON_ESLESTIRME)):
+        print(f"Başlık satırı bulunamadı: {dosya_yolu}")
+        return None, []
+    print(f"Başlık satırı bulundu: {en_iyi_satir + 1}. satır (atlanacak satır: {en_iyi_satir}), "
+          f"eşleşen sütunlar: {en_iyi_eslesenler}")
+    return en_iyi_satir, en_iyi_eslesenler
+
+def _sayiya_cevir(deger: Any) -> float:
+    """Bir not hücresini float'a çevirir: Türkçe ondalık virgül desteklenir, boş/'G'/'-' NaN olur."""
+    if deger is None:
+        return float("nan")
+    if isinstance(deger, (int, float)):
+        return float(deger)
+    if isinstance(deger, str):
+        metin = deger.strip()
+        if metin in BOS_NOT_DEGERLERI:
+            return float("nan")
+        try:
+            return float(metin.replace(',', '.'))
+        except ValueError:
+            return float("nan")
+    return float("nan") # Tarih vb. beklenmeyen hücre türleri
+
+def _akis_ile_oku(dosya_yolu: str, satir_atla: int, sheet_name,
+                  bildir: Callable[[float, str], None],
+                  iptal: Optional[threading.Event]) -> Tuple[pd.DataFrame, str]:
+    """
+    e-Okul sayfasını openpyxl read_only modunda satır satır okur (pandas.read_excel kullanmaz).
+
+    Sadece KOLON_ESLESTIRME'deki sütunlar okunur; sayısal hücreler okunurken tek seferde
+    çevrilir ve sütunlar doğrudan program içindeki adlarla, tipli olarak oluşturulur.
+    Tamamen boş satırlar atlanır.
+    """
+    wb = openpyxl.load_workbook(dosya_yolu, read_only=True, data_only=True)
+    try:
+        sinif_adi = _sayfa_sec(wb.sheetnames, sheet_name)
+        ws = wb[sinif_adi]
+
+        # Başlık satırı: satir_atla kadar satırdan sonraki ilk satır
+        baslik = next(ws.iter_rows(min_row=satir_atla + 1, max_row=satir_atla + 1, values_only=True), None)
+        if baslik is None:
+            raise ValueError(f"Başlık satırı bulunamadı (Atlanacak satır: {satir_atla}).")
+        basliklar = [str(h).strip() if h is not None else "" for h in baslik]
+
+        # Eşleştirmedeki her Excel başlığının konumu (aynı başlık birden fazlaysa ilki)
+        konumlar = {}
+        for konum, ad in enumerate(basliklar):
+            if ad in KOLON_ESLESTIRME and ad not in konumlar:
+                konumlar[ad] = konum
+        hedefler = [(excel_col, program_col, konumlar[excel_col], program_col in SAYISAL_HEDEF_SUTUNLAR)
+                    for excel_col, program_col in KOLON_ESLESTIRME.items() if excel_col in konumlar]
+        if not hedefler:
+            raise ValueError("Excel dosyasında eşleştirme için tanımlanan sütunların ('Okul No', 'Adı Soyadı', 'Y1' vb.) HİÇBİRİ bulunamadı! "
+                             "'KOLON_ESLESTIRME' sözlüğünü veya 'Atlanacak Satır Sayısı'nı kontrol edin.")
+
+        toplam_satir = ws.max_row or 0 # read_only modda bilinmeyebilir
+        son_sutun = max(konum for _, _, konum, _ in hedefler) + 1
+        degerler: Dict[str, list] = {program_col: [] for _, program_col, _, _ in hedefler}
+        for sira, satir in enumerate(ws.iter_rows(min_row=satir_atla + 2, max_col=son_sutun, values_only=True)):
+            if sira % 2000 == 0:
+                _iptal_kontrol(iptal)
+                if toplam_satir:
+                    bildir(min(0.6, 0.6 * sira / toplam_satir), "Dosya okunuyor...")
+            hucreler = [satir[konum] if konum < len(satir) else None for _, _, konum, _ in hedefler]
+            if all(h is None or (isinstance(h, str) and not h.strip()) for h in hucreler):
+                continue # Boş satır
+            for (_, program_col, _, sayisal), hucre in zip(hedefler, hucreler):
+                degerler[program_col].append(_sayiya_cevir(hucre) if sayisal else hucre)
+    finally:
+        wb.close()
+
+    df = pd.DataFrame({
+        program_col: pd.Series(degerler[program_col], dtype="float64" if sayisal else object)
+        for _, program_col, _, sayisal in hedefler
+    })
+    # Tamamen boş sütunlar bulunamamış sayılır (pandas yolundaki dropna ile aynı davranış)
+    bos_sutunlar = [col for col in df.columns if df[col].isna().all()]
+    if bos_sutunlar and len(df):
+        df.drop(columns=bos_sutunlar, inplace=True)
+    eksik_excel_sutunlari = [excel_col for excel_col, program_col in KOLON_ESLESTIRME.items() if program_col not in df.columns]
+    if eksik_excel_sutunlari:
+        print(f"UYARI: Excel dosyasında şu beklenen sütunlar bulunamadı: {', '.join(eksik_excel_sutunlari)}")
+        print("       Bu sütunlar olmadan devam edilecek.")
+    return df, sinif_adi
+
+def _pandas_ile_oku(dosya_yolu: str, satir_atla: int, sheet_name,
+                    bildir: Callable[[float, str], None],
+                    iptal: Optional[threading.Event]) -> Tuple[pd.DataFrame, str]:
+    """e-Okul sayfasını pandas.read_excel ile okur, sütunları eşleştirir ve sayısala çevirir."""
+    # Excel dosyasını tek seferde aç: sayfa adları (sınıf adı) ve veri aynı açılıştan gelir
+    # header=0: satir_atla kadar atladıktan SONRAKI ilk satırı başlık olarak kabul et.
+    with olcum.olc("yukle.oku"), pd.ExcelFile(dosya_yolu, engine='openpyxl') as excel_file:
+        sinif_adi = _sayfa_sec(excel_file.sheet_names, sheet_name)
+        df = excel_file.parse(
+            sheet_name=sinif_adi,
             skiprows=satir_atla,
-            header=0, # Atladıktan sonraki ilk satır başlık
-            engine='openpyxl'
+            header=0 # Atladıktan sonraki ilk satır başlık
         )
-        print(f"Dosya okundu, ilk satırlar (başlıktan sonra):\n{df.head()}")
+    _iptal_kontrol(iptal)
+    bildir(0.6, "Sütunlar eşleştiriliyor...")
 
-        # Sütun adlarındaki baştaki/sondaki boşlukları temizle (çok önemli!)
-        df.columns = df.columns.str.strip()
-        print(f"Temizlenmiş sütun başlıkları: {df.columns.tolist()}")
+    # Sütun adlarındaki baştaki/sondaki boşlukları temizle (çok önemli!)
+    df.columns = df.columns.astype(str).str.strip()
 
-        # Tamamen boş olan sütunları kaldır
-        df.dropna(axis=1, how='all', inplace=True)
+    # Tamamen boş olan sütunları kaldır
+    df.dropna(axis=1, how='all', inplace=True)
 
-        # Gerekli sütunların varlığını kontrol et ve yeniden adlandırmak için hazırla
-        kullanilacak_excel_sutunlari = list(kolon_eslestirme.keys())
-        mevcut_excel_sutunlari = [col for col in kullanilacak_excel_sutunlari if col in df.columns]
-        eksik_excel_sutunlari = [col for col in kullanilacak_excel_sutunlari if col not in df.columns]
+    # Gerekli sütunların varlığını kontrol et ve yeniden adlandırmak için hazırla
+    kullanilacak_excel_sutunlari = list(KOLON_ESLESTIRME.keys())
+    mevcut_excel_sutunlari = [col for col in kullanilacak_excel_sutunlari if col in df.columns]
+    eksik_excel_sutunlari = [col for col in kullanilacak_excel_sutunlari if col not in df.columns]
 
-        if eksik_excel_sutunlari:
-            print(f"UYARI: Excel dosyasında şu beklenen sütunlar bulunamadı: {', '.join(eksik_excel_sutunlari)}")
-            print("       Bu sütunlar olmadan devam edilecek.")
+    if eksik_excel_sutunlari:
+        print(f"UYARI: Excel dosyasında şu beklenen sütunlar bulunamadı: {', '.join(eksik_excel_sutunlari)}")
+        print("       Bu sütunlar olmadan devam edilecek.")
 
-        if not mevcut_excel_sutunlari:
-            # Eşleştirilecek hiçbir sütun bulunamadıysa, bu ciddi bir sorun.
-            raise ValueError("Excel dosyasında eşleştirme için tanımlanan sütunların ('Okul No', 'Adı Soyadı', 'Y1' vb.) HİÇBİRİ bulunamadı! "
-                             "'kolon_eslestirme' sözlüğünü veya 'Atlanacak Satır Sayısı'nı kontrol edin.")
-
-        # Sadece bulunan ve eşleştirmede yer alan sütunları DataFrame'de tut
-        df = df[mevcut_excel_sutunlari].copy()
-
-        # Sütunları yeniden adlandır (program içindeki isimlere)
-        # Sadece mevcut olanları yeniden adlandırmak için eşleştirmeyi filtrele:
-        yeniden_adlandirma_map = {excel_col: program_col
-                                  for excel_col, program_col in kolon_eslestirme.items()
-                                  if excel_col in mevcut_excel_sutunlari}
-        df.rename(columns=yeniden_adlandirma_map, inplace=True)
-        print(f"Sütunlar yeniden adlandırıldı. Yeni sütunlar: {df.columns.tolist()}")
-
-        # Sayısal olması gereken sütunları sayısal türe dönüştür
-        # Program içinde kullanılacak standart adları buraya yazın
-        sayisal_hedef_sutunlar = ["Öğrenci No", "Y1", "Y2", "Perf1", "Perf2", "DersEtKat", "PROJE"]
-        for col in sayisal_hedef_sutunlar:
+    if not mevcut_excel_sutunlari:
+        # Eşleştirilecek hiçbir sütun bulunamadıysa, bu ciddi bir sorun.
+        raise ValueError("Excel dosyasında eşleştirme için tanımlanan sütunların ('Okul No', 'Adı Soyadı', 'Y1' vb.) HİÇBİRİ bulunamadı! "
+                         "'KOLON_ESLESTIRME' sözlüğünü veya 'Atlanacak Satır Sayısı'nı kontrol edin.")
+
+    # Sadece bulunan ve eşleştirmede yer alan sütunları DataFrame'de tut
+    df = df[mevcut_excel_sutunlari].copy()
+
+    # Sütunları yeniden adlandır (program içindeki isimlere)
+    # Sadece mevcut olanları yeniden adlandırmak için eşleştirmeyi filtrele:
+    yeniden_adlandirma_map = {excel_col: program_col
+                              for excel_col, program_col in KOLON_ESLESTIRME.items()
+                              if excel_col in mevcut_excel_sutunlari}
+    df.rename(columns=yeniden_adlandirma_map, inplace=True)
+
+    _iptal_kontrol(iptal)
+    bildir(0.7, "Notlar dönüştürülüyor...")
+
+    # Sayısal olması gereken sütunları sayısal türe dönüştür
+    with olcum.olc("yukle.donustur"):
+        for col in SAYISAL_HEDEF_SUTUNLAR:
             if col in df.columns: # Sütun yeniden adlandırma sonrası var mı kontrol et
-                print(f"'{col}' sütunu sayısal türe dönüştürülüyor...")
                 # Önce str yapıp virgülü noktaya çevir (varsa), sonra numeric yap
                 df[col] = pd.to_numeric(df[col].astype(str).str.replace(',', '.'), errors='coerce')
                 # errors='coerce': Sayıya çevrilemeyen değerleri NaN (Not a Number) yapar.
-                if df[col].isnull().any():
-                    print(f"   Uyarı: '{col}' sütununda sayıya dönüştürülemeyen bazı değerler bulundu ve boş bırakıldı (NaN).")
+    return df, sinif_adi
+
+@olcum.olculen("yukle")
+def veri_yukle_excel(dosya_yolu: str, satir_atla: Optional[int] = 15, sheet_name=0,
+                     ilerleme: Optional[Callable[[float, str], None]] = None,
+                     iptal: Optional[threading.Event] = None,
+                     onbellek_kullan: bool = True,
+                     motor: str = "akis",
+                     eksik_veri_degeri: Any = None) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
+    """
+    Belirtilen Excel (.xlsx) dosyasını okur, başlık satırlarını atlar ve temel sütunları yeniden adlandırır.
+    DataFrame ve sınıf adı (sheet adından veya dosya adından) döndürür.
 
-        # Eksik (NaN) sayısal değerleri 0 ile doldur (veya ayarlardan gelen değerle)
-        try:
-            ayarlar = load_settings()
-            eksik_veri_degeri = ayarlar.get("genel_ayarlar", {}).get("eksik_veri_degeri", 0)
-            # Özellikle sayısal olması gereken sütunlardaki NaN'ları dolduralım
-            doldurulacak_sutunlar = [col for col in sayisal_hedef_sutunlar if col in df.columns]
-            df[doldurulacak_sutunlar] = df[doldurulacak_sutunlar].fillna(eksik_veri_degeri)
-            print(f"Eksik sayısal değerler '{eksik_veri_degeri}' ile dolduruldu.")
-        except Exception as fill_e:
-            print(f"HATA: Eksik veriler doldurulurken hata oluştu: {fill_e}. NaN değerler kalmış olabilir.")
-
-        # Öğrenci No'ya göre sırala (isteğe bağlı)
-        if "Öğrenci No" in df.columns:
-            # Öğrenci No'yu integer yapmayı dene (hatalı veri varsa sorun çıkarabilir)
-            try:
-                 df["Öğrenci No"] = df["Öğrenci No"].astype(int)
-                 df.sort_values(by="Öğrenci No", inplace=True)
-                 print("Veriler Öğrenci No'ya göre sıralandı.")
-            except ValueError:
-                 print("Uyarı: Öğrenci No sütununda tam sayıya dönüştürülemeyen değerler var, sıralama yapılamadı.")
-            except Exception as sort_e:
-                 print(f"Sıralama sırasında hata: {sort_e}")
+    Args:
+        dosya_yolu (str): Okunacak Excel dosyasının yolu.
+        satir_atla (int): Dosyanın başından atlanacak satır sayısı (0'dan başlar).
+                         Başlık satırının BİR ÜSTÜNDEKİ satırın index'i.
+                         Eğer başlıklar 16. satırdaysa, satir_atla=15 girilmelidir.
+                         None verilirse başlık satırı (dosya önbellekte yoksa) baslik_satirini_bul ile bulunur.
+        sheet_name (int or str): Okunacak sayfanın indeksi (0) veya adı.
+        ilerleme (callable, optional): ilerleme(oran, mesaj) ile aşamaları bildirir (0.0-1.0).
+        iptal (threading.Event, optional): Set edilirse yükleme aşama aralarında durdurulur.
+        onbellek_kullan (bool): True ise değişmemiş dosyalar önbellekten okunur ve
+                                yeni ayrıştırılan veri önbelleğe yazılır.
+        motor (str): "akis" (varsayılan): openpyxl read_only ile satır satır okuyan ayrıştırıcı,
+                     "pandas": pandas.read_excel ile tüm sayfayı okuyan eski yol.
+        eksik_veri_degeri (optional): Boş notların yerine yazılacak değer.
+                                      None (varsayılan) ise ayarlar.json'dan okunur.
 
+    Returns:
+        Tuple[Optional[pd.DataFrame], Optional[str]]: (DataFrame, Sınıf Adı) veya (None, None)
 
-        # Sınıf/Sayfa adını belirle
-        sinif_adi = "Bilinmeyen"
-        try:
-            excel_file = pd.ExcelFile(dosya_yolu, engine='openpyxl')
-            if isinstance(sheet_name, int): # Eğer sayfa indeksi verildiyse
-                if sheet_name < len(excel_file.sheet_names):
-                    sinif_adi = excel_file.sheet_names[sheet_name]
-                else: # Geçersiz indeks ise ilk sayfayı kullan
-                    print(f"Uyarı: İstenen sayfa indeksi ({sheet_name}) geçersiz, ilk sayfa adı kullanılacak.")
-                    sinif_adi = excel_file.sheet_names[0]
-            elif isinstance(sheet_name, str): # Eğer sayfa adı verildiyse
-                if sheet_name in excel_file.sheet_names:
-                    sinif_adi = sheet_name
-                else: # Geçersiz ad ise ilk sayfayı kullan
-                     print(f"Uyarı: Belirtilen sayfa adı '{sheet_name}' bulunamadı, ilk sayfa adı kullanılacak.")
-                     sinif_adi = excel_file.sheet_names[0]
-            else: # Ne olduğu belli değilse ilk sayfayı kullan
-                 sinif_adi = excel_file.sheet_names[0]
-            excel_file.close() # Dosyayı kapat
-            print(f"Sınıf/Sayfa adı belirlendi: '{sinif_adi}'")
-        except Exception as e:
-            print(f"Sayfa adından sınıf adı alınırken hata: {e}")
-            # Alternatif: Dosya adından tahmin
+    Raises:
+        IslemIptalEdildi: iptal olayı set edildiyse.
+        BaslikSatiriBulunamadi: satir_atla=None verildiyse ve başlık satırı bulunamadıysa.
+    """
+    bildir = ilerleme if ilerleme else (lambda oran, mesaj: None)
+    try:
+        # Eksik (NaN) sayısal değerlerin yerine yazılacak değer (önbellek anahtarının da parçası)
+        if eksik_veri_degeri is None:
             try:
-                sinif_adi = os.path.basename(dosya_yolu).split('.')[0]
-            except: pass # Tahmin de başarısız olursa "Bilinmeyen" kalır
-
+                eksik_veri_degeri = ayar_degeri("genel_ayarlar", "eksik_veri_degeri", 0)
+            except Exception as ayar_e:
+                print(f"HATA: Eksik veri değeri ayarlardan okunamadı: {ayar_e}. 0 kullanılacak.")
+                eksik_veri_degeri = 0
+
+        # satir_atla=None (otomatik) ayrı bir anahtardır: önbellekteki dosya için başlık tekrar aranmaz
+        onbellek_anahtari = _onbellek_anahtari(dosya_yolu, satir_atla, sheet_name, eksik_veri_degeri) if onbellek_kullan else None
+        with olcum.olc("yukle.onbellek_oku"):
+            onbellekteki = _onbellekten_oku(onbellek_anahtari)
+        if onbellekteki is not None:
+            df, sinif_adi = onbellekteki
+            print(f"Veri önbellekten yüklendi. Sınıf/Sayfa: '{sinif_adi}', Öğrenci Sayısı: {len(df)}")
+            bildir(1.0, "Yükleme tamamlandı (önbellek).")
+            return df, sinif_adi
+
+        if satir_atla is None:
+            bildir(0.0, "Başlık satırı aranıyor...")
+            with olcum.olc("yukle.baslik_bul"):
+                satir_atla, _ = baslik_satirini_bul(dosya_yolu, sheet_name)
+            _iptal_kontrol(iptal)
+            if satir_atla is None:
+                raise BaslikSatiriBulunamadi("Başlık satırı otomatik bulunamadı. 'Atlanacak Satır Sayısı'nı elle girin.")
+
+        bildir(0.0, "Dosya okunuyor...")
+        if motor == "pandas":
+            df, sinif_adi = _pandas_ile_oku(dosya_yolu, satir_atla, sheet_name, bildir, iptal)
+        else:
+            with olcum.olc("yukle.oku"): # Akış motorunda okuma ve sayıya çevirme tek geçişte
+                df, sinif_adi = _akis_ile_oku(dosya_yolu, satir_atla, sheet_name, bildir, iptal)
+        _iptal_kontrol(iptal)
+        bildir(0.8, "Eksik notlar dolduruluyor...")
+
+        with olcum.olc("yukle.temizle"):
+            # Eksik (NaN) sayısal değerleri 0 ile doldur (veya ayarlardan gelen değerle)
+            try:
+                # Özellikle sayısal olması gereken sütunlardaki NaN'ları dolduralım
+                doldurulacak_sutunlar = [col for col in SAYISAL_HEDEF_SUTUNLAR if col in df.columns]
+                df[doldurulacak_sutunlar] = df[doldurulacak_sutunlar].fillna(eksik_veri_degeri)
+            except Exception as fill_e:
+                print(f"HATA: Eksik veriler doldurulurken hata oluştu: {fill_e}. NaN değerler kalmış olabilir.")
+
+            # Öğrenci No'ya göre sırala (isteğe bağlı)
+            if "Öğrenci No" in df.columns:
+                # Öğrenci No'yu integer yapmayı dene (hatalı veri varsa sorun çıkarabilir)
+                try:
+                     df["Öğrenci No"] = df["Öğrenci No"].astype(int)
+                     df.sort_values(by="Öğrenci No", inplace=True)
+                except ValueError:
+                     print("Uyarı: Öğrenci No sütununda tam sayıya dönüştürülemeyen değerler var, sıralama yapılamadı.")
+                except Exception as sort_e:
+                     print(f"Sıralama sırasında hata: {sort_e}")
+
+        with olcum.olc("yukle.sikistir"):
+            # Notlar UInt8, ortalamalar float32, etiketler category (bkz. veri_semasi)
+            bellek_once = veri_semasi.bellek_kullanimi(df)
+            veri_semasi.sema_uygula(df)
+            print(f"Bellek kullanımı: {veri_semasi.bellek_raporu(bellek_once, veri_semasi.bellek_kullanimi(df))}")
+
+        with olcum.olc("yukle.onbellege_yaz"):
+            _onbellege_yaz(onbellek_anahtari, df, sinif_adi)
 
         print(f"Veri yükleme tamamlandı. Sınıf/Sayfa: '{sinif_adi}', Öğrenci Sayısı: {len(df)}")
+        bildir(1.0, "Yükleme tamamlandı.")
         # Başarıyla yüklenen DataFrame ve sınıf adını döndür
         return df, sinif_adi
 
+    except IslemIptalEdildi:
+        print(f"Yükleme iptal edildi: {dosya_yolu}")
+        raise
+    except BaslikSatiriBulunamadi:
+        raise # Çağıran kullanıcıya sorabilsin (genel ValueError gibi None döndürülmez)
     except FileNotFoundError:
         print(f"HATA: Dosya bulunamadı: {dosya_yolu}")
         return None, None # Hata durumunda None döndür
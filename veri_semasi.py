@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+# --- veri_semasi.py ---
+# Not tablosu için bellek dostu sütun tipleri.
+# Notlar 0-100 arası olduğu için UInt8 (gerekirse Int16/Int32 veya float32), ortalamalar
+# float32, sonuç/sınıf etiketleri category olarak tutulur. DataFrame'e yazan kodlar bu
+# tipleri bozmamak için hucreye_yaz/sutuna_yaz/sutun_ekle yardımcılarını kullanmalıdır.
+
+from typing import Any, Iterable, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+ONDALIK_SUTUNLAR = ["Hesaplanan Performans", "Ortalama"]   # float32
+KATEGORI_SUTUNLARI = ["SONUÇ", "Sınıf"]                    # category (Sınıf: toplu_yukleme.SINIF_SUTUNU)
+NUMARA_SUTUNU = "Öğrenci No"                               # int32 (nullable değil)
+
+# Küçükten büyüğe denenen tam sayı tipleri ve aralıkları
+_TAMSAYI_TIPLERI = [("UInt8", 0, 255), ("Int16", -32768, 32767), ("Int32", -2**31, 2**31 - 1)]
+
+
+def _tamsayi_tipi(degerler: pd.Series) -> Optional[str]:
+    """Değerleri kayıpsız tutan en küçük (nullable) tam sayı tipi; tam sayı değillerse None."""
+    sayilar = pd.to_numeric(degerler, errors="coerce").dropna()
+    if sayilar.empty:
+        return "UInt8"
+    dizi = sayilar.to_numpy(dtype="float64")
+    if not np.all(np.mod(dizi, 1) == 0):
+        return None # Ondalıklı notlar (örn. 45,5) float32 olarak tutulur
+    en_kucuk, en_buyuk = dizi.min(), dizi.max()
+    for tip, alt, ust in _TAMSAYI_TIPLERI:
+        if alt <= en_kucuk and en_buyuk <= ust:
+            return tip
+    return "Int64"
+
+
+def _not_tipi(degerler: pd.Series) -> str:
+    return _tamsayi_tipi(degerler) or "float32"
+
+
+def _hedef_tip(sutun: str, degerler: pd.Series) -> Optional[str]:
+    """Sütun için kompakt tip; dokunulmayacak sütunlar (isimler vb.) için None."""
+    if sutun in KATEGORI_SUTUNLARI:
+        return "category"
+    if sutun in ONDALIK_SUTUNLAR:
+        return "float32"
+    if sutun == NUMARA_SUTUNU:
+        if degerler.isna().any():
+            return None
+        return "int32" if _tamsayi_tipi(degerler) in ("UInt8", "Int16", "Int32") else None
+    if pd.api.types.is_numeric_dtype(degerler) and not pd.api.types.is_bool_dtype(degerler):
+        return _not_tipi(degerler) # Yazılı, performans, proje ve kriter notları
+    return None
+
+
+def bellek_kullanimi(df: pd.DataFrame) -> int:
+    """DataFrame'in (metinler dahil) bayt cinsinden bellek kullanımı."""
+    return int(df.memory_usage(deep=True).sum())
+
+
+def sema_uygula(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Sütunları kompakt tiplere çevirir (yerinde) ve aynı DataFrame'i döndürür.
+
+    Returns:
+        pd.DataFrame: Tipleri küçültülmüş DataFrame.
+    """
+    for sutun in df.columns:
+        tip = _hedef_tip(sutun, df[sutun])
+        if tip is not None and str(df[sutun].dtype) != tip:
+            df[sutun] = df[sutun].astype(tip)
+    return df
+
+
+def _boyut_metni(bayt: int) -> str:
+    return f"{bayt / 1048576:.2f} MB" if bayt >= 1048576 else f"{bayt / 1024:.1f} KB"
+
+
+def bellek_raporu(once: int, sonra: int) -> str:
+    """'x MB -> y MB (%z azalma)' biçiminde özet."""
+    oran = (1 - sonra / once) * 100 if once else 0.0
+    return f"{_boyut_metni(once)} -> {_boyut_metni(sonra)} (%{oran:.0f} azalma)"
+
+
+def hesaplama_icin_genislet(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Hesaplama koduna verilecek geniş tipli bir kopya döndürür.
+
+    Küçük tam sayı tiplerinde toplama taşabilir (örn. UInt8'de 200 + 100) ve kategorilere
+    yeni değer yazılamaz; bu yüzden notlar float64'e, kategoriler object'e çevrilir.
+    """
+    genis = df.copy()
+    for sutun in genis.columns:
+        tip = genis[sutun].dtype
+        if isinstance(tip, pd.CategoricalDtype):
+            genis[sutun] = genis[sutun].astype(object)
+        elif sutun != NUMARA_SUTUNU and pd.api.types.is_numeric_dtype(tip) and not pd.api.types.is_bool_dtype(tip):
+            if str(tip) != "float64":
+                genis[sutun] = genis[sutun].astype("float64")
+    return genis
+
+
+def sutun_ekle(df: pd.DataFrame, sutun: str, varsayilan: Any) -> None:
+    """Tüm satırları varsayılan değerle dolu yeni bir sütunu kompakt tipiyle ekler."""
+    seri = pd.Series(varsayilan, index=df.index)
+    tip = _hedef_tip(sutun, seri)
+    df[sutun] = seri.astype(tip) if tip else seri
+
+
+def sutuna_yaz(df: pd.DataFrame, indeksler: Sequence, sutun: str, degerler: Iterable) -> None:
+    """
+    Verilen satırlara değer yazar; gerekirse sütun tipini (sadece) genişletir.
+
+    Kategorik sütunlara olmayan etiketler önce kategori olarak eklenir; tam sayı sütununa
+    sığmayan veya ondalıklı değer yazılırsa sütun uygun tipe büyütülür.
+    """
+    yeni = pd.Series(list(degerler), index=pd.Index(indeksler), dtype=object)
+    if sutun not in df.columns:
+        seri = pd.Series(None, index=df.index, dtype=object)
+        seri.loc[yeni.index] = yeni.to_numpy()
+        if sutun not in KATEGORI_SUTUNLARI and pd.api.types.infer_dtype(seri.dropna()) in (
+                "integer", "floating", "mixed-integer-float", "decimal", "empty"):
+            seri = pd.to_numeric(seri)
+        tip = _hedef_tip(sutun, seri)
+        df[sutun] = seri.astype(tip) if tip else seri
+        return
+    tip = df[sutun].dtype
+
+    if isinstance(tip, pd.CategoricalDtype):
+        eksikler = pd.Index(yeni.dropna().unique()).difference(tip.categories)
+        if len(eksikler):
+            df[sutun] = df[sutun].cat.add_categories(eksikler)
+    elif pd.api.types.is_integer_dtype(tip):
+        # Sadece yazılan değerler kontrol edilir (tek hücre yazımı sütun boyutundan bağımsız)
+        sayilar = pd.to_numeric(yeni, errors="coerce").dropna().to_numpy(dtype="float64")
+        sinir = np.iinfo(getattr(tip, "numpy_dtype", tip))
+        if len(sayilar) and (np.any(np.mod(sayilar, 1) != 0) or sayilar.min() < sinir.min or sayilar.max() > sinir.max):
+            yeni_tip = _tamsayi_tipi(pd.concat([df[sutun].astype("float64"), pd.Series(sayilar)])) or "float32"
+            # Öğrenci No nullable değil; o yüzden int64'e genişletilir
+            df[sutun] = df[sutun].astype("int64" if sutun == NUMARA_SUTUNU else yeni_tip)
+    if pd.api.types.is_numeric_dtype(df[sutun].dtype) and not pd.api.types.is_bool_dtype(df[sutun].dtype):
+        # Tip yukarıda genişletildiği için değerler sütun tipine kayıpsız çevrilebilir
+        yeni = pd.to_numeric(yeni, errors="coerce").astype(df[sutun].dtype)
+    df.loc[yeni.index, sutun] = yeni.to_numpy()
+
+
+def hucreye_yaz(df: pd.DataFrame, index, sutun: str, deger: Any) -> None:
+    """Tek bir hücreye sütun tipini koruyarak yazar (bkz. sutuna_yaz)."""
+    sutuna_yaz(df, [index], sutun, [deger])
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# --- yenileme.py ---
+# Arayüz yenilemelerini Tk olay döngüsünde birleştiren zamanlayıcı.
+# Kod doğrudan treeview_doldur / kriter_alanlarini_guncelle çağırmak yerine neyin eskidiğini
+# işaretler (satırlar, sütunlar, kriter paneli, tüm liste). İşaretler birikir ve bir sonraki
+# boşta (after_idle) döngüde tek seferde uygulanır; art arda gelen kayıtlar, ayar değişiklikleri
+# veya hızlı yazılan arama metni tek bir çizime dönüşür.
+
+import tkinter as tk
+from typing import Callable, FrozenSet, Iterable, NamedTuple, Optional, Set
+
+
+class Yenileme(NamedTuple):
+    """Bir boşta döngüde uygulanacak birleştirilmiş yenileme."""
+    kriterler: bool           # Kriter giriş paneli yeniden kurulmalı (liste sütunları da değişir)
+    tum_liste: bool           # Liste modeli baştan kurulmalı (satır kümesi, sıra veya sütunlar değişti)
+    basa_don: bool            # Liste başa kaydırılmalı (örn. filtre değişti)
+    satirlar: FrozenSet[int]  # Değerleri değişen satırlar (df index)
+    sutunlar: FrozenSet[str]  # Değerleri değişen sütunlar (sıralama/filtre etkileniyor mu kararı için)
+
+
+class YenilemeZamanlayici:
+    """
+    Eskiyen arayüz parçalarını toplar ve boşta döngüde bir kez uygular.
+
+    Args:
+        root (tk.Misc): after_idle'ın çağrılacağı Tk nesnesi.
+        uygula (Callable[[Yenileme], None]): Birikmiş yenilemeyi arayüze uygulayan fonksiyon.
+    """
+
+    def __init__(self, root: tk.Misc, uygula: Callable[[Yenileme], None]) -> None:
+        self.root = root
+        self._uygula = uygula
+        self._bekleyen: Optional[str] = None # after_idle kimliği
+        self._sifirla()
+
+    def _sifirla(self) -> None:
+        self._kriterler = False
+        self._tum_liste = False
+        self._basa_don = False
+        self._satirlar: Set[int] = set()
+        self._sutunlar: Set[str] = set()
+
+    # --- İşaretleme ---
+    def satirlari_isaretle(self, indeksler: Iterable[int], sutunlar: Iterable[str] = ()) -> None:
+        """Satırların (verilen sütunlardaki) değerleri değişti."""
+        self._satirlar.update(indeksler)
+        self._sutunlar.update(sutunlar)
+        self._planla()
+
+    def listeyi_isaretle(self, basa_don: bool = False) -> None:
+        """Liste modeli baştan kurulmalı (yeni sınıf, sıralama, filtre...)."""
+        self._tum_liste = True
+        self._basa_don = self._basa_don or basa_don
+        self._planla()
+
+    def kriterleri_isaretle(self) -> None:
+        """Ders veya kriter tanımları değişti: kriter paneli ve liste sütunları yeniden kurulmalı."""
+        self._kriterler = True
+        self._planla()
+
+    # --- Uygulama ---
+    @property
+    def bekliyor(self) -> bool:
+        return self._bekleyen is not None
+
+    def _planla(self) -> None:
+        if self._bekleyen is None:
+            self._bekleyen = self.root.after_idle(self._bosalt)
+
+    def bosalt(self) -> None:
+        """Bekleyen yenilemeyi beklemeden uygular (arayüz durumunu okuyacak kod için)."""
+        if self._bekleyen is not None:
+            self.root.after_cancel(self._bekleyen)
+            self._bosalt()
+
+    def iptal(self) -> None:
+        """Bekleyen yenilemeyi uygulamadan atar (pencere kapanırken)."""
+        if self._bekleyen is not None:
+            try: self.root.after_cancel(self._bekleyen)
+            except tk.TclError: pass
+        self._bekleyen = None
+        self._sifirla()
+
+    def _bosalt(self) -> None:
+        self._bekleyen = None
+        yenileme = Yenileme(self._kriterler, self._tum_liste, self._basa_don,
+                            frozenset(self._satirlar), frozenset(self._sutunlar))
+        self._sifirla() # Uygulama sırasında gelen yeni işaretler bir sonraki döngüye kalır
+        try:
+            self._uygula(yenileme)
+        except Exception as e:
+            print(f"HATA: Arayüz yenilenemedi: {e}")
+            import traceback
+            traceback.print_exc()